@@ -880,7 +880,7 @@ async def execute_cache_builder(request: Request):
         get_commands_logger().info(
             f"Executing command with target_filter='{target_filter}', force_rebuild={force_rebuild}"
         )
-        success = cmd.execute(force_rebuild=force_rebuild, target_filter=target_filter)
+        success = await cmd.execute(force_rebuild=force_rebuild, target_filter=target_filter)
 
         if success:
             return {
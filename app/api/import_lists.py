@@ -7,7 +7,8 @@ import os
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Response
 
 router = APIRouter()
 
@@ -46,8 +47,8 @@ def _get_file_metrics(file_path: str) -> dict[str, Any]:
     entry_count = 0
     sample_entries = []
     try:
-        with open(file_path, encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = orjson.loads(f.read())
             entry_count = len(data)
             # Get first few entries as samples for debugging
             sample_entries = data[:3] if len(data) > 0 else []
@@ -199,11 +200,13 @@ async def serve_discovery_playlistsync():
             logger.warning(f"Playlist sync discovery file not found: {file_path}")
             return []
 
-        with open(file_path, encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw)
 
+        # Serve the validated file bytes as-is rather than re-encoding the parsed list
         logger.debug(f"Served discovery_playlistsync with {len(data)} entries")
-        return data
+        return Response(content=raw, media_type="application/json")
 
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON in playlist sync discovery file: {e}")
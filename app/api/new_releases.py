@@ -12,9 +12,10 @@ New: DB-backed pending table, dismiss, recheck, run-batch, scan-artist.
 """
 
 import random
+import re
 from datetime import UTC, datetime
 from typing import Annotated
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
@@ -25,6 +26,16 @@ from clients.client_lidarr import LidarrClient
 from clients.client_musicbrainz import MusicBrainzClient
 from clients.client_spotify import SpotifyClient
 from commands.config_adapter import ConfigAdapter
+from commands.new_releases_discovery import (
+    ALBUM_TYPES,
+    HARMONY_BASE_URL,
+    _album_matches_filter,
+    _artist_names_match,
+    _is_live_release,
+    _normalize_mb_titles,
+    _title_matches_mb,
+    _title_matches_normalized,
+)
 from database.config_models import DismissedArtistAlbum, NewReleaseIgnoredArtist, NewReleasePending
 from database.database import get_config_db, get_database_manager
 from utils.logger import get_logger
@@ -36,74 +47,9 @@ from utils.nrd_release_source import (
     nrd_release_client,
 )
 from utils.release_date import RELEASE_WITHIN_CHOICES, release_date_within
-from utils.text_normalizer import normalize_text, prefer_base_releases, strip_edition_suffix
+from utils.text_normalizer import prefer_base_releases
 
 router = APIRouter()
-HARMONY_BASE_URL = "https://harmony.pulsewidth.org.uk/release"
-
-ALBUM_TYPES = frozenset({"album", "ep", "single", "other"})
-
-
-# Substrings that indicate a live recording (checked in normalized album title)
-_LIVE_INDICATORS = frozenset(
-    {
-        "live",
-        "concert",
-        "unplugged",
-        "recorded live",
-        "recorded at",
-        "live at",
-        "live from",
-        "live in",
-        "live session",
-        "live album",
-    }
-)
-
-
-def _is_live_release(title: str) -> bool:
-    """Return True if the album title suggests a live recording."""
-    if not title:
-        return False
-    norm = normalize_text(title)
-    norm_lower = norm.lower()
-    for indicator in _LIVE_INDICATORS:
-        if indicator in norm_lower:
-            return True
-    return False
-
-
-def _album_matches_filter(
-    album_type: str,
-    total_tracks: int,
-    selected_types: set[str],
-) -> bool:
-    """Match by API's album_type only. Deezer: record_type; Spotify: album_type. No track-count heuristic."""
-    if not selected_types:
-        return True
-    t = (album_type or "").lower()
-    if "album" in selected_types and t == "album":
-        return True
-    if "ep" in selected_types and t == "ep":
-        return True
-    if "single" in selected_types and t == "single":
-        return True
-    if "other" in selected_types and t in ("compilation", "appears_on"):
-        return True
-    return False
-
-
-def _artist_names_match(name1: str, name2: str, min_similarity: float = 0.9) -> bool:
-    """Check if two artist names refer to the same artist (avoids Emmure vs emmurée collisions)."""
-    from difflib import SequenceMatcher
-
-    n1 = normalize_text(name1)
-    n2 = normalize_text(name2)
-    if not n1 or not n2:
-        return False
-    if n1 == n2:
-        return True
-    return SequenceMatcher(None, n1, n2).ratio() >= min_similarity
 
 
 def _get_new_releases_source_from_db() -> str:
@@ -125,41 +71,6 @@ def _get_new_releases_source_from_db() -> str:
     return "deezer"
 
 
-def _title_matches_mb(
-    spotify_title: str, mb_titles: list[str], min_similarity: float = 0.7
-) -> bool:
-    """Check if Spotify album title matches any MB release group (fuzzy).
-    Strips edition suffixes (Deluxe, Remaster, Live, etc.) so special editions
-    match the base release and are not treated as new."""
-    from difflib import SequenceMatcher
-
-    norm_spotify = normalize_text(spotify_title)
-    if not norm_spotify:
-        return False
-    base_spotify = normalize_text(strip_edition_suffix(spotify_title))
-    for mb_title in mb_titles:
-        norm_mb = normalize_text(mb_title)
-        if not norm_mb:
-            continue
-        base_mb = normalize_text(strip_edition_suffix(mb_title))
-        # Compare full titles
-        if norm_spotify == norm_mb:
-            return True
-        if norm_spotify in norm_mb or norm_mb in norm_spotify:
-            return True
-        if SequenceMatcher(None, norm_spotify, norm_mb).ratio() >= min_similarity:
-            return True
-        # Compare base titles (stripped of Deluxe, Remaster, Live, etc.)
-        if base_spotify and base_mb:
-            if base_spotify == base_mb:
-                return True
-            if base_spotify in base_mb or base_mb in base_spotify:
-                return True
-            if SequenceMatcher(None, base_spotify, base_mb).ratio() >= min_similarity:
-                return True
-    return False
-
-
 @router.get("/new-releases")
 async def get_new_releases(
     artist_limit: Annotated[
@@ -279,6 +190,7 @@ async def get_new_releases(
                         )
                         continue
 
+                norm_mb_titles, base_mb_titles = _normalize_mb_titles(mb_titles)
                 new_albums = []
                 via_scraper = albums_result.get("via") == "scraper"
                 for album in albums_result["albums"]:
@@ -297,7 +209,9 @@ async def get_new_releases(
                         skipped_live += 1
                         continue
 
-                    if _title_matches_mb(album.get("name", ""), mb_titles):
+                    if _title_matches_normalized(
+                        album.get("name", ""), norm_mb_titles, base_mb_titles
+                    ):
                         skipped_in_mb += 1
                         continue
 
@@ -799,16 +713,12 @@ def _parse_scan_url(url: str) -> tuple[str | None, str | None, str | None]:
     - Artist URL: (provider, artist_id, None)
     - Album URL: (provider, None, album_id) - caller fetches album to get artist
     """
-    import re
-
     url = (url or "").strip()
     if not url or len(url) > 2048:
         return None, None, None
     if not url.startswith("http"):
         url = "https://" + url
     try:
-        from urllib.parse import urlparse
-
         parsed = urlparse(url)
         host = (parsed.netloc or "").replace("www.", "").lower()
         path = (parsed.path or "").strip("/")
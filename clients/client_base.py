@@ -8,6 +8,7 @@ import asyncio
 import logging
 import time
 from abc import ABC
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import aiohttp
@@ -15,30 +16,86 @@ import aiohttp
 from cache_manager import get_cache_manager
 from utils.http_client import HTTPClientUtils, HTTPRequestBuilder
 
+# Shared connection pool settings for client sessions
+SESSION_LIMIT_PER_HOST = 10
+SESSION_DNS_CACHE_SECONDS = 300
+SESSION_KEEPALIVE_SECONDS = 30
+
+# Concurrent page fetches: retries per page and base backoff (doubles per attempt),
+# retrying the same statuses as the sync sessions' urllib3 Retry
+PAGE_FETCH_RETRIES = 3
+PAGE_FETCH_BACKOFF_SECONDS = 1.0
+PAGE_FETCH_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
 
 class AsyncRateLimiter:
-    """Unified async rate limiter for all API clients"""
+    """Unified async rate limiter for all API clients
+
+    Acts as a leaky bucket with capacity 1: callers are released one at a time, at least
+    1/requests_per_second apart. Usable as ``await limiter.acquire()`` or ``async with limiter:``.
+    """
 
     def __init__(self, requests_per_second: float):
         self.requests_per_second = requests_per_second
         self.min_interval = 1.0 / requests_per_second
-        self.last_request_time = 0
+        self.last_request_time = float("-inf")
         self.request_count = 0
         self._lock = asyncio.Lock()
 
     async def acquire(self):
         """Acquire permission to make a request"""
         async with self._lock:
-            current_time = time.time()
+            # Monotonic clock so wall-clock adjustments can't shorten or stall the interval
+            current_time = time.monotonic()
             time_since_last = current_time - self.last_request_time
 
             if time_since_last < self.min_interval:
                 sleep_time = self.min_interval - time_since_last
                 await asyncio.sleep(sleep_time)
 
-            self.last_request_time = time.time()
+            self.last_request_time = time.monotonic()
             self.request_count += 1
 
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
+async def fetch_pages_with_retry(
+    fetch_page: Callable[[int], Awaitable[Any]], starts: range, concurrency: int
+) -> list[Any]:
+    """Fetch every page start with at most `concurrency` requests in flight.
+
+    Each page is retried with backoff on connection errors, timeouts and retryable statuses.
+    If a page still fails, the remaining fetches are cancelled and the error is raised, so a
+    caller never assembles a partial result.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(start: int) -> Any:
+        async with semaphore:
+            for attempt in range(PAGE_FETCH_RETRIES + 1):
+                try:
+                    return await fetch_page(start)
+                except aiohttp.ClientResponseError as e:
+                    if e.status not in PAGE_FETCH_RETRY_STATUSES or attempt == PAGE_FETCH_RETRIES:
+                        raise
+                except aiohttp.ClientConnectionError, TimeoutError:
+                    if attempt == PAGE_FETCH_RETRIES:
+                        raise
+                await asyncio.sleep(PAGE_FETCH_BACKOFF_SECONDS * 2**attempt)
+
+    tasks = [asyncio.ensure_future(fetch(start)) for start in starts]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
 
 class BaseAPIClient(ABC):
     """Base class for all API clients with common functionality"""
@@ -68,10 +125,24 @@ class BaseAPIClient(ABC):
 
     async def __aenter__(self):
         """Async context manager entry"""
-        if not self.session:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+        self._ensure_session()
         return self
 
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the client's pooled session, creating it on first use.
+
+        One session (and its keep-alive connection pool) is reused for every request made
+        inside an ``async with client:`` block, including concurrent ones.
+        """
+        if not self.session or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=SESSION_LIMIT_PER_HOST,
+                ttl_dns_cache=SESSION_DNS_CACHE_SECONDS,
+                keepalive_timeout=SESSION_KEEPALIVE_SECONDS,
+            )
+            self.session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+        return self.session
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         if self.session:
@@ -94,9 +165,7 @@ class BaseAPIClient(ABC):
         # Apply rate limiting
         await self._rate_limiter.acquire()
 
-        # Ensure session exists
-        if not self.session:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+        self._ensure_session()
 
         suppress_log = kwargs.pop("suppress_error_log_statuses", None)
         # Use HTTP utilities for the actual request
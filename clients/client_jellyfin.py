@@ -4,9 +4,11 @@ Jellyfin API Client for playlist management
 Based on Jellyfin REST API documentation
 """
 
+import asyncio
 import time
 from typing import Any
 
+import aiohttp
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -17,7 +19,11 @@ from utils.cache_client import create_cache_client
 from utils.library_selector import resolve_jellyfin_library
 from utils.track_match import collaboration_mismatch_penalty, fuzzy_char_overlap_match
 
-from .client_base import BaseAPIClient
+from .client_base import BaseAPIClient, fetch_pages_with_retry
+
+# Library cache paging: items per request and max concurrent page requests
+LIBRARY_PAGE_SIZE = 1000
+LIBRARY_PAGE_CONCURRENCY = 4
 
 
 class JellyfinClient(BaseAPIClient):
@@ -50,6 +56,9 @@ class JellyfinClient(BaseAPIClient):
         # Initialize centralized cache client
         self.cache_client = create_cache_client("jellyfin", config)
 
+        # (tracks list, id -> track) for the cached library last searched
+        self._tracks_by_id: tuple[list[dict[str, Any]], dict[str, dict[str, Any]]] | None = None
+
         # Load cached library if library cache is enabled
         if config.get("LIBRARY_CACHE_JELLYFIN_ENABLED", False):
             self._load_cached_library()
@@ -1697,6 +1706,26 @@ class JellyfinClient(BaseAPIClient):
             self.logger.error(f"Error getting music libraries: {e}")
             return []
 
+    def get_library_stats(self, library_key: str) -> dict[str, Any] | None:
+        """Track count and newest track of a library, for cheap change detection"""
+        try:
+            params = {
+                **self._library_items_params(library_key),
+                "Limit": 1,
+                "SortBy": "DateCreated",
+                "SortOrder": "Descending",
+                "Fields": "DateCreated",
+            }
+            results = self._get_sync("/Items", params) or {}
+            latest = (results.get("Items") or [{}])[0]
+            return {
+                "item_count": int(results.get("TotalRecordCount") or 0),
+                "updated_at": latest.get("DateCreated"),
+            }
+        except Exception as e:
+            self.logger.warning(f"Error getting stats for library {library_key}: {e}")
+            return None
+
     def build_library_cache(self, library_key: str = None) -> dict[str, Any]:
         """
         Build optimized library cache for Jellyfin music library
@@ -1725,14 +1754,7 @@ class JellyfinClient(BaseAPIClient):
             )
             start_time = time.time()
 
-            params = {
-                "IncludeItemTypes": "Audio",
-                "Recursive": "true",
-                "UserId": self.user_id,
-                "Limit": 1000,  # Start with reasonable batch size
-            }
-            if library_key:
-                params["ParentId"] = library_key
+            params = self._library_items_params(library_key)
             all_tracks = []
             start_index = 0
 
@@ -1748,28 +1770,7 @@ class JellyfinClient(BaseAPIClient):
                     break
 
                 # Process tracks
-                for item in items:
-                    if item.get("Type") == "Audio":
-                        track_data = {
-                            "id": item.get("Id"),
-                            "name": item.get("Name"),
-                            "artist": item.get(
-                                "AlbumArtist",
-                                item.get("Artists", ["Unknown"])[0]
-                                if item.get("Artists") and len(item.get("Artists", [])) > 0
-                                else "Unknown",
-                            ),
-                            "album": item.get("Album", "Unknown"),
-                            "duration": item.get("RunTimeTicks", 0) // 10000000
-                            if item.get("RunTimeTicks")
-                            else 0,
-                            "path": item.get("Path"),
-                            "year": item.get("ProductionYear"),
-                        }
-
-                        # Skip tracks with missing essential data
-                        if track_data["id"] and track_data["name"] and track_data["artist"]:
-                            all_tracks.append(track_data)
+                self._append_minimal_tracks(items, all_tracks)
 
                 # Check if we have more items
                 total_records = response.get("TotalRecordCount", 0)
@@ -1779,34 +1780,148 @@ class JellyfinClient(BaseAPIClient):
                 start_index += len(items)
                 self.logger.debug(f"Processed {start_index}/{total_records} tracks...")
 
-            if not all_tracks:
-                self.logger.warning("No tracks found in Jellyfin library")
-                return {}
-
-            # Build optimized cache structure
-            cache_data = {
-                "library_key": library_key or "default",
-                "total_tracks": len(all_tracks),
-                "tracks": all_tracks,
-                "artist_index": {},
-                "track_index": {},
-                "built_at": time.time(),
-            }
+            return self._assemble_library_cache(library_key, all_tracks, start_time)
 
-            # Create optimized search indexes (direct mappings)
-            self._build_optimized_indexes(cache_data)
+        except Exception as e:
+            self.logger.error(f"Failed to build Jellyfin library cache: {e}")
+            return {}
 
-            build_time = time.time() - start_time
+    async def build_library_cache_async(self, library_key: str = None) -> dict[str, Any]:
+        """
+        Async variant of build_library_cache used by the cache builder command.
+        Reads TotalRecordCount first, then fetches the /Items pages with a bounded number in
+        flight, retrying failed pages. A page that still fails fails the build, so a partial
+        library is never returned.
+        """
+        try:
+            if not library_key:
+                chosen = await asyncio.to_thread(resolve_jellyfin_library, self)
+                if chosen:
+                    library_key = chosen["key"]
+                    self.logger.info(f"Using music library: {chosen['title']}")
+                else:
+                    self.logger.warning("No music libraries found for cache building")
+                    return {}
             self.logger.info(
-                f"Built Jellyfin library cache: {len(all_tracks):,} tracks in {build_time:.1f}s"
+                f"Building optimized library cache for Jellyfin library {library_key or 'default'}..."
+            )
+            start_time = time.time()
+
+            url = f"{self.base_url}/Items"
+            params = self._library_items_params(library_key)
+            # Per-request socket timeouts; a session-wide total would also count time spent queued
+            request_timeout = self.config.get("JELLYFIN_TIMEOUT", 30)
+            timeout = aiohttp.ClientTimeout(
+                total=None, sock_connect=request_timeout, sock_read=request_timeout
             )
+            connector = aiohttp.TCPConnector(
+                limit=LIBRARY_PAGE_CONCURRENCY,
+                ssl=not self.config.get("JELLYFIN_IGNORE_TLS", False),
+            )
+
+            async with aiohttp.ClientSession(
+                headers={"X-Emby-Token": self.token, "Content-Type": "application/json"},
+                timeout=timeout,
+                connector=connector,
+            ) as session:
+
+                async def fetch_page(start_index: int, limit: int) -> dict[str, Any]:
+                    page_params = {**params, "StartIndex": start_index, "Limit": limit}
+                    async with session.get(url, params=page_params) as response:
+                        response.raise_for_status()
+                        return await response.json(content_type=None) or {}
+
+                head = await fetch_page(0, 0)
+                total_records = int(head.get("TotalRecordCount") or 0)
+                starts = range(0, total_records, LIBRARY_PAGE_SIZE)
+                self.logger.debug(
+                    f"Fetching {total_records:,} tracks in {len(starts)} pages "
+                    f"(up to {LIBRARY_PAGE_CONCURRENCY} concurrent)"
+                )
+                pages = await fetch_pages_with_retry(
+                    lambda start: fetch_page(start, LIBRARY_PAGE_SIZE),
+                    starts,
+                    LIBRARY_PAGE_CONCURRENCY,
+                )
+
+            all_tracks = []
+            for page in pages:
+                self._append_minimal_tracks(page.get("Items", []), all_tracks)
 
-            return cache_data
+            return self._assemble_library_cache(library_key, all_tracks, start_time)
 
         except Exception as e:
             self.logger.error(f"Failed to build Jellyfin library cache: {e}")
             return {}
 
+    def _library_items_params(self, library_key: str | None) -> dict[str, Any]:
+        """Query params for paging audio items of the music library"""
+        params = {
+            "IncludeItemTypes": "Audio",
+            "Recursive": "true",
+            "UserId": self.user_id,
+            "Limit": LIBRARY_PAGE_SIZE,
+        }
+        if library_key:
+            params["ParentId"] = library_key
+        return params
+
+    @staticmethod
+    def _append_minimal_tracks(
+        items: list[dict[str, Any]], all_tracks: list[dict[str, Any]]
+    ) -> None:
+        """Extract minimal track data from /Items results"""
+        for item in items:
+            if item.get("Type") == "Audio":
+                track_data = {
+                    "id": item.get("Id"),
+                    "name": item.get("Name"),
+                    "artist": item.get(
+                        "AlbumArtist",
+                        item.get("Artists", ["Unknown"])[0]
+                        if item.get("Artists") and len(item.get("Artists", [])) > 0
+                        else "Unknown",
+                    ),
+                    "album": item.get("Album", "Unknown"),
+                    "duration": item.get("RunTimeTicks", 0) // 10000000
+                    if item.get("RunTimeTicks")
+                    else 0,
+                    "path": item.get("Path"),
+                    "year": item.get("ProductionYear"),
+                }
+
+                # Skip tracks with missing essential data
+                if track_data["id"] and track_data["name"] and track_data["artist"]:
+                    all_tracks.append(track_data)
+
+    def _assemble_library_cache(
+        self, library_key: str | None, all_tracks: list[dict[str, Any]], start_time: float
+    ) -> dict[str, Any]:
+        """Wrap fetched tracks in the cache structure and build search indexes"""
+        if not all_tracks:
+            self.logger.warning("No tracks found in Jellyfin library")
+            return {}
+
+        # Build optimized cache structure
+        cache_data = {
+            "library_key": library_key or "default",
+            "total_tracks": len(all_tracks),
+            "tracks": all_tracks,
+            "artist_index": {},
+            "track_index": {},
+            "built_at": time.time(),
+        }
+
+        # Create optimized search indexes (direct mappings)
+        self._build_optimized_indexes(cache_data)
+
+        build_time = time.time() - start_time
+        self.logger.info(
+            f"Built Jellyfin library cache: {len(all_tracks):,} tracks in {build_time:.1f}s"
+        )
+
+        return cache_data
+
     def _build_optimized_indexes(self, cache_data: dict[str, Any]) -> None:
         """Build optimized search indexes for fast lookups"""
         try:
@@ -1849,6 +1964,17 @@ class JellyfinClient(BaseAPIClient):
         """Process cached library data for use (no transformation needed for Jellyfin)"""
         return cached_data
 
+    def _index_tracks_by_id(self, tracks: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Map track id -> track for a cached library, built once per track list"""
+        memo = self._tracks_by_id
+        if memo is None or memo[0] is not tracks:
+            by_id: dict[str, dict[str, Any]] = {}
+            for track in tracks:
+                by_id.setdefault(track.get("id"), track)
+            memo = (tracks, by_id)
+            self._tracks_by_id = memo
+        return memo[1]
+
     def search_cached_library(
         self, track_name: str, artist_name: str, cached_data: dict[str, Any], album_name: str = ""
     ) -> str | None:
@@ -1859,7 +1985,7 @@ class JellyfinClient(BaseAPIClient):
             Track ID if found, None otherwise
         """
         try:
-            tracks = cached_data.get("tracks", [])
+            tracks_by_id = self._index_tracks_by_id(cached_data.get("tracks", []))
             artist_index = cached_data.get("artist_index", {})
             track_index = cached_data.get("track_index", {})
 
@@ -1881,7 +2007,7 @@ class JellyfinClient(BaseAPIClient):
                         best_rank: tuple[float, int] | None = None
                         for track_id in intersection:
                             # Find the track data
-                            track_data = next((t for t in tracks if t["id"] == track_id), None)
+                            track_data = tracks_by_id.get(track_id)
                             if track_data:
                                 album_score = 0.0
                                 if track_data.get("album"):
@@ -1911,7 +2037,7 @@ class JellyfinClient(BaseAPIClient):
                     best_tid = None
                     best_rank2: tuple[int, int] | None = None
                     for track_id in intersection:
-                        track_data = next((t for t in tracks if t["id"] == track_id), None)
+                        track_data = tracks_by_id.get(track_id)
                         if not track_data:
                             continue
                         pen = collaboration_mismatch_penalty(
@@ -1929,7 +2055,7 @@ class JellyfinClient(BaseAPIClient):
 
             def _consider(track_id: str, base: float) -> None:
                 nonlocal best_match, best_rank_f
-                track_data = next((t for t in tracks if t["id"] == track_id), None)
+                track_data = tracks_by_id.get(track_id)
                 if not track_data:
                     return
                 score = base
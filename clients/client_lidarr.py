@@ -9,7 +9,12 @@ from typing import Any
 
 import aiohttp
 
-from .client_base import BaseAPIClient
+from .client_base import (
+    SESSION_DNS_CACHE_SECONDS,
+    SESSION_KEEPALIVE_SECONDS,
+    SESSION_LIMIT_PER_HOST,
+    BaseAPIClient,
+)
 
 # Regex to extract Spotify artist ID from URLs like https://open.spotify.com/artist/0fLSXz9013NN5b1NoRXLJ9
 _SPOTIFY_ARTIST_URL_RE = re.compile(
@@ -64,31 +69,37 @@ class LidarrClient(BaseAPIClient):
             headers=headers,
         )
 
+    def _new_session(self) -> aiohttp.ClientSession:
+        """Session with Lidarr's timeout and TLS settings"""
+        return aiohttp.ClientSession(
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.config.LIDARR_TIMEOUT),
+            connector=aiohttp.TCPConnector(
+                ssl=not self.config.LIDARR_IGNORE_TLS,
+                limit_per_host=SESSION_LIMIT_PER_HOST,
+                ttl_dns_cache=SESSION_DNS_CACHE_SECONDS,
+                keepalive_timeout=SESSION_KEEPALIVE_SECONDS,
+            ),
+        )
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Pooled session shared by every request made inside an ``async with client:`` block"""
+        if not self.session or self.session.closed:
+            self.session = self._new_session()
+        return self.session
+
     async def _make_request(
         self, endpoint: str, method: str = "GET", **kwargs
     ) -> dict[str, Any] | None:
-        """Make HTTP request to Lidarr API with custom timeout and SSL handling"""
+        """Make HTTP request to Lidarr API with custom timeout and SSL handling.
+        Reuses the pooled session inside ``async with client:``; otherwise opens one per request."""
         url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
 
-        timeout = aiohttp.ClientTimeout(total=self.config.LIDARR_TIMEOUT)
-        connector = aiohttp.TCPConnector(ssl=not self.config.LIDARR_IGNORE_TLS)
-
         try:
-            async with aiohttp.ClientSession(
-                headers=self.headers, timeout=timeout, connector=connector
-            ) as session:
-                self.logger.debug(f"Making {method} request to: {url}")
-
-                async with session.request(method, url, **kwargs) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        self.logger.debug(f"Successful response from {endpoint}")
-                        return data
-                    else:
-                        self.logger.error(
-                            f"Lidarr API error {response.status}: {await response.text()}"
-                        )
-                        response.raise_for_status()
+            if self.session and not self.session.closed:
+                return await self._send_request(self.session, endpoint, url, method, **kwargs)
+            async with self._new_session() as session:
+                return await self._send_request(session, endpoint, url, method, **kwargs)
 
         except TimeoutError:
             self.logger.error(f"Timeout connecting to Lidarr at {url}")
@@ -100,6 +111,20 @@ class LidarrClient(BaseAPIClient):
             self.logger.error(f"Unexpected error connecting to Lidarr: {e}")
             raise
 
+    async def _send_request(
+        self, session: aiohttp.ClientSession, endpoint: str, url: str, method: str, **kwargs
+    ) -> dict[str, Any] | None:
+        self.logger.debug(f"Making {method} request to: {url}")
+
+        async with session.request(method, url, **kwargs) as response:
+            if response.status == 200:
+                data = await response.json()
+                self.logger.debug(f"Successful response from {endpoint}")
+                return data
+            else:
+                self.logger.error(f"Lidarr API error {response.status}: {await response.text()}")
+                response.raise_for_status()
+
         return None
 
     def _get_exclusions_cache_key(self) -> str:
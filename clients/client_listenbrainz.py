@@ -4,10 +4,9 @@ ListenBrainz API Client with SQLite caching
 Refactored to use BaseAPIClient for reduced code duplication
 """
 
+import asyncio
 from typing import Any
 
-import aiohttp
-
 from utils.cmdarr_user_agent import resolve_cmdarr_user_agent
 
 from .client_base import BaseAPIClient
@@ -47,9 +46,7 @@ class ListenBrainzClient(BaseAPIClient):
         self, endpoint: str, params: dict[str, str] = None
     ) -> dict[str, Any] | None:
         """Make rate-limited HTTP request to ListenBrainz API using HTTP utilities"""
-        # Ensure session exists
-        if not self.session:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+        self._ensure_session()
 
         # Use the request builder for cleaner code
         builder = self._create_request_builder()
@@ -153,7 +150,8 @@ class ListenBrainzClient(BaseAPIClient):
                 "daily_jams": None,
             }
 
-            # Search for each curated playlist type
+            # Pick the first matching playlist for each curated type
+            matches: dict[str, dict[str, Any]] = {}
             for playlist_wrapper in rec_playlists:
                 # Extract the actual playlist data from the wrapper
                 playlist = playlist_wrapper.get("playlist", {})
@@ -161,27 +159,21 @@ class ListenBrainzClient(BaseAPIClient):
 
                 # Identify playlist types based on title
                 if any(term in title for term in ["weekly exploration", "weekly discovery"]):
-                    if curated_playlists["weekly_exploration"] is None:
-                        # Get full playlist details with tracks
-                        full_playlist = await self._get_full_playlist_from_identifier(playlist)
-                        curated_playlists["weekly_exploration"] = full_playlist
-                        self.logger.debug(
-                            f"Found Weekly Exploration playlist: {playlist.get('title')}"
-                        )
-
+                    matches.setdefault("weekly_exploration", playlist)
                 elif "weekly jams" in title:
-                    if curated_playlists["weekly_jams"] is None:
-                        # Get full playlist details with tracks
-                        full_playlist = await self._get_full_playlist_from_identifier(playlist)
-                        curated_playlists["weekly_jams"] = full_playlist
-                        self.logger.debug(f"Found Weekly Jams playlist: {playlist.get('title')}")
-
+                    matches.setdefault("weekly_jams", playlist)
                 elif "daily jams" in title:
-                    if curated_playlists["daily_jams"] is None:
-                        # Get full playlist details with tracks
-                        full_playlist = await self._get_full_playlist_from_identifier(playlist)
-                        curated_playlists["daily_jams"] = full_playlist
-                        self.logger.debug(f"Found Daily Jams playlist: {playlist.get('title')}")
+                    matches.setdefault("daily_jams", playlist)
+
+            # Get full playlist details with tracks, all types at once
+            full_playlists = await asyncio.gather(
+                *(self._get_full_playlist_from_identifier(p) for p in matches.values())
+            )
+            for (playlist_key, playlist), full_playlist in zip(
+                matches.items(), full_playlists, strict=True
+            ):
+                curated_playlists[playlist_key] = full_playlist
+                self.logger.debug(f"Found {playlist_key} playlist: {playlist.get('title')}")
 
             # Count found playlists
             found_count = sum(1 for playlist in curated_playlists.values() if playlist is not None)
@@ -7,8 +7,6 @@ Refactored to use BaseAPIClient for reduced code duplication
 from difflib import SequenceMatcher
 from typing import Any
 
-import aiohttp
-
 from utils.cmdarr_user_agent import DEFAULT_CMDARR_USER_AGENT, resolve_cmdarr_user_agent
 
 from .client_base import BaseAPIClient
@@ -42,9 +40,7 @@ class MusicBrainzClient(BaseAPIClient):
         # Apply rate limiting (MusicBrainz: 1 req/sec per IP)
         await self._rate_limiter.acquire()
 
-        # Ensure session exists
-        if not self.session:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+        self._ensure_session()
 
         # Use HTTP utilities with retry configuration
         from utils.http_client import HTTPClientUtils
@@ -60,14 +56,23 @@ class MusicBrainzClient(BaseAPIClient):
             retry_delay=getattr(self.config, "MUSICBRAINZ_RETRY_DELAY", 2.0),
         )
 
-    def _calculate_similarity(self, name1: str, name2: str) -> float:
-        """Calculate similarity score between two artist names"""
+    def _similarity_matcher(self, name1: str, name2: str) -> SequenceMatcher:
+        """Sequence matcher over the normalized names"""
         # Normalize names for comparison
-        norm1 = name1.lower().strip()
-        norm2 = name2.lower().strip()
+        return SequenceMatcher(None, name1.lower().strip(), name2.lower().strip())
 
-        # Use sequence matcher for similarity
-        return SequenceMatcher(None, norm1, norm2).ratio()
+    def _calculate_similarity(self, name1: str, name2: str) -> float:
+        """Calculate similarity score between two artist names"""
+        return self._similarity_matcher(name1, name2).ratio()
+
+    def _is_similar(self, name1: str, name2: str, threshold: float) -> bool:
+        """Check similarity against a threshold, using the cheap upper bounds first"""
+        matcher = self._similarity_matcher(name1, name2)
+        return (
+            matcher.real_quick_ratio() >= threshold
+            and matcher.quick_ratio() >= threshold
+            and matcher.ratio() >= threshold
+        )
 
     def _clean_artist_name(self, name: str) -> str:
         """Clean artist name for better searching"""
@@ -118,7 +123,7 @@ class MusicBrainzClient(BaseAPIClient):
                         cache_key,
                         "musicbrainz",
                         "No artists found",
-                        self.config.CACHE_MUSICBRAINZ_TTL_DAYS,
+                        self.config.CACHE_FAILED_LOOKUP_TTL_DAYS,
                     )
                 return None
 
@@ -130,7 +135,7 @@ class MusicBrainzClient(BaseAPIClient):
                         cache_key,
                         "musicbrainz",
                         "Empty artists list",
-                        self.config.CACHE_MUSICBRAINZ_TTL_DAYS,
+                        self.config.CACHE_FAILED_LOOKUP_TTL_DAYS,
                     )
                 return None
 
@@ -195,7 +200,7 @@ class MusicBrainzClient(BaseAPIClient):
                         cache_key,
                         "musicbrainz",
                         f"No match above threshold (best: {best_score:.3f})",
-                        self.config.CACHE_MUSICBRAINZ_TTL_DAYS,
+                        self.config.CACHE_FAILED_LOOKUP_TTL_DAYS,
                     )
                 return None
 
@@ -208,7 +213,7 @@ class MusicBrainzClient(BaseAPIClient):
                     cache_key,
                     "musicbrainz",
                     f"Exception: {str(e)}",
-                    self.config.CACHE_MUSICBRAINZ_TTL_DAYS,
+                    self.config.CACHE_FAILED_LOOKUP_TTL_DAYS,
                 )
             return None
 
@@ -450,7 +455,7 @@ class MusicBrainzClient(BaseAPIClient):
 
             for r in releases:
                 mb_title = r.get("title", "")
-                if self._calculate_similarity(release_title, mb_title) >= 0.7:
+                if self._is_similar(release_title, mb_title, 0.7):
                     if not skip_cache and self.cache_enabled and self.cache:
                         self.cache.set(cache_key, "musicbrainz", True, ttl)
                     return True
@@ -6,10 +6,14 @@ Enhanced with dramatic performance improvements via library caching
 OPTIMIZED: Reduced memory usage by storing only essential track data
 """
 
+import asyncio
 import time
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from itertools import islice
 from typing import Any
 
+import aiohttp
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -24,7 +28,19 @@ from utils.track_match import (
     normalized_artist_for_source_vs_library,
 )
 
-from .client_base import BaseAPIClient
+from .client_base import BaseAPIClient, fetch_pages_with_retry
+
+# Library cache paging: tracks per request and max concurrent page requests
+LIBRARY_PAGE_SIZE = 250
+LIBRARY_PAGE_CONCURRENCY = 4
+# Page size when streaming the recentlyAdded endpoint
+RECENTLY_ADDED_PAGE_SIZE = 250
+
+
+def _rating_key_order(key: str) -> tuple[int, int | str]:
+    """Sort key for rating keys: numeric keys in numeric order ("9" before "10"), others after"""
+    key = str(key)
+    return (0, int(key)) if key.isdigit() else (1, key)
 
 
 class PlexClient(BaseAPIClient):
@@ -125,7 +141,7 @@ class PlexClient(BaseAPIClient):
         {
             "library_key": "2",
             "total_tracks": 45000,
-            "tracks": [...],  # Minimal track data only
+            "tracks_by_key": {...},  # ratingKey -> minimal track data
             "artist_index": {...},  # Direct artist -> rating_keys mapping
             "track_index": {...}   # Direct track title -> rating_keys mapping
         }
@@ -146,42 +162,97 @@ class PlexClient(BaseAPIClient):
             # Fetch all tracks from library with minimal data
             all_tracks = self._fetch_minimal_library_tracks(library_key)
 
-            if not all_tracks:
-                self.logger.warning(f"No tracks found in library {library_key}")
-                return {}
+            return self._assemble_library_cache(library_key, all_tracks, start_time)
 
-            # Build optimized cache structure
-            cache_data = {
-                "library_key": library_key,
-                "total_tracks": len(all_tracks),
-                "tracks": all_tracks,
-                "artist_index": {},
-                "track_index": {},
-                "built_at": time.time(),
-            }
+        except Exception as e:
+            self.logger.error(f"Failed to build library cache: {e}")
+            return {}
 
-            # Create optimized search indexes (direct mappings)
-            self._build_optimized_indexes(cache_data)
+    async def build_library_cache_async(self, library_key: str = None) -> dict[str, Any]:
+        """
+        Async variant of build_library_cache used by the cache builder command.
+        Library pages are fetched concurrently over aiohttp instead of one at a time.
+        """
+        try:
+            if not library_key:
+                chosen = await asyncio.to_thread(resolve_plex_library, self)
+                if not chosen:
+                    self.logger.error("No music libraries found for cache building")
+                    return {}
+                library_key = chosen["key"]
+                self.logger.info(f"Using music library: {chosen['title']}")
 
-            build_time = time.time() - start_time
+            self.logger.info(f"Building optimized library cache for library {library_key}...")
+            start_time = time.time()
 
-            # Estimate memory usage
-            estimated_mb = self._estimate_cache_memory(cache_data)
-            self.logger.info(
-                f"Built optimized library cache: {len(all_tracks):,} tracks in {build_time:.1f}s (~{estimated_mb}MB)"
-            )
+            all_tracks = await self._fetch_minimal_library_tracks_async(library_key)
 
-            return cache_data
+            return self._assemble_library_cache(library_key, all_tracks, start_time)
 
         except Exception as e:
             self.logger.error(f"Failed to build library cache: {e}")
             return {}
 
+    def _assemble_library_cache(
+        self, library_key: str, all_tracks: list[dict[str, Any]], start_time: float
+    ) -> dict[str, Any]:
+        """Wrap fetched tracks in the cache structure and build search indexes"""
+        if not all_tracks:
+            self.logger.warning(f"No tracks found in library {library_key}")
+            return {}
+
+        # Build optimized cache structure (tracks keyed by ratingKey for O(1) lookup/update)
+        tracks_by_key = {track["key"]: track for track in all_tracks}
+        cache_data = {
+            "library_key": library_key,
+            "total_tracks": len(tracks_by_key),
+            "tracks_by_key": tracks_by_key,
+            "artist_index": {},
+            "track_index": {},
+            "built_at": time.time(),
+        }
+
+        # Create optimized search indexes (direct mappings)
+        self._build_optimized_indexes(cache_data)
+
+        build_time = time.time() - start_time
+
+        # Estimate memory usage
+        estimated_mb = self._estimate_cache_memory(cache_data)
+        self.logger.info(
+            f"Built optimized library cache: {len(all_tracks):,} tracks in {build_time:.1f}s (~{estimated_mb}MB)"
+        )
+
+        return cache_data
+
+    @staticmethod
+    def _append_minimal_tracks(
+        tracks: list[dict[str, Any]], all_tracks: list[dict[str, Any]]
+    ) -> None:
+        """Extract ONLY essential track data for minimal memory usage"""
+        for track in tracks:
+            # Store only what's absolutely needed for matching
+            track_data = {
+                "key": track.get("ratingKey"),  # Shorter field name
+                "title": (track.get("title", "") or "").lower().strip(),
+                "artist": (track.get("grandparentTitle", "") or "").lower().strip(),
+                "album": (track.get("parentTitle", "") or "")
+                .lower()
+                .strip()[:50],  # Truncate long album names
+                "duration": track.get("duration", 0),
+            }
+
+            # Skip tracks with missing essential data
+            if track_data["key"] and track_data["title"] and track_data["artist"]:
+                all_tracks.append(track_data)
+
     def _fetch_minimal_library_tracks(self, library_key: str) -> list[dict[str, Any]]:
         """Fetch all tracks from a library with minimal data. Smaller batches for large libraries."""
         all_tracks = []
         container_start = 0
-        container_size = 250  # Smaller batches to reduce per-request load on 500k+ libraries
+        container_size = (
+            LIBRARY_PAGE_SIZE  # Smaller batches to reduce per-request load on 500k+ libraries
+        )
 
         # Avoid includeFields - Plex QueryParser rejects deprecated fields (sectionID, contentDirectoryID,
         # pinnedContentDirectoryID) that can be triggered by field filtering in newer Plex versions.
@@ -204,22 +275,7 @@ class PlexClient(BaseAPIClient):
                 if container_start > 0:
                     time.sleep(0.1)
 
-                # Extract ONLY essential track data for minimal memory usage
-                for track in tracks:
-                    # Store only what's absolutely needed for matching
-                    track_data = {
-                        "key": track.get("ratingKey"),  # Shorter field name
-                        "title": (track.get("title", "") or "").lower().strip(),
-                        "artist": (track.get("grandparentTitle", "") or "").lower().strip(),
-                        "album": (track.get("parentTitle", "") or "")
-                        .lower()
-                        .strip()[:50],  # Truncate long album names
-                        "duration": track.get("duration", 0),
-                    }
-
-                    # Skip tracks with missing essential data
-                    if track_data["key"] and track_data["title"] and track_data["artist"]:
-                        all_tracks.append(track_data)
+                self._append_minimal_tracks(tracks, all_tracks)
 
                 # Progress logging every 25k tracks
                 if len(all_tracks) % 25000 == 0 and len(all_tracks) > 0:
@@ -238,13 +294,70 @@ class PlexClient(BaseAPIClient):
         self.logger.info(f"Fetched {len(all_tracks):,} valid tracks from library")
         return all_tracks
 
+    async def _fetch_minimal_library_tracks_async(self, library_key: str) -> list[dict[str, Any]]:
+        """
+        Fetch all library tracks with concurrent page requests.
+        Asks Plex for the library size first (container size 0), then fetches the pages with a
+        bounded number in flight, retrying failed pages. Raises if a page still fails rather
+        than returning a partial library. Falls back to the sequential fetch if the size is unknown.
+        """
+        url = f"{self.base_url}/library/sections/{library_key}/all"
+        container_size = LIBRARY_PAGE_SIZE
+        # Per-request socket timeouts; a session-wide total would also count time spent queued
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=self.config.PLEX_TIMEOUT,
+            sock_read=self.config.PLEX_TIMEOUT,
+        )
+        connector = aiohttp.TCPConnector(
+            limit=LIBRARY_PAGE_CONCURRENCY, ssl=not self.config.PLEX_IGNORE_TLS
+        )
+
+        async with aiohttp.ClientSession(
+            headers={"Accept": "application/json"}, timeout=timeout, connector=connector
+        ) as session:
+
+            async def fetch_page(start: int, size: int) -> dict[str, Any]:
+                params = {
+                    "type": 10,  # Track type
+                    "X-Plex-Container-Start": start,
+                    "X-Plex-Container-Size": size,
+                    "X-Plex-Token": self.token,
+                }
+                async with session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+                return (data or {}).get("MediaContainer", {})
+
+            head = await fetch_page(0, 0)
+            total_size = int(head.get("totalSize") or 0)
+            if total_size <= 0:
+                self.logger.debug("Plex did not report library size, using sequential fetch")
+                return await asyncio.to_thread(self._fetch_minimal_library_tracks, library_key)
+
+            starts = range(0, total_size, container_size)
+            self.logger.debug(
+                f"Fetching {total_size:,} tracks in {len(starts)} pages "
+                f"(up to {LIBRARY_PAGE_CONCURRENCY} concurrent)"
+            )
+            pages = await fetch_pages_with_retry(
+                lambda start: fetch_page(start, container_size), starts, LIBRARY_PAGE_CONCURRENCY
+            )
+
+        all_tracks = []
+        for page in pages:
+            self._append_minimal_tracks(page.get("Metadata", []), all_tracks)
+
+        self.logger.info(f"Fetched {len(all_tracks):,} valid tracks from library")
+        return all_tracks
+
     def _build_optimized_indexes(self, cache_data: dict[str, Any]) -> None:
         """Build optimized search indexes for ultra-fast lookups"""
-        tracks = cache_data["tracks"]
+        tracks_by_key = cache_data["tracks_by_key"]
         artist_index = {}
         track_index = {}
 
-        for track in tracks:
+        for track in tracks_by_key.values():
             rating_key = track["key"]
             artist = track["artist"]
             title = track["title"]
@@ -278,7 +391,7 @@ class PlexClient(BaseAPIClient):
         """Estimate memory usage of optimized cache in MB"""
         try:
             # More accurate estimation for optimized structure
-            track_count = len(cache_data.get("tracks", []))
+            track_count = len(cache_data.get("tracks_by_key", {}))
 
             # Optimized track: ~60 bytes average (key=8, title=20, artist=15, album=15, duration=2)
             tracks_mb = (track_count * 60) / (1024 * 1024)
@@ -294,7 +407,7 @@ class PlexClient(BaseAPIClient):
 
         except Exception:
             # Fallback estimation
-            track_count = len(cache_data.get("tracks", []))
+            track_count = len(cache_data.get("tracks_by_key", {}))
             estimated_mb = (track_count * 80) / (1024 * 1024)  # Conservative estimate
             return round(estimated_mb, 1)
 
@@ -311,11 +424,11 @@ class PlexClient(BaseAPIClient):
         Returns:
             Track ratingKey if found, None otherwise
         """
-        if not cached_data or "tracks" not in cached_data:
+        if not cached_data or "tracks_by_key" not in cached_data:
             self.logger.debug("🔍 CACHED SEARCH: No cached data available")
             return None
 
-        tracks = cached_data["tracks"]
+        tracks_by_key = cached_data["tracks_by_key"]
         artist_index = cached_data.get("artist_index", {})
         track_index = cached_data.get("track_index", {})
 
@@ -378,7 +491,7 @@ class PlexClient(BaseAPIClient):
                 intersection_before = len(candidate_keys)
                 candidate_keys = candidate_keys.intersection(track_candidates)
                 self.logger.debug(
-                    f"🔍 CACHED SEARCH: Intersection: {intersection_before} artist × {len(track_candidates)} track = {len(candidate_keys)} final candidates: {sorted(candidate_keys)}"
+                    f"🔍 CACHED SEARCH: Intersection: {intersection_before} artist × {len(track_candidates)} track = {len(candidate_keys)} final candidates: {sorted(candidate_keys, key=_rating_key_order)}"
                 )
             else:
                 candidate_keys = track_candidates
@@ -395,8 +508,10 @@ class PlexClient(BaseAPIClient):
             best_rank: tuple[int, int] | None = None
             scored_tracks = []
 
-            for track in tracks:
-                if track["key"] in candidate_keys:
+            # Fixed numeric order so ties on rank resolve the same way on every run
+            for candidate_key in sorted(candidate_keys, key=_rating_key_order):
+                track = tracks_by_key.get(candidate_key)
+                if track:
                     total_score, artist_score, track_score = self._score_track_match_optimized(
                         track,
                         track_lower,
@@ -451,8 +566,7 @@ class PlexClient(BaseAPIClient):
             best_rank3: tuple[int, int] | None = None
 
             # Sample-based fuzzy search to avoid full scan
-            sample_size = min(5000, len(tracks))  # Limit fuzzy search scope
-            track_sample = tracks[:sample_size] if len(tracks) > sample_size else tracks
+            track_sample = islice(tracks_by_key.values(), 5000)  # Limit fuzzy search scope
 
             for track in track_sample:
                 total_score, artist_score, track_score = self._score_track_match_optimized(
@@ -1225,6 +1339,26 @@ class PlexClient(BaseAPIClient):
             self.logger.error(f"Error getting music libraries: {e}")
             return []
 
+    def get_library_stats(self, library_key: str) -> dict[str, Any] | None:
+        """Track count and most recent track update of a library, for cheap change detection"""
+        try:
+            params = {
+                "type": 10,  # Track type
+                "sort": "updatedAt:desc",
+                "X-Plex-Container-Start": 0,
+                "X-Plex-Container-Size": 1,
+            }
+            results = self._get(f"/library/sections/{library_key}/all", params=params)
+            media_container = results.get("MediaContainer", {})
+            latest = (media_container.get("Metadata") or [{}])[0]
+            return {
+                "item_count": int(media_container.get("totalSize") or 0),
+                "updated_at": latest.get("updatedAt"),
+            }
+        except Exception as e:
+            self.logger.warning(f"Error getting stats for library {library_key}: {e}")
+            return None
+
     def get_accounts(self) -> list[dict[str, Any]]:
         """Get Plex Home users (and token owner if not in home users).
         Uses Plex.tv API /home/users. Returns list of {id, name, admin} for dropdown.
@@ -1592,20 +1726,28 @@ class PlexClient(BaseAPIClient):
         return []
 
     def get_recently_added_tracks(self, library_key, days=1):
+        """Get recently added tracks as a single list (see iter_recently_added_tracks)"""
+        return [t for page in self.iter_recently_added_tracks(library_key, days=days) for t in page]
+
+    def iter_recently_added_tracks(
+        self, library_key, days=1, page_size=RECENTLY_ADDED_PAGE_SIZE
+    ) -> Iterator[list[dict[str, Any]]]:
         """
-        Get recently added tracks using Plex's dedicated recentlyAdded endpoint.
+        Yield recently added tracks one page at a time using Plex's dedicated recentlyAdded endpoint.
         The addedAt>= filter is rejected by Plex QueryParser for music ("Invalid field
         'addedAt>=' found"); sort=addedAt:desc on /all can also return the full library
         when Plex ignores the sort. The recentlyAdded endpoint returns items most-recent
         first without any filter params—we paginate and stop when we pass the cutoff.
+        Callers can stop iterating early; no further pages are requested.
+        A failed page request is logged and raised, so callers can tell an outage from
+        "nothing new" (including after earlier pages were yielded).
         """
         from datetime import datetime, timedelta
 
         cutoff_date = datetime.now() - timedelta(days=days)
         cutoff_ts = int(cutoff_date.timestamp())
-        all_tracks = []
+        found = 0
         container_start = 0
-        container_size = 500
 
         try:
             self.logger.debug(
@@ -1614,7 +1756,7 @@ class PlexClient(BaseAPIClient):
             while True:
                 params = {
                     "X-Plex-Container-Start": container_start,
-                    "X-Plex-Container-Size": container_size,
+                    "X-Plex-Container-Size": page_size,
                 }
                 # Use dedicated recentlyAdded endpoint—no filter params, avoids QueryParser rejection
                 results = self._get(f"/library/sections/{library_key}/recentlyAdded", params=params)
@@ -1630,6 +1772,8 @@ class PlexClient(BaseAPIClient):
                 if not items:
                     break
 
+                page_tracks = []
+                reached_cutoff = False
                 for t in items:
                     item_type = str(t.get("type", "")).lower()
                     # Accept tracks (type 10 or "track"); expand albums to tracks
@@ -1649,8 +1793,9 @@ class PlexClient(BaseAPIClient):
                                     except TypeError, ValueError:
                                         a = 0
                                     if a >= cutoff_ts:
-                                        all_tracks.append(tr)
-                            except Exception as e:
+                                        page_tracks.append(tr)
+                            except (AttributeError, TypeError, ValueError) as e:
+                                # Malformed album payload only; request failures propagate
                                 self.logger.debug(f"Could not expand album {album_key}: {e}")
                         # Check album's addedAt for cutoff—if album is old, we can stop
                         added = t.get("addedAt") or 0
@@ -1659,8 +1804,8 @@ class PlexClient(BaseAPIClient):
                         except TypeError, ValueError:
                             added = 0
                         if added < cutoff_ts:
-                            self.logger.debug(f"Reached cutoff at {len(all_tracks)} tracks (album)")
-                            return all_tracks
+                            reached_cutoff = True
+                            break
                         continue
                     else:
                         continue
@@ -1670,25 +1815,32 @@ class PlexClient(BaseAPIClient):
                     except TypeError, ValueError:
                         added = 0
                     if added >= cutoff_ts:
-                        all_tracks.append(t)
+                        page_tracks.append(t)
                     else:
                         # Past cutoff—recentlyAdded returns most-recent first
-                        self.logger.debug(f"Reached cutoff at {len(all_tracks)} tracks")
-                        return all_tracks
+                        reached_cutoff = True
+                        break
+
+                found += len(page_tracks)
+                if page_tracks:
+                    yield page_tracks
 
-                if len(items) < container_size:
+                if reached_cutoff:
+                    self.logger.debug(f"Reached cutoff at {found} tracks")
+                    return
+
+                if len(items) < page_size:
                     break
 
-                container_start += container_size
+                container_start += page_size
                 time.sleep(0.1)  # Throttle to avoid overwhelming Plex
 
-            self.logger.info(f"Found {len(all_tracks)} tracks added in last {days} days")
-            return all_tracks
+            self.logger.info(f"Found {found} tracks added in last {days} days")
         except Exception as e:
             self.logger.error(
                 f"Error getting recently added tracks from library {library_key}: {e}"
             )
-            return []
+            raise
 
     def _score_track_match(
         self, track, target_track_name, target_artist_name, mbids=None, target_album_name=None
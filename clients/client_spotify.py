@@ -14,14 +14,16 @@ import json
 import time
 from typing import Any
 
-import aiohttp
-
 from services.config_service import config_service
 from utils.playlist_parser import parse_playlist_url
 from utils.text_normalizer import normalize_text
 
 from .client_base import BaseAPIClient
 
+# Client-credentials tokens shared by every SpotifyClient in the process, keyed by credential
+# hash: (access_token, expires_at). Sessions are per event loop, but tokens outlive them.
+_ACCESS_TOKENS: dict[str, tuple[str, float]] = {}
+
 
 def _scraper_uses_legacy_init() -> bool:
     """spotifyscraper 2.x accepts browser_type; 3.x removed it."""
@@ -482,8 +484,7 @@ class SpotifyClient(BaseAPIClient):
             return False
         url = "https://api.spotify.com/v1/tracks/4iV5W9uYEdYUVa79Axb7Rh"
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession(headers=self.headers)
+            self._ensure_session()
             self.headers["Authorization"] = f"Bearer {self.access_token}"
             async with self.session.get(url) as resp:
                 if resp.status == 200:
@@ -629,9 +630,7 @@ class SpotifyClient(BaseAPIClient):
             }
             data = {"grant_type": "client_credentials"}
 
-            # Ensure session exists
-            if not self.session:
-                self.session = aiohttp.ClientSession(headers=self.headers)
+            self._ensure_session()
 
             # Make request
             async with self.session.post(url, headers=headers, data=data) as response:
@@ -640,6 +639,10 @@ class SpotifyClient(BaseAPIClient):
                     self.access_token = token_data["access_token"]
                     expires_in = token_data["expires_in"]
                     self.token_expires_at = time.time() + expires_in - 60  # Refresh 1 minute early
+                    _ACCESS_TOKENS[self._get_cred_hash()] = (
+                        self.access_token,
+                        self.token_expires_at,
+                    )
 
                     self.logger.info("Successfully obtained Spotify access token")
                     return True
@@ -657,6 +660,10 @@ class SpotifyClient(BaseAPIClient):
     async def _ensure_valid_token(self) -> bool:
         """Ensure we have a valid access token"""
         if not self.access_token or time.time() >= self.token_expires_at:
+            shared = _ACCESS_TOKENS.get(self._get_cred_hash())
+            if shared and time.time() < shared[1]:
+                self.access_token, self.token_expires_at = shared
+                return True
             return await self._get_access_token()
         return True
 
@@ -11,8 +11,6 @@ from __future__ import annotations
 
 from typing import Any
 
-import aiohttp
-
 from utils.cmdarr_user_agent import resolve_cmdarr_user_agent
 
 from .client_base import BaseAPIClient
@@ -207,8 +205,7 @@ class XmplaylistClient(BaseAPIClient):
                     "Install dependencies (pip install -r requirements.txt) including curl-cffi."
                 )
 
-        if not self.session:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+        self._ensure_session()
 
         aio_url = (
             endpoint
@@ -112,6 +112,14 @@ class ConfigAdapter:
             "LISTENBRAINZ_PLEX_PLAYLIST_SCHEDULE", 12
         )
 
+        # Playlist Sync Discovery Maintenance
+        self.PLAYLIST_SYNC_DISCOVERY_AGE_THRESHOLD_DAYS = config_service.get(
+            "PLAYLIST_SYNC_DISCOVERY_AGE_THRESHOLD_DAYS", 30
+        )
+        self.PLAYLIST_SYNC_DISCOVERY_CONTEXT_TTL_SECONDS = config_service.get(
+            "PLAYLIST_SYNC_DISCOVERY_CONTEXT_TTL_SECONDS", 300
+        )
+
         # Web Server Configuration
         self.WEB_PORT = config_service.get("WEB_PORT", 8080)
         self.WEB_HOST = config_service.get("WEB_HOST", "0.0.0.0")
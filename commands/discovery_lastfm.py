@@ -222,15 +222,14 @@ class DiscoveryLastfmCommand(BaseCommand):
         stats.musicbrainz_recovered = len(musicbrainz_recovered)
 
         # Filter candidates against Lidarr state and exclusions
+        candidate_filter = self.utils.build_filter(existing_mbids, existing_names, excluded_mbids)
         final_artists = []
         for similar in deduplicated_raw:
             mbid = similar["mbid"]
             name = similar["name"]
 
             # Apply filtering logic
-            should_include, reason = self.utils.filter_artist_candidate(
-                mbid, name, existing_mbids, existing_names, excluded_mbids
-            )
+            should_include, reason = candidate_filter(mbid, name)
 
             if not should_include:
                 if reason == "already_in_lidarr_mbid" or reason == "already_in_lidarr_name":
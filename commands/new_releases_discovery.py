@@ -6,9 +6,13 @@ Uses artist_scan_log for round-robin (oldest last_scanned_at first; never-scanne
 Inserts into new_release_pending; skips dismissed artist+album combinations.
 """
 
+import asyncio
+import heapq
 import random
+import re
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
+from operator import itemgetter
 from typing import Any
 from urllib.parse import quote
 
@@ -23,6 +27,9 @@ async def _optional_musicbrainz(config):
         yield None
 
 
+from rapidfuzz import fuzz, process
+from sqlalchemy import exists, insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from clients.client_lidarr import LidarrClient
@@ -48,6 +55,8 @@ from .config_adapter import ConfigAdapter
 
 HARMONY_BASE_URL = "https://harmony.pulsewidth.org.uk/release"
 ALBUM_TYPES = frozenset({"album", "ep", "single", "other"})
+# Artists scanned concurrently; each client still applies its own request rate limit
+ARTIST_SCAN_CONCURRENCY = 4
 
 _LIVE_INDICATORS = frozenset(
     {
@@ -63,13 +72,16 @@ _LIVE_INDICATORS = frozenset(
         "live album",
     }
 )
+_LIVE_RE = re.compile("|".join(re.escape(indicator) for indicator in _LIVE_INDICATORS))
 
 
 def _is_live_release(title: str) -> bool:
-    if not title:
-        return False
-    norm = normalize_text(title).lower()
-    return any(ind in norm for ind in _LIVE_INDICATORS)
+    return _is_live_normalized(normalize_text(title))
+
+
+def _is_live_normalized(norm_title: str) -> bool:
+    """Live check for a title already passed through normalize_text (which lowercases)."""
+    return _LIVE_RE.search(norm_title) is not None
 
 
 def _album_matches_filter(album_type: str, total_tracks: int, selected_types: set[str]) -> bool:
@@ -89,15 +101,68 @@ def _album_matches_filter(album_type: str, total_tracks: int, selected_types: se
 
 
 def _artist_names_match(name1: str, name2: str, min_similarity: float = 0.9) -> bool:
-    from difflib import SequenceMatcher
+    return _normalized_names_match(normalize_text(name1), normalize_text(name2), min_similarity)
 
-    n1 = normalize_text(name1)
-    n2 = normalize_text(name2)
+
+def _normalized_names_match(n1: str, n2: str, min_similarity: float = 0.9) -> bool:
+    """Compare artist names already passed through normalize_text."""
     if not n1 or not n2:
         return False
     if n1 == n2:
         return True
-    return SequenceMatcher(None, n1, n2).ratio() >= min_similarity
+    # Token order is ignored ("Beatles, The" vs "The Beatles"); sorting tokens keeps the length,
+    # so the score is bounded by 2*min(len)/(len1+len2): reject on length alone when it can't reach
+    len1, len2 = len(n1.strip()), len(n2.strip())
+    if 2 * min(len1, len2) < min_similarity * (len1 + len2):
+        return False
+    cutoff = min_similarity * 100
+    return fuzz.token_sort_ratio(n1, n2, score_cutoff=cutoff) >= cutoff
+
+
+def _normalize_mb_titles(mb_titles: list[str]) -> tuple[list[str], list[str]]:
+    """Normalize MB release group titles once per artist.
+    Returns (full titles, titles stripped of edition suffixes) for _title_matches_normalized."""
+    norm_titles: list[str] = []
+    base_titles: list[str] = []
+    for mb_title in mb_titles:
+        norm_mb = normalize_text(mb_title)
+        if not norm_mb:
+            continue
+        norm_titles.append(norm_mb)
+        base_mb = normalize_text(strip_edition_suffix(mb_title))
+        if base_mb:
+            base_titles.append(base_mb)
+    return norm_titles, base_titles
+
+
+def _matches_any_title(title: str, choices: list[str], min_similarity: float) -> bool:
+    """Fuzzy ratio match, or substring match (partial_ratio of 100), against any choice."""
+    if not choices:
+        return False
+    if process.extractOne(title, choices, scorer=fuzz.ratio, score_cutoff=min_similarity * 100):
+        return True
+    return (
+        process.extractOne(title, choices, scorer=fuzz.partial_ratio, score_cutoff=100) is not None
+    )
+
+
+def _title_matches_normalized(
+    spotify_title: str,
+    norm_mb_titles: list[str],
+    base_mb_titles: list[str],
+    min_similarity: float = 0.7,
+    norm_spotify: str | None = None,
+) -> bool:
+    """Check a Spotify album title against MB titles pre-normalized by _normalize_mb_titles.
+    Pass norm_spotify when the caller already has normalize_text(spotify_title)."""
+    if norm_spotify is None:
+        norm_spotify = normalize_text(spotify_title)
+    if not norm_spotify:
+        return False
+    if _matches_any_title(norm_spotify, norm_mb_titles, min_similarity):
+        return True
+    base_spotify = normalize_text(strip_edition_suffix(spotify_title))
+    return bool(base_spotify) and _matches_any_title(base_spotify, base_mb_titles, min_similarity)
 
 
 def _title_matches_mb(
@@ -106,31 +171,9 @@ def _title_matches_mb(
     """Check if Spotify album title matches any MB release group (fuzzy).
     Strips edition suffixes (Deluxe, Remaster, Live, etc.) so special editions
     match the base release and are not treated as new."""
-    from difflib import SequenceMatcher
-
-    norm_spotify = normalize_text(spotify_title)
-    if not norm_spotify:
-        return False
-    base_spotify = normalize_text(strip_edition_suffix(spotify_title))
-    for mb_title in mb_titles:
-        norm_mb = normalize_text(mb_title)
-        if not norm_mb:
-            continue
-        base_mb = normalize_text(strip_edition_suffix(mb_title))
-        if norm_spotify == norm_mb:
-            return True
-        if norm_spotify in norm_mb or norm_mb in norm_spotify:
-            return True
-        if SequenceMatcher(None, norm_spotify, norm_mb).ratio() >= min_similarity:
-            return True
-        if base_spotify and base_mb:
-            if base_spotify == base_mb:
-                return True
-            if base_spotify in base_mb or base_mb in base_spotify:
-                return True
-            if SequenceMatcher(None, base_spotify, base_mb).ratio() >= min_similarity:
-                return True
-    return False
+    return _title_matches_normalized(
+        spotify_title, *_normalize_mb_titles(mb_titles), min_similarity
+    )
 
 
 class NewReleasesDiscoveryCommand(BaseCommand):
@@ -182,217 +225,67 @@ class NewReleasesDiscoveryCommand(BaseCommand):
                 f"Scanning {len(artists)} artists (types: {sorted(selected_types)}, source: {source_provider})"
             )
 
-            cache_ttl = getattr(config, "NEW_RELEASES_CACHE_DAYS", 14)
-            lidarr_base = (config.LIDARR_URL or "").rstrip("/")
             db = get_database_manager()
             session = db.get_config_session_context()
-
-            mb_streaming_provider = nrd_mb_streaming_provider(source_provider)
-            artist_id_key = nrd_lidarr_artist_id_key(source_provider)
+            scan_context = {
+                "session": session,
+                "source_provider": source_provider,
+                "selected_types": selected_types,
+                "source": source,
+                "cache_ttl": getattr(config, "NEW_RELEASES_CACHE_DAYS", 14),
+                "lidarr_base": (config.LIDARR_URL or "").rstrip("/"),
+                "mb_streaming_provider": nrd_mb_streaming_provider(source_provider),
+                "artist_id_key": nrd_lidarr_artist_id_key(source_provider),
+                # Provider artist id -> in-flight/finished discography fetch, shared for this run
+                "album_fetches": {},
+            }
 
             try:
-                inserted = 0
                 scanned = 0
                 async with LidarrClient(config):
                     async with nrd_release_client(source_provider, config) as release_client:
                         async with _optional_musicbrainz(config) as musicbrainz_client:
-                            for artist in artists:
-                                artist_name = artist.get("artistName", "")
-                                mbid = artist.get("musicBrainzId", "")
-                                lidarr_id = artist.get("id")
-                                # Lidarr uses MBID for artist URLs (not numeric ID)
-                                lidarr_artist_url = (
-                                    f"{lidarr_base}/artist/{mbid}" if lidarr_base and mbid else None
-                                )
-
-                                if not artist_name or not mbid:
-                                    continue
-
-                                if self._is_artist_ignored(session, mbid):
-                                    self.logger.debug(
-                                        f"Skipping '{artist_name}': artist on do-not-track list"
-                                    )
-                                    continue
-
-                                # Try Lidarr links first - validate with fuzzy match
-                                artist_id = None
-                                lidarr_artist_id = artist.get(artist_id_key)
-                                if lidarr_artist_id:
-                                    artist_info = await release_client.get_artist(lidarr_artist_id)
-                                    if artist_info.get("success") and artist_info.get("name"):
-                                        provider_name = artist_info.get("name", "")
-                                        if _artist_names_match(
-                                            artist_name, provider_name, min_similarity=0.9
-                                        ):
-                                            artist_id = lidarr_artist_id
-                                        else:
-                                            self.logger.warning(
-                                                f"Lidarr link for '{artist_name}' points to '{provider_name}' - falling back"
-                                            )
-
-                                # Fallback: MusicBrainz URL relations (Lidarr may not have Deezer/Spotify link)
-                                if not artist_id and musicbrainz_client:
-                                    mb_artist_id = await musicbrainz_client.get_artist_streaming_id(
-                                        mbid, mb_streaming_provider
-                                    )
-                                    if mb_artist_id:
-                                        artist_id = mb_artist_id
-                                        self.logger.debug(
-                                            f"Artist '{artist_name}' has no {source_provider} link in Lidarr; "
-                                            f"used MusicBrainz URL relation"
-                                        )
-
-                                # Fallback: search by name if no link from Lidarr or MB
-                                if not artist_id:
-                                    # Short names are unreliable for search - skip unless we have a Lidarr link
-                                    norm_name = normalize_text(artist_name)
-                                    if len(norm_name) <= 4:
-                                        self.logger.debug(
-                                            f"Skipping '{artist_name}': name too short for reliable search, add {source_provider} link in Lidarr"
-                                        )
-                                        self._upsert_scan_log(session, mbid, had_pending=False)
-                                        continue
-                                    search_result = await release_client.search_artists(
-                                        artist_name, limit=5
-                                    )
-                                    if not search_result.get("success") or not search_result.get(
-                                        "artists"
-                                    ):
-                                        self.logger.debug(
-                                            f"No {source_provider} match for: {artist_name}"
-                                        )
-                                        self._upsert_scan_log(session, mbid, had_pending=False)
-                                        continue
-                                    # Try each result - use first that passes fuzzy match (avoids wrong first hit)
-                                    artist_id = None
-                                    for hit in search_result["artists"]:
-                                        sid = hit.get("id")
-                                        if not sid:
-                                            continue
-                                        hit_name = hit.get("name", "")
-                                        if _artist_names_match(
-                                            artist_name, hit_name, min_similarity=0.9
-                                        ):
-                                            artist_id = sid
-                                            break
-                                    if not artist_id:
-                                        best = search_result["artists"][0].get("name", "?")
-                                        self.logger.warning(
-                                            f"Skipping '{artist_name}': no search result matched (best: '{best}')"
-                                        )
-                                        self._upsert_scan_log(session, mbid, had_pending=False)
-                                        continue
-
-                                albums_result = await release_client.get_artist_albums(
-                                    artist_id,
-                                    limit=50,
-                                    include_groups="album,ep,single,compilation,appears_on",
-                                    fetch_all=True,
-                                )
-                                if not albums_result.get("success") or not albums_result.get(
-                                    "albums"
-                                ):
-                                    self._upsert_scan_log(session, mbid, had_pending=False)
-                                    continue
-
-                                mb_titles = []
-                                if musicbrainz_client:
-                                    mb_titles = await musicbrainz_client.get_artist_release_groups(
-                                        mbid, cache_ttl_days=cache_ttl
-                                    )
-                                    if mb_titles is None:
-                                        # API error (e.g. rate limit) - skip artist, don't add to pending
-                                        self.logger.warning(
-                                            f"Skipping {artist_name}: MusicBrainz fetch failed (rate limit?)"
-                                        )
-                                        self._upsert_scan_log(session, mbid, had_pending=False)
-                                        continue
-
-                                had_pending = False
-                                candidates = []
-                                via_scraper = albums_result.get("via") == "scraper"
-                                for album in albums_result["albums"]:
-                                    if (
-                                        not via_scraper
-                                        and album.get("primary_artist_id") != artist_id
-                                    ):
-                                        continue
-                                    album_type = album.get("album_type", "")
-                                    total_tracks = album.get("total_tracks", 0)
-                                    if not _album_matches_filter(
-                                        album_type, total_tracks, selected_types
-                                    ):
-                                        continue
-                                    if _is_live_release(album.get("name", "")):
-                                        continue
-                                    if _title_matches_mb(album.get("name", ""), mb_titles):
-                                        continue
-
-                                    album = await enrich_nrd_album_if_needed(
-                                        release_client, album, source_provider
-                                    )
-                                    if album.get("primary_artist_id") != artist_id:
-                                        continue
-
-                                    spotify_url = album.get("spotify_url") or album.get(
-                                        "external_url", ""
-                                    )
-                                    if not spotify_url:
-                                        continue
-
-                                    album_title = album.get("name", "Unknown")
-                                    release_date = album.get("release_date", "")
-
-                                    if self._is_dismissed(session, mbid, album_title, release_date):
-                                        continue
-                                    if self._already_pending(
-                                        session, mbid, album_title, release_date
-                                    ):
-                                        continue
-
-                                    candidates.append(
-                                        {
-                                            "album": album,
-                                            "album_title": album_title,
-                                            "release_date": release_date,
-                                            "album_type": album_type,
-                                            "total_tracks": total_tracks,
-                                            "spotify_url": spotify_url,
-                                        }
-                                    )
-
-                                # Prefer base release when variants exist (e.g. "Album" over "Album (Extended)")
-                                filtered = prefer_base_releases(
-                                    candidates,
-                                    title_key="album_title",
-                                    date_key="release_date",
-                                )
-
-                                for item in filtered:
-                                    album = item["album"]
-                                    harmony_url = f"{HARMONY_BASE_URL}?url={quote(item['spotify_url'], safe='')}"
-                                    rec = NewReleasePending(
-                                        artist_mbid=mbid,
-                                        artist_name=artist_name,
-                                        spotify_artist_id=artist_id,
-                                        album_title=item["album_title"],
-                                        album_type=item["album_type"],
-                                        release_date=item["release_date"],
-                                        total_tracks=item["total_tracks"],
-                                        spotify_url=item["spotify_url"],
-                                        harmony_url=harmony_url,
-                                        lidarr_artist_id=lidarr_id,
-                                        lidarr_artist_url=lidarr_artist_url,
-                                        source=source,
-                                        status="pending",
-                                    )
-                                    session.add(rec)
-                                    inserted += 1
-                                    had_pending = True
-
-                                self._upsert_scan_log(session, mbid, had_pending=had_pending)
-                                scanned += 1
-
+                            scan_context["release_client"] = release_client
+                            scan_context["musicbrainz_client"] = musicbrainz_client
+                            semaphore = asyncio.Semaphore(ARTIST_SCAN_CONCURRENCY)
+
+                            async def scan(artist: dict[str, Any]):
+                                async with semaphore:
+                                    return await self._scan_artist(artist, scan_context)
+
+                            results = await asyncio.gather(
+                                *(scan(artist) for artist in artists), return_exceptions=True
+                            )
+
+                # Database writes happen here, after every scan finished, as two batched statements
+                pending_rows: list[dict[str, Any]] = []
+                scan_log_rows: list[dict[str, Any]] = []
+                scanned_at = datetime.now(UTC)
+                for artist, result in zip(artists, results, strict=True):
+                    if isinstance(result, Exception):
+                        self.logger.error(
+                            f"Scan failed for '{artist.get('artistName', '')}': {result}",
+                            exc_info=result,
+                        )
+                        continue
+                    if result is None:
+                        continue
+                    mbid, rows, completed = result
+                    pending_rows.extend(rows)
+                    scan_log_rows.append(
+                        {
+                            "artist_mbid": mbid,
+                            "last_scanned_at": scanned_at,
+                            "had_pending_releases": bool(rows),
+                        }
+                    )
+                    if completed:
+                        scanned += 1
+
+                if pending_rows:
+                    session.execute(insert(NewReleasePending), pending_rows)
+                inserted = len(pending_rows)
+                self._upsert_scan_logs(session, scan_log_rows)
                 session.commit()
                 self.last_run_stats = {
                     "artists_scanned": scanned,
@@ -409,6 +302,196 @@ class NewReleasesDiscoveryCommand(BaseCommand):
             self.logger.exception(f"New releases discovery failed: {e}")
             return False
 
+    async def _scan_artist(
+        self, artist: dict[str, Any], ctx: dict[str, Any]
+    ) -> tuple[str, list[dict[str, Any]], bool] | None:
+        """
+        Scan one Lidarr artist for releases missing from MusicBrainz.
+        Only reads from the session; the caller applies the writes.
+
+        Returns:
+            None when the artist is skipped without touching its scan log, otherwise
+            (mbid, new_release_pending rows to insert, whether the scan ran to completion)
+        """
+        session = ctx["session"]
+        release_client = ctx["release_client"]
+        musicbrainz_client = ctx["musicbrainz_client"]
+        source_provider = ctx["source_provider"]
+        artist_name = artist.get("artistName", "")
+        mbid = artist.get("musicBrainzId", "")
+        lidarr_id = artist.get("id")
+        lidarr_base = ctx["lidarr_base"]
+        # Lidarr uses MBID for artist URLs (not numeric ID)
+        lidarr_artist_url = f"{lidarr_base}/artist/{mbid}" if lidarr_base and mbid else None
+
+        if not artist_name or not mbid:
+            return None
+        norm_name = normalize_text(artist_name)
+
+        if self._is_artist_ignored(session, mbid):
+            self.logger.debug(f"Skipping '{artist_name}': artist on do-not-track list")
+            return None
+
+        # Try Lidarr links first - validate with fuzzy match
+        artist_id = None
+        lidarr_artist_id = artist.get(ctx["artist_id_key"])
+        if lidarr_artist_id:
+            artist_info = await release_client.get_artist(lidarr_artist_id)
+            if artist_info.get("success") and artist_info.get("name"):
+                provider_name = artist_info.get("name", "")
+                if _normalized_names_match(
+                    norm_name, normalize_text(provider_name), min_similarity=0.9
+                ):
+                    artist_id = lidarr_artist_id
+                else:
+                    self.logger.warning(
+                        f"Lidarr link for '{artist_name}' points to '{provider_name}' - falling back"
+                    )
+
+        # Fallback: MusicBrainz URL relations (Lidarr may not have Deezer/Spotify link)
+        if not artist_id and musicbrainz_client:
+            mb_artist_id = await musicbrainz_client.get_artist_streaming_id(
+                mbid, ctx["mb_streaming_provider"]
+            )
+            if mb_artist_id:
+                artist_id = mb_artist_id
+                self.logger.debug(
+                    f"Artist '{artist_name}' has no {source_provider} link in Lidarr; "
+                    f"used MusicBrainz URL relation"
+                )
+
+        # Fallback: search by name if no link from Lidarr or MB
+        if not artist_id:
+            # Short names are unreliable for search - skip unless we have a Lidarr link
+            if len(norm_name) <= 4:
+                self.logger.debug(
+                    f"Skipping '{artist_name}': name too short for reliable search, add {source_provider} link in Lidarr"
+                )
+                return mbid, [], False
+            search_result = await release_client.search_artists(artist_name, limit=5)
+            if not search_result.get("success") or not search_result.get("artists"):
+                self.logger.debug(f"No {source_provider} match for: {artist_name}")
+                return mbid, [], False
+            # Try each result - use first that passes fuzzy match (avoids wrong first hit)
+            for hit in search_result["artists"]:
+                sid = hit.get("id")
+                if not sid:
+                    continue
+                hit_name = hit.get("name", "")
+                if _normalized_names_match(norm_name, normalize_text(hit_name), min_similarity=0.9):
+                    artist_id = sid
+                    break
+            if not artist_id:
+                best = search_result["artists"][0].get("name", "?")
+                self.logger.warning(
+                    f"Skipping '{artist_name}': no search result matched (best: '{best}')"
+                )
+                return mbid, [], False
+
+        albums_result = await self._get_artist_albums(
+            release_client, artist_id, ctx["album_fetches"]
+        )
+        if not albums_result.get("success") or not albums_result.get("albums"):
+            return mbid, [], False
+
+        # Cheap local filters first: MusicBrainz is the most rate-limited dependency, so it is
+        # only queried when at least one album survives them
+        via_scraper = albums_result.get("via") == "scraper"
+        selected_types = ctx["selected_types"]
+        eligible_albums = []
+        for album in albums_result["albums"]:
+            if not via_scraper and album.get("primary_artist_id") != artist_id:
+                continue
+            name = album.get("name", "")
+            album_type = album.get("album_type", "")
+            total_tracks = album.get("total_tracks", 0)
+            if not _album_matches_filter(album_type, total_tracks, selected_types):
+                continue
+            norm_title = normalize_text(name)
+            if _is_live_normalized(norm_title):
+                continue
+            eligible_albums.append((album, name, norm_title, album_type, total_tracks))
+        if not eligible_albums:
+            return mbid, [], True
+
+        mb_titles = []
+        if musicbrainz_client:
+            mb_titles = await musicbrainz_client.get_artist_release_groups(
+                mbid, cache_ttl_days=ctx["cache_ttl"]
+            )
+            if mb_titles is None:
+                # API error (e.g. rate limit) - skip artist, don't add to pending
+                self.logger.warning(
+                    f"Skipping {artist_name}: MusicBrainz fetch failed (rate limit?)"
+                )
+                return mbid, [], False
+
+        norm_mb_titles, base_mb_titles = _normalize_mb_titles(mb_titles)
+        dismissed = self._load_dismissed_albums(session, mbid)
+        pending = self._load_pending_albums(session, mbid)
+        candidates = []
+        for album, name, norm_title, album_type, total_tracks in eligible_albums:
+            if _title_matches_normalized(
+                name, norm_mb_titles, base_mb_titles, norm_spotify=norm_title
+            ):
+                continue
+
+            # Spotify enrichment may return a new dict with fuller fields, so read these after it
+            album = await enrich_nrd_album_if_needed(release_client, album, source_provider)
+            if album.get("primary_artist_id") != artist_id:
+                continue
+
+            spotify_url = album.get("spotify_url") or album.get("external_url", "")
+            if not spotify_url:
+                continue
+
+            album_title = album.get("name", "Unknown")
+            release_date = album.get("release_date", "")
+
+            album_key = (album_title, (release_date or "").strip() or None)
+            if album_key in dismissed or album_key in pending:
+                continue
+
+            candidates.append(
+                {
+                    "album": album,
+                    "album_title": album_title,
+                    "release_date": release_date,
+                    "album_type": album_type,
+                    "total_tracks": total_tracks,
+                    "spotify_url": spotify_url,
+                }
+            )
+
+        # Prefer base release when variants exist (e.g. "Album" over "Album (Extended)")
+        filtered = prefer_base_releases(
+            candidates,
+            title_key="album_title",
+            date_key="release_date",
+        )
+
+        rows = []
+        for item in filtered:
+            harmony_url = f"{HARMONY_BASE_URL}?url={quote(item['spotify_url'], safe='')}"
+            rows.append(
+                {
+                    "artist_mbid": mbid,
+                    "artist_name": artist_name,
+                    "spotify_artist_id": artist_id,
+                    "album_title": item["album_title"],
+                    "album_type": item["album_type"],
+                    "release_date": item["release_date"],
+                    "total_tracks": item["total_tracks"],
+                    "spotify_url": item["spotify_url"],
+                    "harmony_url": harmony_url,
+                    "lidarr_artist_id": lidarr_id,
+                    "lidarr_artist_url": lidarr_artist_url,
+                    "source": ctx["source"],
+                    "status": "pending",
+                }
+            )
+        return mbid, rows, True
+
     def _get_artists_per_run(self) -> int:
         db = get_database_manager()
         session = db.get_config_session_context()
@@ -452,7 +535,7 @@ class NewReleasesDiscoveryCommand(BaseCommand):
         return normalize_nrd_source(cfg.get("new_releases_source"))
 
     async def _pick_artists_to_scan(self, n: int) -> list[dict[str, Any]]:
-        """Pick artists: never-scanned first, then by last_scanned_at ASC; if more than n, random sample."""
+        """Pick artists: never-scanned first (random sample if more than n), then by last_scanned_at ASC."""
         async with LidarrClient(self.config_adapter) as lidarr_client:
             artists = await lidarr_client.get_all_artists()
         if not artists:
@@ -461,8 +544,10 @@ class NewReleasesDiscoveryCommand(BaseCommand):
         db = get_database_manager()
         session = db.get_config_session_context()
         try:
-            rows = session.query(ArtistScanLog).all()
-            log_by_mbid = {r.artist_mbid: r for r in rows}
+            # Only the two columns needed, as plain tuples rather than hydrated ORM rows
+            last_scanned_by_mbid = dict(
+                session.query(ArtistScanLog.artist_mbid, ArtistScanLog.last_scanned_at).all()
+            )
             ignored_mbids = {
                 r.artist_mbid for r in session.query(NewReleaseIgnoredArtist.artist_mbid).all()
             }
@@ -475,72 +560,85 @@ class NewReleasesDiscoveryCommand(BaseCommand):
             mbid = a.get("musicBrainzId")
             if not mbid or mbid in ignored_mbids:
                 continue
-            if mbid not in log_by_mbid:
+            last_scanned_at = last_scanned_by_mbid.get(mbid)
+            if last_scanned_at is None:
                 never_scanned.append(a)
             else:
-                scanned.append((log_by_mbid[mbid].last_scanned_at, a))
-
-        scanned.sort(key=lambda x: x[0])
-        candidates = never_scanned + [a for _, a in scanned]
-        if len(candidates) <= n:
-            return candidates
-        return random.sample(candidates, n)
-
-    def _upsert_scan_log(self, session: Session, artist_mbid: str, had_pending: bool) -> None:
-        now = datetime.now(UTC)
-        existing = (
-            session.query(ArtistScanLog).filter(ArtistScanLog.artist_mbid == artist_mbid).first()
+                scanned.append((last_scanned_at, a))
+
+        if len(never_scanned) >= n:
+            return random.sample(never_scanned, n)
+        # Only the n oldest scans are needed, so select them without sorting the whole list
+        oldest = heapq.nsmallest(n - len(never_scanned), scanned, key=itemgetter(0))
+        return never_scanned + [a for _, a in oldest]
+
+    def _upsert_scan_logs(self, session: Session, rows: list[dict[str, Any]]) -> None:
+        """Insert or update artist_scan_log rows in one executemany statement."""
+        if not rows:
+            return
+        stmt = sqlite_insert(ArtistScanLog)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ArtistScanLog.artist_mbid],
+            set_={
+                "last_scanned_at": stmt.excluded.last_scanned_at,
+                "had_pending_releases": stmt.excluded.had_pending_releases,
+            },
         )
-        if existing:
-            existing.last_scanned_at = now
-            existing.had_pending_releases = had_pending
-        else:
-            session.add(
-                ArtistScanLog(
-                    artist_mbid=artist_mbid,
-                    last_scanned_at=now,
-                    had_pending_releases=had_pending,
-                )
-            )
+        session.execute(stmt, rows)
 
     def _is_artist_ignored(self, session: Session, artist_mbid: str) -> bool:
-        return (
-            session.query(NewReleaseIgnoredArtist)
-            .filter(NewReleaseIgnoredArtist.artist_mbid == artist_mbid)
-            .first()
-            is not None
-        )
-
-    def _is_dismissed(
-        self, session: Session, artist_mbid: str, album_title: str, release_date: str
-    ) -> bool:
-        r = (release_date or "").strip() or None
-        return (
-            session.query(DismissedArtistAlbum)
-            .filter(
-                DismissedArtistAlbum.artist_mbid == artist_mbid,
-                DismissedArtistAlbum.album_title == album_title,
-                DismissedArtistAlbum.release_date == r,
+        # EXISTS probe: answered from the primary key index without loading the row
+        return session.query(
+            exists().where(NewReleaseIgnoredArtist.artist_mbid == artist_mbid)
+        ).scalar()
+
+    @staticmethod
+    async def _get_artist_albums(
+        release_client, artist_id: str, album_fetches: dict[str, asyncio.Task]
+    ) -> dict[str, Any]:
+        """
+        Fetch an artist's discography once per run, even when several Lidarr artists
+        (aliases, duplicate MBIDs) resolve to the same provider id while scanning
+        concurrently. The clients already persist results in the cache for
+        NEW_RELEASES_CACHE_DAYS; this only dedupes within a run.
+        """
+        task = album_fetches.get(artist_id)
+        if task is None:
+            task = asyncio.ensure_future(
+                release_client.get_artist_albums(
+                    artist_id,
+                    limit=50,
+                    include_groups="album,ep,single,compilation,appears_on",
+                    fetch_all=True,
+                )
             )
-            .first()
-            is not None
+            album_fetches[artist_id] = task
+        return await task
+
+    def _load_dismissed_albums(
+        self, session: Session, artist_mbid: str
+    ) -> set[tuple[str, str | None]]:
+        """(album_title, release_date) pairs the user dismissed for this artist."""
+        rows = (
+            session.query(DismissedArtistAlbum.album_title, DismissedArtistAlbum.release_date)
+            .filter(DismissedArtistAlbum.artist_mbid == artist_mbid)
+            .all()
         )
-
-    def _already_pending(
-        self, session: Session, artist_mbid: str, album_title: str, release_date: str
-    ) -> bool:
-        r = (release_date or "").strip() or None
-        return (
-            session.query(NewReleasePending)
+        return {(title, release_date) for title, release_date in rows}
+
+    def _load_pending_albums(
+        self, session: Session, artist_mbid: str
+    ) -> set[tuple[str, str | None]]:
+        """(album_title, release_date) pairs already pending or queued for recheck for this artist."""
+        rows = (
+            session.query(NewReleasePending.album_title, NewReleasePending.release_date)
             .filter(
                 NewReleasePending.artist_mbid == artist_mbid,
-                NewReleasePending.album_title == album_title,
-                NewReleasePending.release_date == r,
                 NewReleasePending.status.in_(["pending", "recheck_requested"]),
             )
-            .first()
-            is not None
+            .all()
         )
+        return {(title, release_date) for title, release_date in rows}
 
     def get_description(self) -> str:
         return "Scan Lidarr artists for Deezer (or Spotify) releases missing from MusicBrainz; insert into New Releases pending table."
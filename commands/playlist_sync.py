@@ -4,18 +4,77 @@ Playlist Sync Command
 Dynamic command for syncing playlists from external sources (Spotify, etc.)
 """
 
-from datetime import datetime
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
+import orjson
+
+from cache_manager import get_cache_manager
+from clients.client_base import AsyncRateLimiter
 from clients.client_deezer import DeezerClient
 from clients.client_jellyfin import JellyfinClient
 from clients.client_plex import PlexClient
 from clients.client_spotify import SpotifyClient
+from utils.discovery import DATE_ADDED_FORMAT
 from utils.library_cache_manager import get_library_cache_manager
 from utils.plex_user import get_account_name, get_accounts, get_token_for_user
 
 from .command_base import BaseCommand
 
+# Default bound on concurrent target library searches (overridable per playlist config)
+MAX_CONCURRENT_SEARCHES = 20
+
+# Default live search rate against the target server when no library cache is loaded
+TARGET_SEARCHES_PER_SECOND = 10
+
+# An unchanged additive sync is skipped until its fingerprint expires, then re-run in full
+SYNC_FINGERPRINT_TTL_DAYS = 7
+
+
+@dataclass(frozen=True, slots=True)
+class SyncJob:
+    """Playlist sync settings read once from the command's config_json"""
+
+    source: str
+    playlist_url: str | None
+    playlist_name: str | None
+    sync_mode: str
+    plex_account_ids: tuple[str, ...]
+    enable_artist_discovery: bool
+    is_first_run: bool
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> SyncJob:
+        account_ids = config.get("plex_account_ids")
+        return cls(
+            source=config.get("source") or "unknown",
+            playlist_url=config.get("playlist_url"),
+            playlist_name=config.get("playlist_name"),
+            sync_mode=config.get("sync_mode", "full"),
+            plex_account_ids=tuple(account_ids) if isinstance(account_ids, list) else (),
+            enable_artist_discovery=bool(config.get("enable_artist_discovery", False)),
+            is_first_run=bool(config.get("is_first_run", False)),
+        )
+
+
+def _dedupe_tracks(tracks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drop repeated (artist, title) entries, keeping the first occurrence in playlist order"""
+    seen: set[tuple[str, str]] = set()
+    unique = []
+    for track in tracks:
+        key = (
+            (track.get("artist") or "").strip().casefold(),
+            (track.get("track") or "").strip().casefold(),
+        )
+        if key not in seen:
+            seen.add(key)
+            unique.append(track)
+    return unique
+
 
 class PlaylistSyncCommand(BaseCommand):
     """Dynamic command for syncing playlists from external sources"""
@@ -97,23 +156,28 @@ class PlaylistSyncCommand(BaseCommand):
             self._initialize_clients()
 
             # Get configuration
-            config = self.config_json
-            playlist_url = config.get("playlist_url")
-            playlist_name = config.get("playlist_name")
-            sync_mode = config.get("sync_mode", "full")
+            job = SyncJob.from_config(self.config_json)
+            playlist_name = job.playlist_name
+            sync_mode = job.sync_mode
 
-            if not playlist_url:
+            if not job.playlist_url:
                 raise ValueError("No playlist URL configured")
 
-            self.logger.info(f"Syncing {config.get('source', 'unknown')} playlist: {playlist_name}")
+            self.logger.info(f"Syncing {job.source} playlist: {playlist_name}")
             self.logger.info(f"Target: {self.target_name}, Mode: {sync_mode}")
 
             # Fetch tracks from source
             self.logger.info("Fetching tracks from source playlist...")
 
-            # Use source client as context manager for proper session cleanup
-            async with self.source_client as client:
-                tracks_result = await client.get_playlist_tracks(playlist_url)
+            async def fetch_tracks() -> dict[str, Any]:
+                # Use source client as context manager for proper session cleanup
+                async with self.source_client as client:
+                    return await client.get_playlist_tracks(job.playlist_url)
+
+            # Load the target library cache in a worker thread while the source is fetched
+            tracks_result, (cached_data, library_key) = await asyncio.gather(
+                fetch_tracks(), asyncio.to_thread(self._load_library_cache)
+            )
 
             if not tracks_result.get("success"):
                 error_msg = tracks_result.get("error", "Unknown error")
@@ -130,36 +194,16 @@ class PlaylistSyncCommand(BaseCommand):
 
             self.logger.info(f"Found {total_tracks} tracks in source playlist")
 
-            source_label = config.get("source", "Unknown").title()
-            playlist_summary = (
-                f"Synced from {config.get('source', 'unknown')} playlist: {playlist_name}"
-            )
+            tracks = _dedupe_tracks(tracks)
+            if len(tracks) < total_tracks:
+                self.logger.info(f"Deduplicated {total_tracks - len(tracks)} repeated tracks")
 
-            # Get library cache if available (target resolved library for cache + playlist content)
-            cached_data = None
-            library_key = None
-            if hasattr(self.target_client, "get_resolved_library_key"):
-                library_key = self.target_client.get_resolved_library_key()
-            if self.library_cache_manager:
-                cached_data = self.library_cache_manager.get_library_cache(
-                    self.target_name.lower(), library_key
-                )
-                if cached_data:
-                    track_count = cached_data.get("total_tracks", 0)
-                    self.logger.info(f"Using library cache with {track_count:,} tracks")
-                else:
-                    self.logger.warning(
-                        f"Library cache not available for {self.target_name}. "
-                        "Playlist sync will use live API (slower performance expected)."
-                    )
+            source_label = job.source.title()
+            playlist_summary = f"Synced from {job.source} playlist: {playlist_name}"
 
             # Multi-user Plex sync: sync to each selected account
-            plex_account_ids = config.get("plex_account_ids") or []
-            multi_user = (
-                self.target_name == "Plex"
-                and isinstance(plex_account_ids, list)
-                and len(plex_account_ids) > 0
-            )
+            multi_user = self.target_name == "Plex" and bool(job.plex_account_ids)
+            fingerprint = None
             if multi_user:
                 success, sync_stats = await self._sync_multi_user_plex(
                     source_label=source_label,
@@ -174,6 +218,26 @@ class PlaylistSyncCommand(BaseCommand):
                 # Single sync (admin token or Jellyfin)
                 playlist_title = f"[{source_label}] {playlist_name}"
                 if sync_mode == "additive":
+                    fingerprint = self._sync_fingerprint(tracks, library_key, cached_data)
+                if (
+                    fingerprint
+                    and fingerprint == self._last_sync_fingerprint()
+                    and await asyncio.to_thread(
+                        self.target_client.find_playlist_by_name, playlist_title
+                    )
+                ):
+                    self.logger.info(
+                        "Source playlist and library cache unchanged since last sync, skipping"
+                    )
+                    sync_result = {
+                        "success": True,
+                        "action": "unchanged",
+                        "total_tracks": total_tracks,
+                        "added_tracks": 0,
+                        "message": "Playlist unchanged since last sync",
+                    }
+                    fingerprint = None  # Keep the stored entry's expiry; forces a periodic re-sync
+                elif sync_mode == "additive":
                     sync_result = await self._sync_additive(
                         playlist_title, tracks, playlist_summary, cached_data, library_key
                     )
@@ -191,41 +255,43 @@ class PlaylistSyncCommand(BaseCommand):
             if success:
                 if multi_user:
                     self.logger.info(
-                        f"Successfully synced playlist to {len(plex_account_ids)} Plex users"
+                        f"Successfully synced playlist to {len(job.plex_account_ids)} Plex users"
                     )
                 else:
                     self.logger.info(f"Successfully synced playlist '{playlist_title}'")
 
-                # Artist discovery: always run to count new artists; conditionally add to import list
+                # Artist discovery only runs when enabled and something went unmatched;
+                # artist_discovery stays None when it did not run
+                artist_discovery_stats = None
                 unmatched_tracks = sync_stats.get("unmatched_tracks", [])
-                if unmatched_tracks:
+                if job.enable_artist_discovery and unmatched_tracks:
                     unmatched_track_objects = []
                     for track_string in unmatched_tracks:
-                        if " - " in track_string:
-                            artist, track_name = track_string.split(" - ", 1)
+                        artist, sep, track_name = track_string.partition(" - ")
+                        if sep:
                             unmatched_track_objects.append(
                                 {"artist": artist.strip(), "track": track_name.strip()}
                             )
                     artist_discovery_stats = await self._discover_and_add_artists(
                         unmatched_track_objects, cached_data
                     )
-                else:
-                    artist_discovery_stats = {
-                        "artists_discovered": 0,
-                        "artists_added": 0,
-                        "artists_skipped": 0,
-                        "artists_failed": 0,
-                        "artists_deferred": 0,
-                    }
 
                 # Get sync statistics from target client
                 # sync_stats already contains the result from sync operation
 
+                if (
+                    fingerprint
+                    and not job.is_first_run
+                    and not (artist_discovery_stats or {}).get("artists_deferred")
+                ):
+                    self._store_sync_fingerprint(fingerprint)
+
                 self.last_run_stats = {
                     "total_tracks": total_tracks,
+                    "unique_tracks": len(tracks),
                     "sync_mode": sync_mode,
                     "target": self.target_name,
-                    "source": config.get("source"),
+                    "source": job.source,
                     "sync_stats": sync_stats,
                     "artist_discovery": artist_discovery_stats,
                 }
@@ -241,6 +307,61 @@ class PlaylistSyncCommand(BaseCommand):
             # Ensure clients are properly closed
             await self._close_clients()
 
+    def _sync_fingerprint(
+        self,
+        tracks: list[dict[str, Any]],
+        library_key: str | None,
+        cached_data: dict[str, Any] | None,
+    ) -> str | None:
+        """Hash of the source tracks and the library cache build. When it matches the last
+        successful additive sync, no new track can be matched. None without a library cache,
+        since live library changes can't be detected."""
+        built_at = (cached_data or {}).get("built_at")
+        if not built_at or not self.config_json.get("unique_id"):
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.target_name}|{library_key}|{built_at}".encode())
+        for track in tracks:
+            key = (track.get("artist"), track.get("track"), track.get("album"))
+            digest.update(repr(key).encode())
+        return digest.hexdigest()
+
+    def _fingerprint_cache_key(self) -> str:
+        return f"sync_fingerprint:{self.config_json.get('unique_id')}"
+
+    def _last_sync_fingerprint(self) -> str | None:
+        entry = get_cache_manager().get(self._fingerprint_cache_key(), "playlist_sync")
+        return entry.get("fingerprint") if entry else None
+
+    def _store_sync_fingerprint(self, fingerprint: str) -> None:
+        get_cache_manager().set(
+            self._fingerprint_cache_key(),
+            "playlist_sync",
+            {"fingerprint": fingerprint},
+            SYNC_FINGERPRINT_TTL_DAYS,
+        )
+
+    def _load_library_cache(self) -> tuple[dict[str, Any] | None, str | None]:
+        """Get library cache if available (target resolved library for cache + playlist content).
+        Returns (cached_data, library_key)."""
+        cached_data = None
+        library_key = None
+        if hasattr(self.target_client, "get_resolved_library_key"):
+            library_key = self.target_client.get_resolved_library_key()
+        if self.library_cache_manager:
+            cached_data = self.library_cache_manager.get_library_cache(
+                self.target_name.lower(), library_key
+            )
+            if cached_data:
+                track_count = cached_data.get("total_tracks", 0)
+                self.logger.info(f"Using library cache with {track_count:,} tracks")
+            else:
+                self.logger.warning(
+                    f"Library cache not available for {self.target_name}. "
+                    "Playlist sync will use live API (slower performance expected)."
+                )
+        return cached_data, library_key
+
     async def _close_clients(self):
         """Close HTTP sessions for clients"""
         try:
@@ -259,12 +380,12 @@ class PlaylistSyncCommand(BaseCommand):
         try:
             self.logger.info("Starting artist discovery for unmatched tracks...")
 
-            # Collect unique artists from tracks
-            unique_artists = set()
+            # Collect unique artists from tracks, keyed like Lidarr's lowercased names
+            unique_artists: dict[str, str] = {}
             for track in tracks:
                 artist = track.get("artist", "").strip()
                 if artist:
-                    unique_artists.add(artist)
+                    unique_artists.setdefault(artist.lower(), artist)
 
             if not unique_artists:
                 self.logger.info("No artists found in tracks for discovery")
@@ -304,7 +425,7 @@ class PlaylistSyncCommand(BaseCommand):
                     "artists_failed": 0,
                     "artists_deferred": 0,
                     "added_artists": [],
-                    "skipped_artists": list(unique_artists),
+                    "skipped_artists": list(unique_artists.values()),
                     "failed_artists": [],
                     "error": "MusicBrainz is disabled",
                 }
@@ -312,11 +433,12 @@ class PlaylistSyncCommand(BaseCommand):
             try:
                 # Get Lidarr context for filtering
                 discovery_utils = DiscoveryUtils(self.config, lidarr_client, musicbrainz_client)
-                (
-                    existing_mbids,
-                    existing_names,
-                    excluded_mbids,
-                ) = await discovery_utils.get_lidarr_context()
+                async with lidarr_client:
+                    (
+                        existing_mbids,
+                        existing_names,
+                        excluded_mbids,
+                    ) = await discovery_utils.get_lidarr_context()
 
                 # Process each artist
                 artists_added = 0
@@ -327,18 +449,30 @@ class PlaylistSyncCommand(BaseCommand):
                 failed_artists = []
                 new_discoveries = []
 
-                for artist_name in unique_artists:
-                    try:
-                        # Skip if already in Lidarr (by name)
-                        if artist_name.lower() in existing_names:
-                            artists_skipped += 1
-                            skipped_artists.append(
-                                {"name": artist_name, "reason": "Already in Lidarr"}
-                            )
-                            continue
+                # Skip artists already in Lidarr (by name) before any MusicBrainz lookup
+                # Both lists keep the playlist's artist order, so runs are reproducible
+                in_lidarr = unique_artists.keys() & existing_names
+                artists_skipped += len(in_lidarr)
+                skipped_artists.extend(
+                    {"name": name, "reason": "Already in Lidarr"}
+                    for key, name in unique_artists.items()
+                    if key in in_lidarr
+                )
+                to_lookup = [name for key, name in unique_artists.items() if key not in in_lidarr]
 
-                        # Look up MBID in MusicBrainz
-                        mbid_result = await musicbrainz_client.fuzzy_search_artist(artist_name)
+                # Every artist discovered in this run shares one dateAdded stamp
+                date_added = datetime.now(UTC).strftime(DATE_ADDED_FORMAT)
+
+                # Look up MBIDs concurrently; the client's rate limiter spaces the requests
+                lookups = await asyncio.gather(
+                    *(musicbrainz_client.fuzzy_search_artist(name) for name in to_lookup),
+                    return_exceptions=True,
+                )
+
+                for artist_name, mbid_result in zip(to_lookup, lookups, strict=True):
+                    try:
+                        if isinstance(mbid_result, Exception):
+                            raise mbid_result
 
                         if not mbid_result or not mbid_result.get("mbid"):
                             self.logger.debug(f"No MBID found for artist: {artist_name}")
@@ -371,7 +505,7 @@ class PlaylistSyncCommand(BaseCommand):
                             source=self.config_json.get(
                                 "playlist_name", "unknown"
                             ),  # Use playlist name, not command name
-                            dateAdded=datetime.utcnow().strftime("%Y-%m-%d, %H:%M:%S"),
+                            dateAdded=date_added,
                         )
 
                         new_discoveries.append(artist_entry)
@@ -453,10 +587,11 @@ class PlaylistSyncCommand(BaseCommand):
 
     async def _save_discovered_artists(self, new_discoveries: list[dict[str, Any]]):
         """Save discovered artists to the unified import list file"""
-        try:
-            import json
-            from pathlib import Path
+        # File read/merge/write is blocking; keep it off the event loop
+        await asyncio.to_thread(self._save_discovered_artists_sync, new_discoveries)
 
+    def _save_discovered_artists_sync(self, new_discoveries: list[dict[str, Any]]):
+        try:
             # Path to the playlist sync discovery file
             import_lists_dir = Path("data/import_lists")
             import_lists_dir.mkdir(exist_ok=True)
@@ -466,27 +601,33 @@ class PlaylistSyncCommand(BaseCommand):
             existing_discoveries = []
             if discovery_file.exists():
                 try:
-                    with open(discovery_file, encoding="utf-8") as f:
-                        existing_discoveries = json.load(f)
-                except (OSError, json.JSONDecodeError) as e:
+                    existing_discoveries = orjson.loads(discovery_file.read_bytes())
+                except (OSError, orjson.JSONDecodeError) as e:
                     self.logger.warning(f"Could not load existing discoveries: {e}")
                     existing_discoveries = []
 
             # Create a set of existing MBIDs for deduplication
             existing_mbids = {entry.get("MusicBrainzId") for entry in existing_discoveries}
 
-            # Add new discoveries (avoiding duplicates by MBID)
-            added_count = 0
+            # First discovery per MBID (in discovery order), minus those already in the file
+            new_by_mbid: dict[str, dict[str, Any]] = {}
             for discovery in new_discoveries:
                 mbid = discovery.get("MusicBrainzId")
-                if mbid and mbid not in existing_mbids:
-                    existing_discoveries.append(discovery)
-                    existing_mbids.add(mbid)
-                    added_count += 1
+                if mbid:
+                    new_by_mbid.setdefault(mbid, discovery)
+            truly_new = new_by_mbid.keys() - existing_mbids
+            existing_discoveries.extend(
+                discovery for mbid, discovery in new_by_mbid.items() if mbid in truly_new
+            )
+            added_count = len(truly_new)
+
+            if not added_count:
+                self.logger.info(f"No new artists to save to {discovery_file}")
+                return
 
             # Save updated discoveries
-            with open(discovery_file, "w", encoding="utf-8") as f:
-                json.dump(existing_discoveries, f, indent=2, ensure_ascii=False)
+            option = orjson.OPT_INDENT_2 if self.config.PRETTY_PRINT_JSON else 0
+            discovery_file.write_bytes(orjson.dumps(existing_discoveries, option=option))
 
             self.logger.info(f"Saved {added_count} new artists to {discovery_file}")
 
@@ -494,7 +635,7 @@ class PlaylistSyncCommand(BaseCommand):
             self.logger.error(f"Error saving discovered artists: {e}")
             raise
 
-    def _resolve_tracks_for_plex(
+    async def _resolve_tracks_for_plex(
         self,
         tracks: list[dict[str, Any]],
         cached_data: dict[str, Any] | None,
@@ -502,24 +643,54 @@ class PlaylistSyncCommand(BaseCommand):
         """Resolve source tracks to Plex rating keys using target_client. Returns only
         tracks that were found (with rating_key set). Reuse this list for multi-user sync
         to avoid re-searching for each user."""
+        unkeyed = [t for t in tracks if not (t.get("rating_key") or t.get("key"))]
+        searched = iter(await self._search_tracks(unkeyed, cached_data))
         resolved: list[dict[str, Any]] = []
         for track in tracks:
             rating_key = track.get("rating_key") or track.get("key")
             if rating_key:
                 resolved.append({**track, "rating_key": str(rating_key)})
                 continue
-            artist = track.get("artist", "")
-            track_name = track.get("track", "")
-            if not artist or not track_name:
-                continue
-            album = track.get("album", "")
-            key = self.target_client.search_for_track(
-                track_name, artist, cached_data=cached_data, album_name=album
-            )
+            key = next(searched)
             if key:
                 resolved.append({**track, "rating_key": key})
         return resolved
 
+    async def _search_tracks(
+        self, tracks: list[dict[str, Any]], cached_data: dict[str, Any] | None
+    ) -> list[str | None]:
+        """Search the target library for each track concurrently (bounded), in track order.
+        Tracks without an artist or title resolve to None. Without a library cache every
+        search is a live request, so those are also rate limited."""
+        client = self.target_client
+        semaphore = asyncio.Semaphore(
+            self.config_json.get("max_concurrent_searches", MAX_CONCURRENT_SEARCHES)
+        )
+        limiter = None
+        if not cached_data:
+            limiter = AsyncRateLimiter(
+                self.config_json.get("target_rps", TARGET_SEARCHES_PER_SECOND)
+            )
+
+        async def search(track: dict[str, Any]) -> str | None:
+            artist = track.get("artist", "")
+            track_name = track.get("track", "")
+            if not artist or not track_name:
+                return None
+            async with semaphore:
+                if limiter:
+                    await limiter.acquire()
+                # Target clients are synchronous (requests); run searches off the event loop
+                return await asyncio.to_thread(
+                    client.search_for_track,
+                    track_name,
+                    artist,
+                    cached_data=cached_data,
+                    album_name=track.get("album", ""),
+                )
+
+        return await asyncio.gather(*(search(track) for track in tracks))
+
     async def _sync_multi_user_plex(
         self,
         source_label: str,
@@ -540,7 +711,7 @@ class PlaylistSyncCommand(BaseCommand):
         # Resolve tracks once (first user / admin context). Subsequent users get
         # only the found tracks, no re-search.
         self.logger.info("Resolving tracks for multi-user sync (single pass)...")
-        resolved_tracks = self._resolve_tracks_for_plex(tracks, cached_data)
+        resolved_tracks = await self._resolve_tracks_for_plex(tracks, cached_data)
         self.logger.info(
             f"Resolved {len(resolved_tracks)}/{len(tracks)} tracks for {len(self.config_json.get('plex_account_ids', []))} users"
         )
@@ -617,7 +788,9 @@ class PlaylistSyncCommand(BaseCommand):
         try:
             self.logger.info(f"Performing full sync for playlist '{playlist_title}'")
 
-            result = self.target_client.sync_playlist(
+            # Target clients are synchronous (requests); keep the event loop free meanwhile
+            result = await asyncio.to_thread(
+                self.target_client.sync_playlist,
                 title=playlist_title,
                 tracks=tracks,
                 summary=summary,
@@ -661,7 +834,9 @@ class PlaylistSyncCommand(BaseCommand):
             self.logger.info(f"Performing additive sync for playlist '{playlist_title}'")
 
             # Check if playlist exists
-            existing_playlist = self.target_client.find_playlist_by_name(playlist_title)
+            existing_playlist = await asyncio.to_thread(
+                self.target_client.find_playlist_by_name, playlist_title
+            )
 
             if not existing_playlist:
                 # Playlist doesn't exist, create it with all tracks
@@ -674,29 +849,19 @@ class PlaylistSyncCommand(BaseCommand):
 
             # Get existing tracks
             playlist_rating_key = existing_playlist.get("ratingKey") or existing_playlist.get("Id")
-            existing_track_keys = self.target_client.get_playlist_track_rating_keys(
-                playlist_rating_key
+            existing_track_keys = await asyncio.to_thread(
+                self.target_client.get_playlist_track_rating_keys, playlist_rating_key
             )
 
             self.logger.info(f"Found existing playlist with {len(existing_track_keys)} tracks")
 
             # Find tracks to add (not already in playlist)
-            tracks_to_add = []
-            for track in tracks:
-                artist = track.get("artist", "")
-                track_name = track.get("track", "")
-
-                if not artist or not track_name:
-                    continue
-
-                # Search for track in target library
-                album = track.get("album", "")
-                rating_key = self.target_client.search_for_track(
-                    track_name, artist, cached_data=cached_data, album_name=album
-                )
-
-                if rating_key and rating_key not in existing_track_keys:
-                    tracks_to_add.append(rating_key)
+            rating_keys = await self._search_tracks(tracks, cached_data)
+            tracks_to_add = [
+                rating_key
+                for rating_key in rating_keys
+                if rating_key and rating_key not in existing_track_keys
+            ]
 
             if not tracks_to_add:
                 self.logger.info("No new tracks to add to playlist")
@@ -712,7 +877,9 @@ class PlaylistSyncCommand(BaseCommand):
             self.logger.info(f"Adding {len(tracks_to_add)} new tracks to playlist")
 
             # Add new tracks to existing playlist
-            success = self.target_client.add_tracks_to_playlist(playlist_rating_key, tracks_to_add)
+            success = await asyncio.to_thread(
+                self.target_client.add_tracks_to_playlist, playlist_rating_key, tracks_to_add
+            )
 
             if success:
                 self.logger.info(f"Successfully added {len(tracks_to_add)} tracks to playlist")
@@ -4,15 +4,37 @@ Playlist Sync Discovery Maintenance Command
 Maintains the unified discovery import list by removing stale entries
 """
 
-import json
-from datetime import datetime, timedelta
+import asyncio
+import logging
+import mmap
+import os
+import re
+import shutil
+import time
+from datetime import UTC, datetime, timedelta
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from clients.client_lidarr import LidarrClient
+from utils.discovery import DATE_ADDED_FORMAT
 
 from .command_base import BaseCommand
 
+# Zero-padded dateAdded strings sort chronologically, so they compare without parsing
+DATE_ADDED_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}, \d{2}:\d{2}:\d{2}")
+
+# Default reuse window for a fetched Lidarr context; PLAYLIST_SYNC_DISCOVERY_CONTEXT_TTL_SECONDS
+CONTEXT_MEMO_SECONDS = 300
+
+# Lidarr context per server: base_url -> (artist MBIDs, excluded MBIDs, fetched at monotonic)
+_lidarr_contexts: dict[str, tuple[frozenset[str], frozenset[str], float]] = {}
+
+# Removed entries named individually in the cleanup summary log
+REMOVAL_LOG_LIMIT = 10
+
 
 class PlaylistSyncDiscoveryMaintenanceCommand(BaseCommand):
     """Maintain the playlist sync discovery import list by removing stale entries"""
@@ -36,11 +58,16 @@ class PlaylistSyncDiscoveryMaintenanceCommand(BaseCommand):
 
             self.logger.info(f"Loaded {len(current_entries)} entries from discovery file")
 
-            # Get Lidarr context for filtering
-            lidarr_client = LidarrClient(self.config)
-            existing_mbids, existing_names, excluded_mbids = await self._get_lidarr_context(
-                lidarr_client
-            )
+            # Get Lidarr context for filtering; entries without an MBID can't match it
+            mbids_in_file = {e.get("MusicBrainzId") for e in current_entries} - {None, ""}
+            if mbids_in_file:
+                lidarr_client = LidarrClient(self.config)
+                async with lidarr_client:
+                    existing_mbids, excluded_mbids = await self._get_lidarr_context(
+                        lidarr_client, mbids_in_file
+                    )
+            else:
+                existing_mbids, excluded_mbids = frozenset(), frozenset()
 
             # Clean up entries
             cleanup_stats = await self._cleanup_entries(
@@ -75,13 +102,26 @@ class PlaylistSyncDiscoveryMaintenanceCommand(BaseCommand):
 
     async def _load_discovery_file(self) -> list[dict[str, Any]]:
         """Load the discovery file"""
+        # File read and parse are blocking; keep them off the event loop
+        return await asyncio.to_thread(self._load_discovery_file_sync)
+
+    def _load_discovery_file_sync(self) -> list[dict[str, Any]]:
         try:
             if not self.discovery_file.exists():
                 self.logger.warning(f"Discovery file not found: {self.discovery_file}")
                 return []
 
-            with open(self.discovery_file, encoding="utf-8") as f:
-                entries = json.load(f)
+            if self.discovery_file.stat().st_size == 0:
+                self.logger.error("Discovery file is empty")
+                return []
+
+            # Parse the mapped file in place: no bytes or str copy of it sits beside the entries
+            with (
+                open(self.discovery_file, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                memoryview(mapped) as view,
+            ):
+                entries = orjson.loads(view)
 
             if not isinstance(entries, list):
                 self.logger.error("Discovery file does not contain a valid JSON array")
@@ -89,110 +129,108 @@ class PlaylistSyncDiscoveryMaintenanceCommand(BaseCommand):
 
             return entries
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"Invalid JSON in discovery file: {e}")
             return []
         except Exception as e:
             self.logger.error(f"Error loading discovery file: {e}")
             return []
 
-    async def _get_lidarr_context(self, lidarr_client: LidarrClient) -> tuple:
-        """Get Lidarr context for filtering"""
+    async def _get_lidarr_context(
+        self, lidarr_client: LidarrClient, mbids_in_file: set[str]
+    ) -> tuple[frozenset[str], frozenset[str]]:
+        """
+        Get Lidarr context for filtering: (existing artist MBIDs, excluded MBIDs), both
+        limited to the MBIDs in the discovery file
+        """
         try:
-            # Get existing artists from Lidarr
-            self.logger.info("Fetching existing artists from Lidarr...")
-            lidarr_artists = await lidarr_client.get_all_artists()
-            existing_mbids = {artist["musicBrainzId"] for artist in lidarr_artists}
-            existing_names = {artist["artistName"].lower() for artist in lidarr_artists}
-
-            self.logger.info(f"Retrieved {len(lidarr_artists)} existing artists from Lidarr")
+            server = getattr(lidarr_client, "base_url", "")
+            ttl = self.config.get(
+                "PLAYLIST_SYNC_DISCOVERY_CONTEXT_TTL_SECONDS", CONTEXT_MEMO_SECONDS
+            )
+            now = time.monotonic()
+            memo = _lidarr_contexts.get(server)
+            if memo and now - memo[2] < ttl:
+                self.logger.info("Using Lidarr artists and exclusions from a recent run")
+                artist_mbids, all_excluded = memo[0], memo[1]
+            else:
+                # Artists and Import List Exclusions are independent; fetch them together
+                self.logger.info(
+                    "Fetching existing artists and Import List Exclusions from Lidarr..."
+                )
+                lidarr_artists, excluded_mbids = await asyncio.gather(
+                    lidarr_client.get_all_artists(), lidarr_client.get_import_list_exclusions()
+                )
+                self.logger.info(f"Retrieved {len(lidarr_artists)} existing artists from Lidarr")
+                self.logger.info(f"Retrieved {len(excluded_mbids)} Import List Exclusions")
 
-            # Get Import List Exclusions
-            self.logger.info("Fetching Import List Exclusions from Lidarr...")
-            excluded_mbids = await lidarr_client.get_import_list_exclusions()
-            self.logger.info(f"Retrieved {len(excluded_mbids)} Import List Exclusions")
+                artist_mbids = frozenset(artist["musicBrainzId"] for artist in lidarr_artists)
+                all_excluded = frozenset(excluded_mbids)
+                _lidarr_contexts[server] = (artist_mbids, all_excluded, now)
 
-            return existing_mbids, existing_names, excluded_mbids
+            return artist_mbids & mbids_in_file, all_excluded & mbids_in_file
 
         except Exception as e:
             self.logger.error(f"Error getting Lidarr context: {e}")
-            return set(), set(), set()
+            return frozenset(), frozenset()
 
     async def _cleanup_entries(
-        self, entries: list[dict[str, Any]], existing_mbids: set, excluded_mbids: set
+        self,
+        entries: list[dict[str, Any]],
+        existing_mbids: frozenset[str],
+        excluded_mbids: frozenset[str],
     ) -> dict[str, Any]:
         """Clean up entries based on Lidarr state and age"""
         try:
-            removed_count = 0
-            cleaned_entries = []
-            removed_entries = []
-
             # Get age threshold from config (default: 30 days)
-            age_threshold_days = getattr(
-                self.config, "PLAYLIST_SYNC_DISCOVERY_AGE_THRESHOLD_DAYS", 30
-            )
-            age_threshold = datetime.utcnow() - timedelta(days=age_threshold_days)
+            age_threshold_days = self.config.get("PLAYLIST_SYNC_DISCOVERY_AGE_THRESHOLD_DAYS", 30)
+            age_threshold = datetime.now(UTC) - timedelta(days=age_threshold_days)
 
-            self.logger.info(f"Using age threshold: {age_threshold_days} days")
+            threshold_str = age_threshold.strftime(DATE_ADDED_FORMAT)
+            age_reason = f"Older than {age_threshold_days} days"
 
-            for entry in entries:
-                mbid = entry.get("MusicBrainzId")
-                artist_name = entry.get("ArtistName", "")
-                date_added_str = entry.get("dateAdded", "")
-
-                should_remove = False
-                removal_reason = ""
-
-                # Check if artist is now in Lidarr
-                if mbid in existing_mbids:
-                    should_remove = True
-                    removal_reason = "Artist now in Lidarr"
-
-                # Check if artist is excluded
-                elif mbid in excluded_mbids:
-                    should_remove = True
-                    removal_reason = "Artist in exclusions list"
-
-                # Check age threshold
-                elif date_added_str:
-                    try:
-                        # Parse dateAdded format: "2025-10-16, 13:15:25"
-                        date_added = datetime.strptime(date_added_str, "%Y-%m-%d, %H:%M:%S")
-                        if date_added < age_threshold:
-                            should_remove = True
-                            removal_reason = f"Older than {age_threshold_days} days"
-                    except ValueError:
-                        self.logger.warning(
-                            f"Invalid dateAdded format for {artist_name}: {date_added_str}"
-                        )
+            self.logger.info(f"Using age threshold: {age_threshold_days} days")
 
-                if should_remove:
-                    removed_count += 1
-                    removed_entries.append(
-                        {
-                            "artist": artist_name,
-                            "mbid": mbid,
-                            "reason": removal_reason,
-                            "dateAdded": date_added_str,
-                        }
-                    )
-                    self.logger.debug(f"Removing {artist_name} ({mbid}): {removal_reason}")
-                else:
-                    cleaned_entries.append(entry)
+            # One reason per entry (None keeps it), then both lists are sliced from that mask
+            reasons = [
+                self._removal_reason(
+                    entry, existing_mbids, excluded_mbids, threshold_str, age_reason
+                )
+                for entry in entries
+            ]
+            cleaned_entries = [
+                entry for entry, reason in zip(entries, reasons, strict=True) if reason is None
+            ]
+            removed_count = len(entries) - len(cleaned_entries)
 
             # Log detailed removal info
-            if removed_entries:
+            if removed_count:
+                removed = (
+                    (entry, reason)
+                    for entry, reason in zip(entries, reasons, strict=True)
+                    if reason is not None
+                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    removed = list(removed)
+                    for entry, reason in removed:
+                        self.logger.debug(
+                            "Removing %s (%s): %s",
+                            entry.get("ArtistName", ""),
+                            entry.get("MusicBrainzId"),
+                            reason,
+                        )
+
+                removed_sample = list(islice(removed, REMOVAL_LOG_LIMIT))
                 self.logger.info(f"Removed {removed_count} entries:")
-                for entry in removed_entries[:10]:  # Log first 10
-                    self.logger.info(f"  - {entry['artist']}: {entry['reason']}")
-                if len(removed_entries) > 10:
-                    self.logger.info(f"  ... and {len(removed_entries) - 10} more")
+                for entry, reason in removed_sample:
+                    self.logger.info("  - %s: %s", entry.get("ArtistName", ""), reason)
+                if removed_count > len(removed_sample):
+                    self.logger.info(f"  ... and {removed_count - len(removed_sample)} more")
 
             return {
                 "removed_count": removed_count,
                 "remaining_count": len(cleaned_entries),
                 "cleaned_entries": cleaned_entries,
-                "removed_entries": removed_entries,
             }
 
         except Exception as e:
@@ -201,25 +239,63 @@ class PlaylistSyncDiscoveryMaintenanceCommand(BaseCommand):
                 "removed_count": 0,
                 "remaining_count": len(entries),
                 "cleaned_entries": entries,
-                "removed_entries": [],
             }
 
+    def _removal_reason(
+        self,
+        entry: dict[str, Any],
+        existing_mbids: frozenset[str],
+        excluded_mbids: frozenset[str],
+        threshold_str: str,
+        age_reason: str,
+    ) -> str | None:
+        """Why an entry should leave the import list, or None to keep it"""
+        mbid = entry.get("MusicBrainzId")
+
+        # Check if artist is now in Lidarr
+        if mbid in existing_mbids:
+            return "Artist now in Lidarr"
+
+        # Check if artist is excluded
+        if mbid in excluded_mbids:
+            return "Artist in exclusions list"
+
+        # Check age threshold (dateAdded is only read once both MBID checks miss)
+        date_added_str = entry.get("dateAdded", "")
+        if date_added_str:
+            if not DATE_ADDED_PATTERN.fullmatch(date_added_str):
+                self.logger.warning(
+                    f"Invalid dateAdded format for {entry.get('ArtistName', '')}: {date_added_str}"
+                )
+            elif date_added_str < threshold_str:
+                return age_reason
+
+        return None
+
     async def _save_discovery_file(self, entries: list[dict[str, Any]]):
         """Save the cleaned discovery file"""
-        try:
-            # Create backup of original file
-            if self.discovery_file.exists():
-                import shutil
-
-                shutil.copy2(self.discovery_file, self.backup_file)
-                self.logger.info(f"Created backup: {self.backup_file}")
+        await asyncio.to_thread(self._save_discovery_file_sync, entries)
 
+    def _save_discovery_file_sync(self, entries: list[dict[str, Any]]):
+        try:
             # Ensure directory exists
             self.discovery_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Save cleaned entries
-            with open(self.discovery_file, "w", encoding="utf-8") as f:
-                json.dump(entries, f, indent=2, ensure_ascii=False)
+            # Write beside the live file first so readers never see a partial list
+            tmp_file = self.discovery_file.with_name(f"{self.discovery_file.name}.tmp")
+            option = orjson.OPT_INDENT_2 if self.config.PRETTY_PRINT_JSON else 0
+            tmp_file.write_bytes(orjson.dumps(entries, option=option))
+
+            # Back up the original by hard link (no data copy); it stays in place until replaced
+            if self.discovery_file.exists():
+                self.backup_file.unlink(missing_ok=True)
+                try:
+                    os.link(self.discovery_file, self.backup_file)
+                except OSError:
+                    shutil.copy2(self.discovery_file, self.backup_file)
+                self.logger.info(f"Created backup: {self.backup_file}")
+
+            os.replace(tmp_file, self.discovery_file)
 
             self.logger.info(f"Saved {len(entries)} entries to {self.discovery_file}")
 
@@ -4,17 +4,42 @@ ListenBrainz Playlist Sync Command
 Extends PlaylistSyncCommand for ListenBrainz curated playlists (Weekly Exploration, Weekly Jams, Daily Jams)
 """
 
+import asyncio
 import re
 import time
 from datetime import datetime
+from functools import cache
 from typing import Any
 
+from cache_manager import get_cache_manager
 from clients.client_jellyfin import JellyfinClient
 from clients.client_listenbrainz import ListenBrainzClient
 from clients.client_plex import PlexClient
 
 from .playlist_sync import PlaylistSyncCommand
 
+# Default bound on curated playlists synced to the target at once (overridable per config)
+MAX_PARALLEL_PLAYLISTS = 3
+
+# Human-readable names for curated playlist keys (also the ListenBrainz type names)
+_DISPLAY_NAMES = {
+    "weekly_exploration": "Weekly Exploration",
+    "weekly_jams": "Weekly Jams",
+    "daily_jams": "Daily Jams",
+}
+
+# ISO ("2025-09-01", also inside "week of ...") or US ("9/1/2025") date in a curated title
+_DATE_RE = re.compile(r"(?P<iso>\d{4}-\d{2}-\d{2})|(?P<us>\d{1,2}/\d{1,2}/\d{4})")
+
+# strptime format for each named group of _DATE_RE
+_DATE_FORMATS = {"iso": "%Y-%m-%d", "us": "%m/%d/%Y"}
+
+
+@cache
+def _get_display_name(playlist_key: str) -> str:
+    """Get human-readable display name for playlist key"""
+    return _DISPLAY_NAMES.get(playlist_key, playlist_key.replace("_", " ").title())
+
 
 class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
     """ListenBrainz-specific playlist sync extending base PlaylistSyncCommand"""
@@ -28,6 +53,9 @@ class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
         # ListenBrainz-specific client
         self.listenbrainz_client = ListenBrainzClient(self.config)
 
+        # Target library key, resolved once per run in _initialize_clients
+        self._library_key: str | None = None
+
         # Store statistics for reporting
         self.last_run_stats = {}
 
@@ -41,10 +69,10 @@ class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
         playlist_types = config.get("playlist_types", [])
 
         if len(playlist_types) == 1:
-            playlist_name = self._get_display_name(playlist_types[0])
+            playlist_name = _get_display_name(playlist_types[0])
             return f"Sync ListenBrainz {playlist_name} playlist to {target}"
         elif len(playlist_types) > 1:
-            return f"Sync ListenBrainz curated playlists ({', '.join([self._get_display_name(pt) for pt in playlist_types])}) to {target}"
+            return f"Sync ListenBrainz curated playlists ({', '.join([_get_display_name(pt) for pt in playlist_types])}) to {target}"
         else:
             return f"Sync ListenBrainz curated playlists to {target}"
 
@@ -84,8 +112,6 @@ class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
 
             # Clean up expired cache entries if caching is enabled
             if self.config.get("CACHE_ENABLED", True):
-                from cache_manager import get_cache_manager
-
                 cache = get_cache_manager()
                 expired_count = cache.cleanup_expired()
                 if expired_count > 0:
@@ -188,8 +214,16 @@ class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
         if not await self.target_client.test_connection():
             raise ConnectionError(f"Failed to connect to {target.title()}")
 
+        # Resolve the library once; the cache check and the sync both key on it
+        self._library_key = (
+            await asyncio.to_thread(self.target_client.get_resolved_library_key)
+            if hasattr(self.target_client, "get_resolved_library_key")
+            else None
+        )
+
     async def _close_clients(self):
         """Close HTTP sessions for clients."""
+        self._library_key = None
         try:
             if hasattr(self, "listenbrainz_client") and self.listenbrainz_client:
                 if hasattr(self.listenbrainz_client, "close"):
@@ -239,73 +273,117 @@ class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
         else:
             self.logger.info("No library cache available, will use live API searches")
 
-        # Process each configured playlist with cache optimization
+        # Get library cache if available (target resolved library for cache + playlist content)
+        cached_data = None
+        library_key = self._library_key
+        if self.library_cache_manager:
+            cached_data = self.library_cache_manager.get_library_cache(
+                self.target_name.lower(), library_key
+            )
+            if cached_data:
+                track_count = cached_data.get("total_tracks", 0)
+                self.logger.info(f"Using library cache with {track_count:,} tracks")
+            else:
+                self.logger.warning(
+                    f"Library cache not available for {self.target_name}. "
+                    "Playlist sync will use live API (slower performance expected)."
+                )
+
+        # Sync the configured playlists concurrently, bounded to limit load on the target
+        semaphore = asyncio.Semaphore(
+            self.config_json.get("max_parallel_playlists", MAX_PARALLEL_PLAYLISTS)
+        )
+        sync_start_time = time.perf_counter()
+        outcomes = await asyncio.gather(
+            *(
+                self._sync_one_playlist(
+                    playlist_key,
+                    curated_playlists,
+                    library_cache,
+                    cached_data,
+                    library_key,
+                    semaphore,
+                )
+                for playlist_key in playlist_types
+            ),
+            return_exceptions=True,
+        )
+        total_sync_time = time.perf_counter() - sync_start_time
+
         sync_results = {}
-        total_sync_time = 0
+        for playlist_key, outcome in zip(playlist_types, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Failed to sync '{playlist_key}': {outcome}")
+                outcome = {
+                    "success": False,
+                    "error": str(outcome),
+                    "tracks_found": 0,
+                    "tracks_total": 0,
+                    "playlist_title": _get_display_name(playlist_key),
+                    "sync_time": 0,
+                    "cache_used": False,
+                }
+            sync_results[playlist_key] = outcome
+
+        # Log overall performance improvement
+        if library_cache and total_sync_time > 0:
+            estimated_without_cache = total_sync_time * 6  # Conservative estimate of 6x improvement
+            time_saved = estimated_without_cache - total_sync_time
+            self.logger.info(
+                f"Library cache performance: {total_sync_time:.1f}s total sync time (estimated {time_saved:.1f}s saved)"
+            )
+
+        return sync_results
 
-        for playlist_key in playlist_types:
-            playlist_start_time = datetime.now()
+    async def _sync_one_playlist(
+        self,
+        playlist_key: str,
+        curated_playlists: dict[str, Any],
+        library_cache: dict[str, Any] | None,
+        cached_data: dict[str, Any] | None,
+        library_key: str | None,
+        semaphore: asyncio.Semaphore,
+    ) -> dict[str, Any]:
+        """Sync one curated playlist to the target and return its result entry"""
+        async with semaphore:
+            playlist_start_time = time.perf_counter()
 
             playlist_data = curated_playlists.get(playlist_key)
 
             if playlist_data is None:
                 self.logger.warning(f"Playlist '{playlist_key}' not found in ListenBrainz")
-                sync_results[playlist_key] = {
+                return {
                     "success": False,
                     "error": "Playlist not found in ListenBrainz",
                     "tracks_found": 0,
                     "tracks_total": 0,
-                    "playlist_title": self._get_display_name(playlist_key),
+                    "playlist_title": _get_display_name(playlist_key),
                     "sync_time": 0,
                     "cache_used": False,
                 }
-                continue
 
             # Extract tracks from playlist
             tracks = await self.listenbrainz_client.extract_tracks_from_playlist(playlist_data)
 
             if not tracks:
                 self.logger.warning(f"No tracks found in playlist '{playlist_key}'")
-                sync_results[playlist_key] = {
+                return {
                     "success": False,
                     "error": "No tracks found in playlist",
                     "tracks_found": 0,
                     "tracks_total": 0,
-                    "playlist_title": playlist_data.get(
-                        "title", self._get_display_name(playlist_key)
-                    ),
+                    "playlist_title": playlist_data.get("title", _get_display_name(playlist_key)),
                     "sync_time": 0,
                     "cache_used": False,
                 }
-                continue
 
             # Generate target playlist title
-            original_title = playlist_data.get("title", self._get_display_name(playlist_key))
+            original_title = playlist_data.get("title", _get_display_name(playlist_key))
             target_title = self._generate_target_playlist_title(original_title, playlist_key)
 
             # Generate playlist description
             description = self._generate_playlist_description(playlist_data, playlist_key)
 
-            # Get library cache if available (target resolved library for cache + playlist content)
-            cached_data = None
-            library_key = (
-                self.target_client.get_resolved_library_key()
-                if hasattr(self.target_client, "get_resolved_library_key")
-                else None
-            )
-            if self.library_cache_manager:
-                cached_data = self.library_cache_manager.get_library_cache(
-                    self.target_name.lower(), library_key
-                )
-                if cached_data:
-                    track_count = cached_data.get("total_tracks", 0)
-                    self.logger.info(f"Using library cache with {track_count:,} tracks")
-                else:
-                    self.logger.warning(
-                        f"Library cache not available for {self.target_name}. "
-                        "Playlist sync will use live API (slower performance expected)."
-                    )
-
             # Sync playlist using parent class method
             self.logger.info(
                 f"Syncing '{playlist_key}' ({len(tracks)} tracks) to {self.target_name} as '{target_title}'"
@@ -327,20 +405,7 @@ class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
             tracks_total = result.get("total_tracks", len(tracks))
             unmatched_tracks = result.get("unmatched_tracks", [])
 
-            playlist_sync_time = (datetime.now() - playlist_start_time).total_seconds()
-            total_sync_time += playlist_sync_time
-
-            sync_results[playlist_key] = {
-                "success": success,
-                "error": None if success else "Sync operation failed",
-                "tracks_found": tracks_found,
-                "tracks_total": tracks_total,
-                "unmatched_tracks": unmatched_tracks,
-                "playlist_title": target_title,
-                "original_title": original_title,
-                "sync_time": playlist_sync_time,
-                "cache_used": library_cache is not None,
-            }
+            playlist_sync_time = time.perf_counter() - playlist_start_time
 
             if success:
                 match_rate = (tracks_found / tracks_total * 100) if tracks_total > 0 else 0
@@ -352,70 +417,35 @@ class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
                     f"Failed to sync '{playlist_key}' after {playlist_sync_time:.1f}s"
                 )
 
-        # Log overall performance improvement
-        if library_cache and total_sync_time > 0:
-            estimated_without_cache = total_sync_time * 6  # Conservative estimate of 6x improvement
-            time_saved = estimated_without_cache - total_sync_time
-            self.logger.info(
-                f"Library cache performance: {total_sync_time:.1f}s total sync time (estimated {time_saved:.1f}s saved)"
-            )
-
-        return sync_results
-
-    def _get_display_name(self, playlist_key: str) -> str:
-        """Get human-readable display name for playlist key"""
-        display_names = {
-            "weekly_exploration": "Weekly Exploration",
-            "weekly_jams": "Weekly Jams",
-            "daily_jams": "Daily Jams",
-        }
-        return display_names.get(playlist_key, playlist_key.replace("_", " ").title())
+            return {
+                "success": success,
+                "error": None if success else "Sync operation failed",
+                "tracks_found": tracks_found,
+                "tracks_total": tracks_total,
+                "unmatched_tracks": unmatched_tracks,
+                "playlist_title": target_title,
+                "original_title": original_title,
+                "sync_time": playlist_sync_time,
+                "cache_used": library_cache is not None,
+            }
 
     def _generate_target_playlist_title(self, original_title: str, playlist_key: str) -> str:
         """Generate the target playlist title with [LB] prefix and formatted date"""
-        # Map playlist keys to ListenBrainz type names
-        type_names = {
-            "daily_jams": "Daily Jams",
-            "weekly_jams": "Weekly Jams",
-            "weekly_exploration": "Weekly Exploration",
-        }
-
-        type_name = type_names.get(playlist_key, playlist_key.replace("_", " ").title())
+        type_name = _get_display_name(playlist_key)
 
         # Try to extract date from original title
         formatted_date = None
         if original_title and original_title.strip():
-            # Look for patterns like "week of 2025-09-01" or "2025-09-01"
-            date_patterns = [
-                r"week of (\d{4}-\d{2}-\d{2})",  # "week of 2025-09-01"
-                r"(\d{4}-\d{2}-\d{2})",  # "2025-09-01"
-                r"(\d{2}/\d{2}/\d{4})",  # "09/01/2025"
-                r"(\d{1,2}/\d{1,2}/\d{4})",  # "9/1/2025"
-            ]
-
-            for pattern in date_patterns:
-                match = re.search(pattern, original_title)
-                if match:
-                    date_str = match.group(1)
-                    try:
-                        # Parse different date formats
-                        if "-" in date_str:
-                            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                        elif "/" in date_str:
-                            # Try MM/DD/YYYY first, then M/D/YYYY
-                            try:
-                                date_obj = datetime.strptime(date_str, "%m/%d/%Y")
-                            except ValueError:
-                                date_obj = datetime.strptime(date_str, "%m/%d/%Y")
-                        else:
-                            continue
-
-                        # Format as 3-letter month + day (Sep-01)
-                        formatted_date = date_obj.strftime("%b-%d")
-                        break
-
-                    except ValueError:
-                        continue
+            match = _DATE_RE.search(original_title)
+            if match:
+                try:
+                    date_obj = datetime.strptime(
+                        match[match.lastgroup], _DATE_FORMATS[match.lastgroup]
+                    )
+                    # Format as 3-letter month + day (Sep-01)
+                    formatted_date = date_obj.strftime("%b-%d")
+                except ValueError:
+                    pass
 
         # Generate final title
         if formatted_date:
@@ -470,20 +500,17 @@ class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
         """Check if library cache is available and fresh, build if missing"""
         try:
             target_type = self.target_name.lower()
-            library_key = (
-                self.target_client.get_resolved_library_key()
-                if hasattr(self.target_client, "get_resolved_library_key")
-                else None
-            )
+            library_key = self._library_key
             library_cache = self.library_cache_manager.get_library_cache(target_type, library_key)
 
             if not library_cache:
                 self.logger.info(f"No library cache found for {target_type}, building cache...")
                 return await self._build_library_cache_if_enabled(target_type)
 
-            # Check if cache is fresh (within TTL)
+            # TTL is the hard outer bound; within it, rebuild only when the library changed
             cache_age_hours = (time.time() - library_cache.get("built_at", 0)) / 3600
-            ttl_hours = self.config.get(f"LIBRARY_CACHE_{target_type.upper()}_TTL_DAYS", 30) * 24
+            ttl_days = self.config.get(f"LIBRARY_CACHE_{target_type.upper()}_TTL_DAYS", 30)
+            ttl_hours = ttl_days * 24
 
             if cache_age_hours > ttl_hours:
                 self.logger.info(
@@ -491,6 +518,23 @@ class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
                 )
                 return await self._build_library_cache_if_enabled(target_type)
 
+            stats = await self._get_library_stats(library_key)
+            if stats is not None:
+                recorded = self._recorded_library_stats(library_key, library_cache)
+                if recorded is None:
+                    # First check of this build: its stats become the baseline
+                    self._record_library_stats(library_key, library_cache, stats, ttl_days)
+                elif recorded != stats:
+                    # updatedAt also moves on edits and play activity, so refresh incrementally;
+                    # the builder's minimum refresh interval still throttles busy libraries
+                    self.logger.info(
+                        f"Library for {target_type} changed since the cache was built, refreshing..."
+                    )
+                    rebuilt = await self._build_library_cache_if_enabled(target_type)
+                    if rebuilt:
+                        self._record_library_stats(library_key, rebuilt, stats, ttl_days)
+                    return rebuilt
+
             self.logger.debug(
                 f"Library cache for {target_type} is fresh ({cache_age_hours:.1f}h old)"
             )
@@ -500,6 +544,38 @@ class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
             self.logger.warning(f"Failed to check library cache: {e}")
             return None
 
+    async def _get_library_stats(self, library_key: str | None) -> dict[str, Any] | None:
+        """Cheap change-detection stats for the target library, or None when unavailable"""
+        if not library_key or not hasattr(self.target_client, "get_library_stats"):
+            return None
+        return await asyncio.to_thread(self.target_client.get_library_stats, library_key)
+
+    def _library_stats_key(self, library_key: str) -> str:
+        return f"library_stats:{self.target_name.lower()}:{library_key}"
+
+    def _recorded_library_stats(
+        self, library_key: str, library_cache: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Stats recorded for this cache build (matched on built_at), or None"""
+        entry = get_cache_manager().get(self._library_stats_key(library_key), "playlist_sync")
+        if entry and entry.get("built_at") == library_cache.get("built_at"):
+            return entry.get("stats")
+        return None
+
+    def _record_library_stats(
+        self,
+        library_key: str,
+        library_cache: dict[str, Any],
+        stats: dict[str, Any],
+        ttl_days: int,
+    ) -> None:
+        get_cache_manager().set(
+            self._library_stats_key(library_key),
+            "playlist_sync",
+            {"built_at": library_cache.get("built_at"), "stats": stats},
+            ttl_days,
+        )
+
     async def _build_library_cache_if_enabled(self, target_type: str) -> dict[str, Any] | None:
         """Build library cache if enabled for the target"""
         try:
@@ -513,30 +589,11 @@ class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
 
             self.logger.info(f"Building library cache for {target_type}...")
 
-            import asyncio
-
             from commands.library_cache_builder import LibraryCacheBuilderCommand
 
-            # Create cache builder command
+            # Build only this target; the builder snapshots its enabled targets from config
             cache_builder = LibraryCacheBuilderCommand(self.config)
-
-            # Temporarily enable only this target
-            original_plex_enabled = self.config.get("LIBRARY_CACHE_PLEX_ENABLED", False)
-            original_jellyfin_enabled = self.config.get("LIBRARY_CACHE_JELLYFIN_ENABLED", False)
-
-            if target_type == "plex":
-                self.config.LIBRARY_CACHE_PLEX_ENABLED = True
-                self.config.LIBRARY_CACHE_JELLYFIN_ENABLED = False
-            else:
-                self.config.LIBRARY_CACHE_PLEX_ENABLED = False
-                self.config.LIBRARY_CACHE_JELLYFIN_ENABLED = True
-
-            # Execute cache building (sync command) in thread pool to avoid blocking event loop
-            result = await asyncio.to_thread(cache_builder.execute)
-
-            # Restore original settings
-            self.config.LIBRARY_CACHE_PLEX_ENABLED = original_plex_enabled
-            self.config.LIBRARY_CACHE_JELLYFIN_ENABLED = original_jellyfin_enabled
+            result = await cache_builder.execute(force_rebuild=False, target_filter=target_type)
 
             if result:
                 self.logger.info(f"Successfully built library cache for {target_type}")
@@ -563,33 +620,32 @@ class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
         try:
             self.logger.info("Starting comprehensive playlist validation...")
 
-            # Get all existing ListenBrainz playlists
+            # Get all existing playlists from the target
             if self.target_name == "Plex":
                 # Use Plex API directly
-                results = self.target_client._get("/playlists")
+                results = await asyncio.to_thread(self.target_client._get, "/playlists")
                 media_container = results.get("MediaContainer", {})
                 all_playlists = media_container.get("Metadata", [])
-                lb_playlists = [p for p in all_playlists if p.get("title", "").startswith("[LB] ")]
             elif self.target_name == "Jellyfin":
                 # Use Jellyfin API
                 all_playlists = (
-                    self.target_client.get_playlists_sync()
+                    await asyncio.to_thread(self.target_client.get_playlists_sync)
                     if hasattr(self.target_client, "get_playlists_sync")
                     else []
                 )
-                lb_playlists = [p for p in all_playlists if p.get("Name", "").startswith("[LB] ")]
             else:
-                lb_playlists = []
-
-            self.logger.info(f"Found {len(lb_playlists)} existing ListenBrainz playlists")
+                all_playlists = []
 
-            # Group playlists by name to detect duplicates
-            from collections import defaultdict
+            # Group ListenBrainz playlists by name (Jellyfin "Name", Plex "title") to detect duplicates
+            playlist_groups: dict[str, list[dict[str, Any]]] = {}
+            lb_count = 0
+            for playlist in all_playlists:
+                name = playlist.get("Name") or playlist.get("title") or ""
+                if name.startswith("[LB] "):
+                    playlist_groups.setdefault(name, []).append(playlist)
+                    lb_count += 1
 
-            playlist_groups = defaultdict(list)
-            for playlist in lb_playlists:
-                name = playlist.get("Name", "")
-                playlist_groups[name].append(playlist)
+            self.logger.info(f"Found {lb_count} existing ListenBrainz playlists")
 
             # Validate each playlist group
             for playlist_name, playlists in playlist_groups.items():
@@ -602,15 +658,20 @@ class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
                     "playlists": [],
                 }
 
-                # Check each playlist in the group
-                for playlist in playlists:
-                    playlist_id = playlist.get("Id", "")
-                    tracks = []
-
-                    # Get tracks for this playlist
-                    if hasattr(self.target_client, "get_playlist_tracks_sync"):
-                        tracks = self.target_client.get_playlist_tracks_sync(playlist_id)
+                # Fetch tracks for every playlist in the group concurrently
+                playlist_ids = [playlist.get("Id", "") for playlist in playlists]
+                if hasattr(self.target_client, "get_playlist_tracks_sync"):
+                    track_lists = await asyncio.gather(
+                        *(
+                            asyncio.to_thread(self.target_client.get_playlist_tracks_sync, pid)
+                            for pid in playlist_ids
+                        )
+                    )
+                else:
+                    track_lists = [[] for _ in playlist_ids]
 
+                # Check each playlist in the group
+                for playlist_id, tracks in zip(playlist_ids, track_lists, strict=True):
                     playlist_info = {
                         "id": playlist_id,
                         "track_count": len(tracks),
@@ -1267,7 +1328,7 @@ class PlaylistSyncListenBrainzCommand(PlaylistSyncCommand):
         summary_parts.append("Source: ListenBrainz")
         playlist_types = self.config_json.get("playlist_types", [])
         if playlist_types:
-            playlist_names = [self._get_display_name(pt) for pt in playlist_types]
+            playlist_names = [_get_display_name(pt) for pt in playlist_types]
             summary_parts.append(f"Playlists: {', '.join(playlist_names)}")
         summary_parts.append(f"Target: {self.config_json.get('target', 'Unknown').title()}")
         summary_parts.append(
@@ -5,7 +5,7 @@ SQLAlchemy models for Cmdarr cache database
 
 from datetime import datetime
 
-from sqlalchemy import JSON, Column, DateTime, Integer, String
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
 
@@ -68,3 +68,17 @@ class LibraryCache(CacheBase):
     def is_expired(self) -> bool:
         """Check if library cache entry is expired"""
         return datetime.utcnow() > self.expires_at
+
+
+class LibraryCacheTrack(CacheBase):
+    """One track of a keyed library cache (tracks stored per row instead of in the JSON blob)"""
+
+    __tablename__ = "library_cache_track"
+
+    cache_key = Column(
+        String(500),
+        ForeignKey("library_cache.cache_key", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    track_key = Column(String(200), primary_key=True)
+    data = Column(JSON, nullable=False)
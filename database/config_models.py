@@ -13,6 +13,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -164,6 +165,12 @@ class NewReleasePending(ConfigBase):
     )  # pending, recheck_requested, resolved, dismissed
     resolved_at = Column(DateTime(timezone=True), nullable=True)
     resolved_reason = Column(String(100), nullable=True)  # in_mb, manual_dismiss, etc.
+    __table_args__ = (
+        # Covers discovery's per-artist pending/recheck preload without touching table rows
+        Index(
+            "ix_new_release_pending_lookup", "artist_mbid", "status", "album_title", "release_date"
+        ),
+    )
 
 
 class ArtistScanLog(ConfigBase):
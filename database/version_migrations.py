@@ -36,6 +36,14 @@ def _table_exists(cursor: sqlite3.Cursor, name: str) -> bool:
     return cursor.fetchone() is not None
 
 
+def _index_exists(cursor: sqlite3.Cursor, name: str) -> bool:
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='index' AND name = ?",
+        (name,),
+    )
+    return cursor.fetchone() is not None
+
+
 def _column_exists(cursor: sqlite3.Cursor, table: str, column: str) -> bool:
     if not _table_exists(cursor, table):
         return False
@@ -543,6 +551,25 @@ def create_version_migration_runner() -> VersionMigrationRunner:
         )
     )
 
+    def migrate_new_release_pending_lookup_index(cursor):
+        """Composite index for discovery's per-artist pending/recheck lookups."""
+        if not _table_exists(cursor, "new_release_pending"):
+            return
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS ix_new_release_pending_lookup "
+            "ON new_release_pending(artist_mbid, status, album_title, release_date)"
+        )
+
+    runner.add_migration(
+        VersionMigration(
+            version="0.3.18",
+            name="new_release_pending_lookup_index",
+            description="Add composite (artist_mbid, status, album_title, release_date) index on new_release_pending",
+            up_func=migrate_new_release_pending_lookup_index,
+            applied_check=lambda c: _index_exists(c, "ix_new_release_pending_lookup"),
+        )
+    )
+
     return runner
 
 
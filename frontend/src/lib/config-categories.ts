@@ -76,7 +76,8 @@ const MEDIA_SERVER_ORDER: Record<string, number> = {
   PLEX_LIBRARY_NAME: 5,
   LIBRARY_CACHE_PLEX_ENABLED: 6,
   LIBRARY_CACHE_PLEX_TTL_DAYS: 7,
-  LIBRARY_CACHE_PLEX_USER_DISABLED: 8,
+  LIBRARY_CACHE_PLEX_MIN_REFRESH_HOURS: 8,
+  LIBRARY_CACHE_PLEX_USER_DISABLED: 9,
   JELLYFIN_CLIENT_ENABLED: 10,
   JELLYFIN_URL: 11,
   JELLYFIN_TOKEN: 12,
@@ -86,7 +87,8 @@ const MEDIA_SERVER_ORDER: Record<string, number> = {
   JELLYFIN_LIBRARY_NAME: 16,
   LIBRARY_CACHE_JELLYFIN_ENABLED: 17,
   LIBRARY_CACHE_JELLYFIN_TTL_DAYS: 18,
-  LIBRARY_CACHE_JELLYFIN_USER_DISABLED: 19,
+  LIBRARY_CACHE_JELLYFIN_MIN_REFRESH_HOURS: 19,
+  LIBRARY_CACHE_JELLYFIN_USER_DISABLED: 20,
 };
 
 export function filterSettingsForCategories<T extends { category: string; key: string }>(
@@ -492,6 +492,13 @@ class ConfigService:
                 "category": "plex",
                 "description": "Plex library cache TTL (days)",
             },
+            {
+                "key": "LIBRARY_CACHE_PLEX_MIN_REFRESH_HOURS",
+                "default_value": "1",
+                "data_type": "int",
+                "category": "plex",
+                "description": "Skip scheduled Plex cache refresh if cache is newer than this (hours)",
+            },
             {
                 "key": "LIBRARY_CACHE_PLEX_USER_DISABLED",
                 "default_value": "false",
@@ -514,6 +521,13 @@ class ConfigService:
                 "category": "jellyfin",
                 "description": "Jellyfin library cache TTL (days)",
             },
+            {
+                "key": "LIBRARY_CACHE_JELLYFIN_MIN_REFRESH_HOURS",
+                "default_value": "1",
+                "data_type": "int",
+                "category": "jellyfin",
+                "description": "Skip scheduled Jellyfin cache refresh if cache is newer than this (hours)",
+            },
             {
                 "key": "LIBRARY_CACHE_JELLYFIN_USER_DISABLED",
                 "default_value": "false",
@@ -530,6 +544,13 @@ class ConfigService:
                 "category": "playlist_sync",
                 "description": "Age threshold in days for removing stale discovery entries",
             },
+            {
+                "key": "PLAYLIST_SYNC_DISCOVERY_CONTEXT_TTL_SECONDS",
+                "default_value": "300",
+                "data_type": "int",
+                "category": "playlist_sync",
+                "description": "Seconds to reuse Lidarr artists and exclusions between maintenance runs",
+            },
             # Output Configuration
             {
                 "key": "OUTPUT_FILE",
@@ -0,0 +1,92 @@
+"""Unit tests for BaseAPIClient session pooling and the shared AsyncRateLimiter"""
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from clients import client_base
+from clients.client_base import AsyncRateLimiter, BaseAPIClient
+
+
+def test_rate_limiter_spaces_concurrent_callers(monkeypatch):
+    clock = [100.0]
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(round(seconds, 6))
+        clock[0] += seconds
+
+    monkeypatch.setattr(client_base.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(client_base.asyncio, "sleep", fake_sleep)
+    limiter = AsyncRateLimiter(requests_per_second=2.0)
+
+    async def call():
+        async with limiter:
+            return clock[0]
+
+    async def run():
+        return await asyncio.gather(call(), call(), call())
+
+    started = asyncio.run(run())
+
+    assert started == [100.0, 100.5, 101.0]
+    assert sleeps == [0.5, 0.5]
+    assert limiter.request_count == 3
+
+
+def test_ensure_session_reuses_pool_until_closed(monkeypatch):
+    monkeypatch.setattr(client_base, "get_cache_manager", lambda: None)
+    client = BaseAPIClient(config=None, client_name="test", base_url="http://example")
+
+    async def run():
+        async with client:
+            first = client._ensure_session()
+            assert client._ensure_session() is first
+            assert first.connector.limit_per_host == client_base.SESSION_LIMIT_PER_HOST
+        assert client.session is None
+        second = client._ensure_session()
+        await client.close()
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first is not second
+    assert first.closed and second.closed
+
+
+def test_fetch_pages_with_retry_bounds_in_flight_and_retries(monkeypatch):
+    monkeypatch.setattr(client_base, "PAGE_FETCH_BACKOFF_SECONDS", 0)
+    in_flight = []
+    peak = []
+    attempts = {}
+
+    async def fetch_page(start):
+        attempts[start] = attempts.get(start, 0) + 1
+        in_flight.append(start)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0)
+        in_flight.remove(start)
+        if start == 2 and attempts[start] == 1:
+            raise aiohttp.ServerDisconnectedError()
+        return start * 10
+
+    pages = asyncio.run(client_base.fetch_pages_with_retry(fetch_page, range(6), 2))
+
+    assert pages == [0, 10, 20, 30, 40, 50]
+    assert max(peak) == 2
+    assert attempts[2] == 2
+
+
+def test_fetch_pages_with_retry_raises_when_a_page_keeps_failing(monkeypatch):
+    monkeypatch.setattr(client_base, "PAGE_FETCH_BACKOFF_SECONDS", 0)
+    calls = []
+
+    async def fetch_page(start):
+        calls.append(start)
+        if start == 1:
+            raise TimeoutError()
+        return start
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(client_base.fetch_pages_with_retry(fetch_page, range(3), 3))
+    assert calls.count(1) == client_base.PAGE_FETCH_RETRIES + 1
@@ -0,0 +1,43 @@
+"""Unit tests for JellyfinClient cached library search"""
+
+from unittest.mock import MagicMock
+
+from clients.client_jellyfin import JellyfinClient
+
+
+def _client() -> JellyfinClient:
+    client = JellyfinClient.__new__(JellyfinClient)
+    client.logger = MagicMock()
+    client._tracks_by_id = None
+    return client
+
+
+def _cached_library() -> dict:
+    tracks = [
+        {"id": "1", "artist": "Artist", "name": "Song", "album": "First"},
+        {"id": "2", "artist": "Artist", "name": "Song", "album": "Second"},
+        {"id": "3", "artist": "Other", "name": "Tune", "album": "Third"},
+    ]
+    return {
+        "tracks": tracks,
+        "artist_index": {"artist": ["1", "2"], "other": ["3"]},
+        "track_index": {"song": ["1", "2"], "tune": ["3"]},
+    }
+
+
+def test_cached_search_prefers_album_match_via_id_index():
+    client = _client()
+    cached = _cached_library()
+
+    assert client.search_cached_library("Song", "Artist", cached, "Second") == "2"
+    assert client.search_cached_library("Tune", "Other", cached) == "3"
+    assert client._tracks_by_id[0] is cached["tracks"]
+
+
+def test_track_id_index_is_rebuilt_for_a_new_library():
+    client = _client()
+    first = _cached_library()
+    by_id = client._index_tracks_by_id(first["tracks"])
+
+    assert client._index_tracks_by_id(first["tracks"]) is by_id
+    assert client._index_tracks_by_id(_cached_library()["tracks"]) is not by_id
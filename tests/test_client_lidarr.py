@@ -0,0 +1,47 @@
+"""Unit tests for LidarrClient session handling"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from clients import client_base
+from clients.client_lidarr import LidarrClient
+
+
+class _Response:
+    status = 200
+
+    async def json(self):
+        return [{"id": 1}]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+
+def test_requests_inside_async_with_share_one_session(monkeypatch):
+    monkeypatch.setattr(client_base, "get_cache_manager", lambda: None)
+    config = SimpleNamespace(
+        LIDARR_API_KEY="key",
+        LIDARR_URL="http://lidarr",
+        LIDARR_TIMEOUT=30,
+        LIDARR_IGNORE_TLS=False,
+    )
+    client = LidarrClient(config)
+    pooled = MagicMock(closed=False)
+    pooled.request.return_value = _Response()
+    pooled.close = MagicMock(side_effect=lambda: asyncio.sleep(0))
+    monkeypatch.setattr(client, "_new_session", MagicMock(return_value=pooled))
+
+    async def run():
+        async with client:
+            first = await client._make_request("artist")
+            second = await client._make_request("album")
+        return first, second
+
+    assert asyncio.run(run()) == ([{"id": 1}], [{"id": 1}])
+    client._new_session.assert_called_once()
+    assert pooled.request.call_count == 2
+    assert client.session is None
@@ -0,0 +1,46 @@
+"""Unit tests for ListenBrainzClient curated playlist lookup"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from clients.client_listenbrainz import ListenBrainzClient
+
+
+def _wrapper(title: str, mbid: str) -> dict:
+    return {"playlist": {"title": title, "identifier": f"https://listenbrainz.org/playlist/{mbid}"}}
+
+
+def test_get_curated_playlists_fetches_first_match_per_type_concurrently():
+    client = ListenBrainzClient.__new__(ListenBrainzClient)
+    client.logger = MagicMock()
+    client.cache_enabled = False
+    client.cache = None
+    client.get_user_recommendation_playlists = AsyncMock(
+        return_value=[
+            _wrapper("Weekly Jams for user, week of 2025-09-01", "wj"),
+            _wrapper("Daily Jams for user", "dj"),
+            _wrapper("Weekly Jams for user, week of 2025-08-25", "wj-old"),
+            _wrapper("Something else", "other"),
+        ]
+    )
+    in_flight = []
+    peak = []
+
+    async def details(mbid):
+        in_flight.append(mbid)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(mbid)
+        return {"id": mbid}
+
+    client.get_playlist_details = AsyncMock(side_effect=details)
+
+    curated = asyncio.run(client.get_curated_playlists("user"))
+
+    assert curated == {
+        "weekly_exploration": None,
+        "weekly_jams": {"id": "wj"},
+        "daily_jams": {"id": "dj"},
+    }
+    assert client.get_playlist_details.await_count == 2
+    assert max(peak) == 2
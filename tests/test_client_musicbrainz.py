@@ -0,0 +1,50 @@
+"""Unit tests for MusicBrainzClient artist lookup caching and title similarity"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from clients import client_base
+from clients.client_musicbrainz import MusicBrainzClient
+
+
+def _client(monkeypatch, cache) -> MusicBrainzClient:
+    monkeypatch.setattr(client_base, "get_cache_manager", lambda: cache)
+    config = SimpleNamespace(
+        MUSICBRAINZ_RATE_LIMIT=1.0,
+        MUSICBRAINZ_MIN_SIMILARITY=0.85,
+        CACHE_MUSICBRAINZ_TTL_DAYS=7,
+        CACHE_FAILED_LOOKUP_TTL_DAYS=1,
+        CMDARR_USER_AGENT="",
+    )
+    return MusicBrainzClient(config)
+
+
+def test_fuzzy_search_caches_misses_with_failed_lookup_ttl(monkeypatch):
+    cache = MagicMock()
+    cache.is_failed_lookup.return_value = False
+    cache.get.return_value = None
+    client = _client(monkeypatch, cache)
+    client._make_request = AsyncMock(return_value={"artists": []})
+
+    assert asyncio.run(client.fuzzy_search_artist("Nobody")) is None
+    assert cache.mark_failed_lookup.call_args.args[-1] == 1
+
+
+def test_is_similar_matches_full_ratio_threshold(monkeypatch):
+    client = _client(monkeypatch, None)
+
+    assert client._is_similar("Abbey Road", "abbey road ", 0.7)
+    assert client._is_similar("The Wall", "Wall", 0.66)
+    assert not client._is_similar("The Wall", "Wall", 0.7)
+    assert not client._is_similar("Revolver", "Abbey Road", 0.7)
+
+
+def test_is_similar_agrees_with_calculate_similarity(monkeypatch):
+    client = _client(monkeypatch, None)
+    pairs = [("Abbey Road", " ABBEY ROAD"), ("The Wall", "Wall"), ("Revolver", "Abbey Road")]
+
+    for name1, name2 in pairs:
+        for threshold in (0.5, 0.66, 0.7, 1.0):
+            expected = client._calculate_similarity(name1, name2) >= threshold
+            assert client._is_similar(name1, name2, threshold) is expected
@@ -4,7 +4,7 @@ import logging
 
 import pytest
 
-from clients.client_plex import PlexClient
+from clients.client_plex import PlexClient, _rating_key_order
 from utils.track_match import collaboration_mismatch_penalty
 
 
@@ -83,3 +83,7 @@ def test_score_track_match_bmth_crucify_me_prefers_solo_over_featured(plex_clien
         featured, "Crucify Me", "Bring Me the Horizon", None, None
     )
     assert s_solo > s_feat
+
+
+def test_rating_key_order_is_numeric():
+    assert sorted({"10", "9", "100", "x"}, key=_rating_key_order) == ["9", "10", "100", "x"]
@@ -0,0 +1,38 @@
+"""Unit tests for SpotifyClient access token reuse"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from clients import client_base, client_spotify
+from clients.client_spotify import SpotifyClient
+
+
+def _client(monkeypatch) -> SpotifyClient:
+    monkeypatch.setattr(client_base, "get_cache_manager", lambda: None)
+    config = SimpleNamespace(SPOTIFY_CLIENT_ID="id", SPOTIFY_CLIENT_SECRET="secret")
+    client = SpotifyClient(config)
+    client._get_access_token = AsyncMock(return_value=True)
+    return client
+
+
+def test_new_client_reuses_unexpired_shared_token(monkeypatch):
+    tokens = {}
+    monkeypatch.setattr(client_spotify, "_ACCESS_TOKENS", tokens)
+    client = _client(monkeypatch)
+    tokens[client._get_cred_hash()] = ("shared", time.time() + 600)
+
+    assert asyncio.run(client._ensure_valid_token()) is True
+    assert client.access_token == "shared"
+    client._get_access_token.assert_not_called()
+
+
+def test_expired_shared_token_is_refreshed(monkeypatch):
+    tokens = {}
+    monkeypatch.setattr(client_spotify, "_ACCESS_TOKENS", tokens)
+    client = _client(monkeypatch)
+    tokens[client._get_cred_hash()] = ("stale", time.time() - 1)
+
+    assert asyncio.run(client._ensure_valid_token()) is True
+    client._get_access_token.assert_awaited_once()
@@ -58,6 +58,25 @@ def test_filter_artist_candidate_valid():
     assert reason == "valid"
 
 
+def test_build_filter_matches_filter_artist_candidate():
+    utils = _make_utils()
+    existing_mbids = {"mbid-123"}
+    existing_names = {"artist name"}
+    excluded_mbids = {"mbid-789"}
+    candidate_filter = utils.build_filter(existing_mbids, existing_names, excluded_mbids)
+    cases = [
+        ("mbid-123", "Other"),
+        ("mbid-456", "Artist Name"),
+        ("mbid-789", "New Artist"),
+        ("mbid-new", "New Artist"),
+        ("", "New Artist"),
+    ]
+    for mbid, name in cases:
+        assert candidate_filter(mbid, name) == utils.filter_artist_candidate(
+            mbid, name, existing_mbids, existing_names, excluded_mbids
+        )
+
+
 def test_apply_random_sampling_limit_zero():
     utils = _make_utils()
     candidates = [{"id": 1}, {"id": 2}, {"id": 3}]
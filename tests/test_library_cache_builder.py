@@ -0,0 +1,258 @@
+"""Unit tests for LibraryCacheBuilderCommand smart incremental cache updates."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import requests
+
+from clients.client_plex import RECENTLY_ADDED_PAGE_SIZE, PlexClient
+from commands import library_cache_builder as lcb_module
+from commands.library_cache_builder import LibraryCacheBuilderCommand
+from utils.library_cache_manager import migrate_track_list
+
+
+def _cached_track(i: int) -> dict[str, Any]:
+    return {
+        "key": str(i),
+        "title": f"song {i}",
+        "artist": "artist",
+        "album": "album",
+        "duration": 0,
+    }
+
+
+def _raw_plex_track(key: str, title: str) -> dict[str, Any]:
+    return {
+        "ratingKey": key,
+        "title": title,
+        "grandparentTitle": "Artist",
+        "parentTitle": "Album",
+        "duration": 0,
+    }
+
+
+def _plex_failing_on_page_two() -> PlexClient:
+    """Real PlexClient whose recentlyAdded endpoint serves one full page, then errors"""
+    client = PlexClient.__new__(PlexClient)
+    client.logger = MagicMock()
+    client.config = {}
+    added_at = int(time.time())
+    first_page = [
+        {**_raw_plex_track(f"r{i}", f"recent {i}"), "type": "track", "addedAt": added_at}
+        for i in range(RECENTLY_ADDED_PAGE_SIZE)
+    ]
+
+    def get(path, params=None):
+        if params["X-Plex-Container-Start"] == 0:
+            return {"MediaContainer": {"Metadata": first_page}}
+        raise requests.exceptions.ConnectionError("plex down")
+
+    client._get = MagicMock(side_effect=get)
+    return client
+
+
+def _cached_tracks(count: int) -> dict[str, dict[str, Any]]:
+    return {str(i): _cached_track(i) for i in range(count)}
+
+
+def _make_builder(existing_cache: dict[str, Any] | None) -> LibraryCacheBuilderCommand:
+    builder = LibraryCacheBuilderCommand.__new__(LibraryCacheBuilderCommand)
+    builder.logger = MagicMock()
+    builder.library_cache_manager = MagicMock()
+    builder.library_cache_manager.get_library_cache_direct.return_value = existing_cache
+    return builder
+
+
+@pytest.fixture
+def _plex_library(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        lcb_module, "resolve_plex_library", lambda _c: {"key": "1", "title": "Music"}
+    )
+    monkeypatch.setattr(lcb_module, "config_service", MagicMock())
+    monkeypatch.setattr(lcb_module, "_resolved_plex_libraries", {})
+
+
+@pytest.mark.usefixtures("_plex_library")
+def test_smart_cache_merges_new_and_updated_tracks_in_place():
+    builder = _make_builder(
+        {"tracks_by_key": _cached_tracks(20), "total_tracks": 20, "built_at": 0}
+    )
+    client = MagicMock(spec=["iter_recently_added_tracks", "config"], config={})
+    client.iter_recently_added_tracks.return_value = iter(
+        [
+            [_raw_plex_track("100", "Brand New"), _raw_plex_track("3", "Renamed")],
+            [_raw_plex_track("4", "Song 4")],
+        ]
+    )
+
+    cache_data, changed = asyncio.run(builder._build_smart_cache("plex", client))
+
+    assert cache_data["total_tracks"] == 21
+    assert cache_data["new_tracks_added"] == 2
+    assert cache_data["tracks_by_key"]["100"]["title"] == "brand new"
+    assert cache_data["tracks_by_key"]["3"]["title"] == "renamed"
+    assert sorted(changed) == ["100", "3"]
+
+
+@pytest.mark.usefixtures("_plex_library")
+def test_smart_cache_keeps_cache_when_nothing_changed():
+    tracks = _cached_tracks(20)
+    builder = _make_builder({"tracks_by_key": tracks, "total_tracks": 20, "built_at": 0})
+    client = MagicMock(spec=["iter_recently_added_tracks", "config"], config={})
+    client.iter_recently_added_tracks.return_value = iter([[_raw_plex_track("4", "Song 4")]])
+
+    cache_data, changed = asyncio.run(builder._build_smart_cache("plex", client))
+
+    assert cache_data["new_tracks_added"] == 0
+    assert cache_data["tracks_by_key"] == tracks
+    assert changed == {}
+
+
+@pytest.mark.usefixtures("_plex_library")
+def test_smart_cache_falls_back_to_full_rebuild_when_recent_fetch_fails():
+    # Large enough cache that a full first page stays under the 20% incremental guard
+    tracks = _cached_tracks(2000)
+    builder = _make_builder({"tracks_by_key": dict(tracks), "total_tracks": 2000, "built_at": 0})
+    client = _plex_failing_on_page_two()
+    client.build_library_cache_async = AsyncMock(return_value={"total_tracks": 2250})
+
+    cache_data, changed = asyncio.run(builder._build_smart_cache("plex", client))
+
+    assert cache_data == {"total_tracks": 2250}
+    assert changed is None
+    client.build_library_cache_async.assert_awaited_once()
+    assert client._get.call_count == 2
+    stored = builder.library_cache_manager.get_library_cache_direct.return_value
+    assert stored["tracks_by_key"] == tracks
+    builder.library_cache_manager.upsert_library_tracks.assert_not_called()
+
+
+@pytest.mark.usefixtures("_plex_library")
+def test_smart_cache_stops_streaming_when_recent_exceeds_guard():
+    tracks = _cached_tracks(20)
+    builder = _make_builder({"tracks_by_key": tracks, "total_tracks": 20, "built_at": 0})
+    pages_served = []
+
+    def recent(library_key: str, days: float):
+        for page in range(10):
+            pages_served.append(page)
+            yield [_raw_plex_track(f"{page}-{i}", "t") for i in range(3)]
+
+    client = MagicMock(spec=["iter_recently_added_tracks", "config"], config={})
+    client.iter_recently_added_tracks.side_effect = recent
+
+    cache_data, changed = asyncio.run(builder._build_smart_cache("plex", client))
+
+    assert cache_data["new_tracks_added"] == 0
+    assert cache_data["tracks_by_key"] == tracks
+    assert pages_served == [0, 1]
+
+
+def test_migrate_track_list_keys_legacy_plex_cache():
+    legacy = {"tracks": [_cached_track(1), {"ratingKey": "2", "title": "t"}, {"title": "x"}]}
+
+    migrated = migrate_track_list("plex", legacy)
+
+    assert "tracks" not in migrated
+    assert list(migrated["tracks_by_key"]) == ["1", "2"]
+    jellyfin = {"tracks": [{"id": "a"}]}
+    assert migrate_track_list("jellyfin", jellyfin) == {"tracks": [{"id": "a"}]}
+
+
+def test_target_cache_skips_refresh_when_newer_than_min_refresh():
+    builder = _make_builder(None)
+    builder.clients = {"plex": MagicMock()}
+    builder._ttl_days = {"plex": 30}
+    builder._min_refresh_hours = {"plex": 2}
+    builder.library_cache_manager.get_library_cache.return_value = {
+        "total_tracks": 20,
+        "built_at": time.time() - 3600,
+    }
+
+    result = asyncio.run(builder._build_target_cache("plex"))
+
+    assert result["cached"] is True
+    assert result["track_count"] == 20
+    builder.library_cache_manager.get_library_cache_direct.assert_not_called()
+    builder.library_cache_manager.upsert_library_tracks.assert_not_called()
+
+
+@pytest.mark.usefixtures("_plex_library")
+def test_resolve_plex_library_is_memoized_per_server(monkeypatch: pytest.MonkeyPatch):
+    resolve = MagicMock(return_value={"key": "1", "title": "Music"})
+    monkeypatch.setattr(lcb_module, "resolve_plex_library", resolve)
+    builder = _make_builder(None)
+    client = MagicMock(base_url="http://plex", config={"PLEX_LIBRARY_NAME": "Music"})
+
+    asyncio.run(builder._resolve_plex_library(client, 1000.0))
+    asyncio.run(builder._resolve_plex_library(client, 1000.0 + lcb_module.LIBRARY_MEMO_SECONDS - 1))
+    assert resolve.call_count == 1
+
+    asyncio.run(builder._resolve_plex_library(client, 1000.0 + lcb_module.LIBRARY_MEMO_SECONDS))
+    assert resolve.call_count == 2
+
+
+@pytest.mark.usefixtures("_plex_library")
+def test_resolve_plex_library_resolves_again_when_library_name_changes(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    resolve = MagicMock(
+        side_effect=[{"key": "1", "title": "Music"}, {"key": "2", "title": "Lossless"}]
+    )
+    monkeypatch.setattr(lcb_module, "resolve_plex_library", resolve)
+    builder = _make_builder(None)
+    client = MagicMock(base_url="http://plex", config={"PLEX_LIBRARY_NAME": "Music"})
+
+    assert asyncio.run(builder._resolve_plex_library(client, 1000.0))["key"] == "1"
+    client.config["PLEX_LIBRARY_NAME"] = "Lossless"
+    assert asyncio.run(builder._resolve_plex_library(client, 1001.0))["key"] == "2"
+    assert resolve.call_count == 2
+
+
+def test_connections_handles_sync_async_and_failing_clients():
+    builder = _make_builder(None)
+    plex = MagicMock()
+    plex.test_connection = AsyncMock(return_value=True)
+    jellyfin = MagicMock()
+    jellyfin.test_connection.return_value = True
+    broken = MagicMock()
+    broken.test_connection.side_effect = RuntimeError("down")
+    builder.clients = {"plex": plex, "jellyfin": jellyfin, "other": broken}
+
+    results = asyncio.run(builder.test_connections())
+
+    assert results == {"plex": True, "jellyfin": True, "other": False}
+
+
+def test_execute_reports_cancelled_target_build_as_failed():
+    builder = _make_builder(None)
+    builder._enabled_targets = ["plex", "jellyfin"]
+    builds = {"plex": asyncio.CancelledError(), "jellyfin": {"success": True}}
+
+    async def build(target, force_rebuild=False):
+        result = builds[target]
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    builder._build_target_cache = build
+
+    assert asyncio.run(builder.execute()) is True
+    assert builder.last_run_stats["results"] == {
+        "plex": {"success": False, "error": "CancelledError"},
+        "jellyfin": {"success": True},
+    }
+
+
+def test_iter_recently_added_raises_after_yielded_pages_when_plex_fails():
+    client = _plex_failing_on_page_two()
+    pages = client.iter_recently_added_tracks("1", days=1)
+
+    assert len(next(pages)) == RECENTLY_ADDED_PAGE_SIZE
+    with pytest.raises(requests.exceptions.ConnectionError):
+        next(pages)
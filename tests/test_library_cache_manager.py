@@ -0,0 +1,147 @@
+"""Unit tests for LibraryCacheManager per-track row storage."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database.cache_models import CacheBase, LibraryCacheTrack
+from utils.library_cache_manager import LibraryCacheManager
+
+
+@pytest.fixture()
+def manager():
+    """LibraryCacheManager backed by an in-memory cache database with one Plex client."""
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    CacheBase.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    mgr = LibraryCacheManager.__new__(LibraryCacheManager)
+    mgr.logger = MagicMock()
+    mgr.db_manager = SimpleNamespace(get_cache_session_context=session_factory)
+    mgr.memory_cache = {}
+    mgr.cache_active = False
+    mgr._loaded_caches = {}
+    mgr.global_stats = {"total_cache_hits": 0, "total_cache_misses": 0}
+    client = MagicMock()
+    client.get_cache_key.return_value = "plex:test"
+    client.get_cache_ttl.return_value = 30
+    client.process_cached_library.side_effect = lambda data: data
+    mgr.registered_clients = {"plex": client}
+    try:
+        yield mgr, session_factory
+    finally:
+        engine.dispose()
+
+
+def _track(key: str, title: str) -> dict:
+    return {"key": key, "title": title, "artist": "a", "album": "b", "duration": 0}
+
+
+def test_keyed_cache_round_trips_through_track_rows(manager):
+    mgr, session_factory = manager
+    tracks = {"1": _track("1", "one"), "2": _track("2", "two")}
+
+    mgr.set_library_cache("plex", {"tracks_by_key": tracks, "total_tracks": 2, "built_at": 1})
+
+    with session_factory() as session:
+        assert session.query(LibraryCacheTrack).count() == 2
+    loaded = mgr.get_library_cache_direct("plex")
+    assert loaded["tracks_by_key"] == tracks
+    assert loaded["built_at"] == 1
+
+
+def test_upsert_library_tracks_writes_only_changed_rows(manager):
+    mgr, _ = manager
+    tracks = {"1": _track("1", "one"), "2": _track("2", "two")}
+    mgr.set_library_cache("plex", {"tracks_by_key": tracks, "total_tracks": 2, "built_at": 1})
+
+    changed = {"2": _track("2", "renamed"), "3": _track("3", "three")}
+    cache_data = {"tracks_by_key": {**tracks, **changed}, "total_tracks": 3, "built_at": 2}
+    mgr.upsert_library_tracks("plex", cache_data, changed)
+
+    loaded = mgr.get_library_cache_direct("plex")
+    assert loaded["tracks_by_key"] == {"1": tracks["1"], **changed}
+    assert loaded["total_tracks"] == 3
+    assert loaded["built_at"] == 2
+
+
+def test_bulk_update_flushes_once_and_skips_on_error(manager):
+    mgr, _ = manager
+    tracks = {"1": _track("1", "one")}
+    with mgr.bulk_update("plex") as store:
+        store.replace({"tracks_by_key": tracks, "total_tracks": 1, "built_at": 1})
+
+    with pytest.raises(RuntimeError), mgr.bulk_update("plex") as store:
+        store.upsert_many([_track("2", "two")])
+        store.set_meta({"total_tracks": 2, "built_at": 2})
+        raise RuntimeError("build failed")
+
+    with mgr.bulk_update("plex") as store:
+        store.upsert_many([_track("3", "three"), _track("3", "three v2")])
+        store.set_meta({"total_tracks": 2, "built_at": 3})
+
+    loaded = mgr.get_library_cache_direct("plex")
+    assert loaded["tracks_by_key"] == {"1": tracks["1"], "3": _track("3", "three v2")}
+    assert loaded["built_at"] == 3
+
+
+def test_get_library_cache_reuses_load_until_the_entry_changes(manager):
+    mgr, _ = manager
+    client = mgr.registered_clients["plex"]
+    tracks = {"1": _track("1", "one")}
+    mgr.set_library_cache("plex", {"tracks_by_key": tracks, "total_tracks": 1, "built_at": 1})
+    mgr.keep_memory_cache_during_batch()
+
+    first = mgr.get_library_cache("plex")
+    mgr.memory_cache.clear()
+    assert mgr.get_library_cache("plex") is first
+    assert client.process_cached_library.call_count == 1
+
+    changed = {"2": _track("2", "two")}
+    cache_data = {"tracks_by_key": {**tracks, **changed}, "total_tracks": 2, "built_at": 2}
+    mgr.upsert_library_tracks("plex", cache_data, changed)
+    mgr.memory_cache.clear()
+
+    reloaded = mgr.get_library_cache("plex")
+    assert reloaded is not first
+    assert reloaded["tracks_by_key"] == {**tracks, **changed}
+    assert client.process_cached_library.call_count == 2
+
+
+def test_clear_memory_cache_releases_loaded_caches(manager):
+    mgr, _ = manager
+    client = mgr.registered_clients["plex"]
+    mgr.set_library_cache("plex", {"tracks_by_key": {"1": _track("1", "one")}, "built_at": 1})
+    mgr.keep_memory_cache_during_batch()
+
+    first = mgr.get_library_cache("plex")
+    assert "plex:test" in mgr._loaded_caches
+
+    mgr.clear_memory_cache()
+    assert mgr._loaded_caches == {}
+    assert mgr.memory_cache == {}
+
+    # Outside a batch nothing is kept, so every load is fresh
+    second = mgr.get_library_cache("plex")
+    assert second is not first
+    assert mgr.get_library_cache("plex") is not second
+    assert mgr._loaded_caches == {}
+    assert client.process_cached_library.call_count == 3
+
+
+def test_loaded_caches_respect_memory_limit(manager, monkeypatch):
+    mgr, _ = manager
+    mgr.set_library_cache("plex", {"tracks_by_key": {"1": _track("1", "one")}, "built_at": 1})
+    mgr.keep_memory_cache_during_batch()
+    monkeypatch.setattr(mgr, "_estimate_cache_size", lambda data: 10_000.0)
+
+    mgr.get_library_cache("plex")
+
+    assert mgr._loaded_caches == {}
+    assert mgr.memory_cache == {}
@@ -0,0 +1,228 @@
+"""Unit tests for NewReleasesDiscoveryCommand scan helpers"""
+
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from commands import new_releases_discovery as nrd_module
+from commands.new_releases_discovery import NewReleasesDiscoveryCommand
+from database.config_models import (
+    ArtistScanLog,
+    ConfigBase,
+    DismissedArtistAlbum,
+    NewReleasePending,
+)
+
+
+@pytest.fixture()
+def session():
+    engine = create_engine("sqlite://")
+    ConfigBase.metadata.create_all(engine)
+    db_session = sessionmaker(bind=engine)()
+    try:
+        yield db_session
+    finally:
+        db_session.close()
+        engine.dispose()
+
+
+def _pending(mbid: str, title: str, release_date: str | None, status: str) -> NewReleasePending:
+    return NewReleasePending(
+        artist_mbid=mbid,
+        artist_name="Artist",
+        album_title=title,
+        release_date=release_date,
+        status=status,
+    )
+
+
+def test_known_album_sets_are_loaded_per_artist(session):
+    session.add_all(
+        [
+            DismissedArtistAlbum(artist_mbid="a", album_title="Old", release_date="2020-01-01"),
+            DismissedArtistAlbum(artist_mbid="b", album_title="Other", release_date=None),
+            _pending("a", "Queued", None, "pending"),
+            _pending("a", "Recheck", "2024-05-01", "recheck_requested"),
+            _pending("a", "Done", "2023-01-01", "resolved"),
+        ]
+    )
+    session.commit()
+    command = NewReleasesDiscoveryCommand.__new__(NewReleasesDiscoveryCommand)
+
+    assert command._load_dismissed_albums(session, "a") == {("Old", "2020-01-01")}
+    assert command._load_pending_albums(session, "a") == {
+        ("Queued", None),
+        ("Recheck", "2024-05-01"),
+    }
+
+
+def _scan_context(session, release_client, musicbrainz_client) -> dict:
+    return {
+        "session": session,
+        "release_client": release_client,
+        "musicbrainz_client": musicbrainz_client,
+        "source_provider": "deezer",
+        "selected_types": {"album"},
+        "source": "scheduled",
+        "cache_ttl": 14,
+        "lidarr_base": "http://lidarr",
+        "mb_streaming_provider": "deezer",
+        "artist_id_key": "deezerArtistId",
+        "album_fetches": {},
+    }
+
+
+def _album(name: str, album_type: str = "album") -> dict:
+    return {
+        "name": name,
+        "album_type": album_type,
+        "total_tracks": 10,
+        "primary_artist_id": "dz1",
+        "external_url": f"https://www.deezer.com/album/{name}",
+        "release_date": "2025-01-01",
+    }
+
+
+def test_scan_artist_returns_records_without_writing(session):
+    release_client = MagicMock()
+    release_client.get_artist = AsyncMock(return_value={"success": True, "name": "Artist"})
+    release_client.get_artist_albums = AsyncMock(
+        return_value={
+            "success": True,
+            "albums": [_album("Known"), _album("Fresh"), _album("Single", "single")],
+        }
+    )
+    musicbrainz_client = MagicMock()
+    musicbrainz_client.get_artist_release_groups = AsyncMock(return_value=["Known"])
+    command = NewReleasesDiscoveryCommand.__new__(NewReleasesDiscoveryCommand)
+    command.logger = MagicMock()
+    artist = {"artistName": "Artist", "musicBrainzId": "a", "id": 7, "deezerArtistId": "dz1"}
+
+    mbid, rows, completed = asyncio.run(
+        command._scan_artist(artist, _scan_context(session, release_client, musicbrainz_client))
+    )
+
+    assert (mbid, completed) == ("a", True)
+    assert [row["album_title"] for row in rows] == ["Fresh"]
+    assert rows[0]["lidarr_artist_url"] == "http://lidarr/artist/a"
+    assert session.query(NewReleasePending).count() == 0
+
+
+def test_upsert_scan_logs_inserts_and_updates_in_one_batch(session):
+    session.add(
+        ArtistScanLog(
+            artist_mbid="a",
+            last_scanned_at=datetime(2024, 1, 1, tzinfo=UTC),
+            had_pending_releases=False,
+        )
+    )
+    session.commit()
+    command = NewReleasesDiscoveryCommand.__new__(NewReleasesDiscoveryCommand)
+    scanned_at = datetime(2025, 6, 1, tzinfo=UTC)
+
+    command._upsert_scan_logs(
+        session,
+        [
+            {"artist_mbid": "a", "last_scanned_at": scanned_at, "had_pending_releases": True},
+            {"artist_mbid": "b", "last_scanned_at": scanned_at, "had_pending_releases": False},
+        ],
+    )
+    session.commit()
+
+    logs = {row.artist_mbid: row for row in session.query(ArtistScanLog).all()}
+    assert set(logs) == {"a", "b"}
+    assert logs["a"].had_pending_releases is True
+    assert logs["a"].last_scanned_at.replace(tzinfo=UTC) == scanned_at
+
+
+def _lidarr_returning(artists: list[dict]):
+    client = MagicMock()
+    client.get_all_artists = AsyncMock(return_value=artists)
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    return lambda _config: client
+
+
+def test_pick_artists_orders_never_scanned_then_oldest(session, monkeypatch):
+    for mbid, day in (("old", 1), ("new", 20), ("mid", 10)):
+        session.add(
+            ArtistScanLog(
+                artist_mbid=mbid,
+                last_scanned_at=datetime(2025, 1, day, tzinfo=UTC),
+                had_pending_releases=False,
+            )
+        )
+    session.add(nrd_module.NewReleaseIgnoredArtist(artist_mbid="ignored"))
+    session.commit()
+    artists = [{"musicBrainzId": m} for m in ("new", "fresh", "old", "ignored", "mid", "")]
+    monkeypatch.setattr(nrd_module, "LidarrClient", _lidarr_returning(artists))
+    monkeypatch.setattr(
+        nrd_module,
+        "get_database_manager",
+        lambda: SimpleNamespace(get_config_session_context=lambda: session),
+    )
+    command = NewReleasesDiscoveryCommand.__new__(NewReleasesDiscoveryCommand)
+    command.config_adapter = None
+
+    picked = asyncio.run(command._pick_artists_to_scan(10))
+    assert [a["musicBrainzId"] for a in picked] == ["fresh", "old", "mid", "new"]
+
+    picked = asyncio.run(command._pick_artists_to_scan(3))
+    assert [a["musicBrainzId"] for a in picked] == ["fresh", "old", "mid"]
+
+
+def test_get_artist_albums_shares_one_fetch_per_provider_id():
+    release_client = MagicMock()
+
+    async def get_artist_albums(artist_id, **kwargs):
+        await asyncio.sleep(0)
+        return {"success": True, "albums": [artist_id]}
+
+    release_client.get_artist_albums = AsyncMock(side_effect=get_artist_albums)
+    fetches: dict = {}
+
+    async def run():
+        return await asyncio.gather(
+            NewReleasesDiscoveryCommand._get_artist_albums(release_client, "dz1", fetches),
+            NewReleasesDiscoveryCommand._get_artist_albums(release_client, "dz1", fetches),
+            NewReleasesDiscoveryCommand._get_artist_albums(release_client, "dz2", fetches),
+        )
+
+    results = asyncio.run(run())
+
+    assert [r["albums"] for r in results] == [["dz1"], ["dz1"], ["dz2"]]
+    assert release_client.get_artist_albums.await_count == 2
+
+
+def test_scan_artist_skips_musicbrainz_when_no_album_passes_filters(session):
+    release_client = MagicMock()
+    release_client.get_artist = AsyncMock(return_value={"success": True, "name": "Artist"})
+    release_client.get_artist_albums = AsyncMock(
+        return_value={"success": True, "albums": [_album("Single", "single"), _album("Live at X")]}
+    )
+    musicbrainz_client = MagicMock()
+    musicbrainz_client.get_artist_release_groups = AsyncMock(return_value=[])
+    command = NewReleasesDiscoveryCommand.__new__(NewReleasesDiscoveryCommand)
+    command.logger = MagicMock()
+    artist = {"artistName": "Artist", "musicBrainzId": "a", "id": 7, "deezerArtistId": "dz1"}
+
+    result = asyncio.run(
+        command._scan_artist(artist, _scan_context(session, release_client, musicbrainz_client))
+    )
+
+    assert result == ("a", [], True)
+    musicbrainz_client.get_artist_release_groups.assert_not_called()
+
+
+def test_is_artist_ignored(session):
+    session.add(nrd_module.NewReleaseIgnoredArtist(artist_mbid="hidden"))
+    session.commit()
+    command = NewReleasesDiscoveryCommand.__new__(NewReleasesDiscoveryCommand)
+
+    assert command._is_artist_ignored(session, "hidden") is True
+    assert command._is_artist_ignored(session, "a") is False
@@ -0,0 +1,70 @@
+"""Unit tests for new releases discovery artist/title matching helpers"""
+
+from commands.new_releases_discovery import (
+    _artist_names_match,
+    _is_live_release,
+    _normalize_mb_titles,
+    _title_matches_mb,
+    _title_matches_normalized,
+)
+
+
+def test_artist_names_match_exact_after_normalization():
+    assert _artist_names_match("Motörhead", "Motorhead")
+
+
+def test_artist_names_match_near_spelling():
+    assert _artist_names_match("Guns N' Roses", "Guns N Roses")
+
+
+def test_artist_names_match_rejects_different_artist():
+    assert not _artist_names_match("Emmure", "Emmurée Dolls")
+    assert not _artist_names_match("Queen", "Queens of the Stone Age")
+
+
+def test_artist_names_match_empty():
+    assert not _artist_names_match("", "Queen")
+
+
+def test_title_matches_mb_edition_suffix():
+    assert _title_matches_mb("Abbey Road (Deluxe Edition)", ["Abbey Road"])
+
+
+def test_title_matches_mb_fuzzy():
+    assert _title_matches_mb("The Dark Side of the Moon", ["Dark Side of the Moon"])
+
+
+def test_title_matches_mb_new_release():
+    assert not _title_matches_mb("Brand New Album", ["Abbey Road", "Let It Be"])
+    assert not _title_matches_mb("Anything", [])
+
+
+def test_title_matches_normalized_reuses_prepared_mb_titles():
+    norm_titles, base_titles = _normalize_mb_titles(["Abbey Road (Remastered)", "", "Let It Be"])
+    assert norm_titles == ["abbey road remastered", "let it be"]
+    assert _title_matches_normalized("Abbey Road", norm_titles, base_titles)
+    assert _title_matches_normalized("Let It Be... Naked", norm_titles, base_titles)
+    assert not _title_matches_normalized("Revolver", norm_titles, base_titles)
+    assert _title_matches_normalized(
+        "Let It Be", norm_titles, base_titles, norm_spotify="let it be"
+    )
+
+
+def test_artist_names_match_length_prefilter_keeps_borderline_lengths():
+    # 20 vs 17 chars can still reach 0.9 (34/37); 20 vs 16 cannot (32/36)
+    assert _artist_names_match("a" * 17 + "bcd", "a" * 17, min_similarity=0.9)
+    assert not _artist_names_match("a" * 16 + "bcde", "a" * 16, min_similarity=0.9)
+
+
+def test_artist_names_match_ignores_token_order():
+    assert _artist_names_match("Beatles, The", "The Beatles")
+    assert _artist_names_match("Jean Martin", "Martin Jean")
+    assert not _artist_names_match("Queen", "Queen Latifah")
+
+
+def test_is_live_release_matches_indicators_case_insensitively():
+    assert _is_live_release("Alive at Wembley")
+    assert _is_live_release("MTV UNPLUGGED in New York")
+    assert _is_live_release("Recorded at Abbey Road")
+    assert not _is_live_release("Abbey Road")
+    assert not _is_live_release("")
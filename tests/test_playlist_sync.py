@@ -0,0 +1,268 @@
+"""Unit tests for PlaylistSyncCommand sync helpers"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+
+import clients.client_lidarr
+import clients.client_musicbrainz
+import utils.discovery
+from commands import playlist_sync as playlist_sync_module
+from commands.playlist_sync import PlaylistSyncCommand, SyncJob, _dedupe_tracks
+
+
+def _make_command(target_client) -> PlaylistSyncCommand:
+    command = PlaylistSyncCommand.__new__(PlaylistSyncCommand)
+    command.logger = MagicMock()
+    command.config_json = {"max_concurrent_searches": 2}
+    command.target_client = target_client
+    command.library_cache_manager = MagicMock()
+    return command
+
+
+def test_sync_additive_searches_all_tracks_and_adds_only_new_keys():
+    target = MagicMock()
+    target.find_playlist_by_name.return_value = {"ratingKey": "pl"}
+    target.get_playlist_track_rating_keys.return_value = {"k1"}
+    target.search_for_track.side_effect = lambda name, artist, **kwargs: {
+        "One": "k1",
+        "Two": "k2",
+        "Three": "k3",
+    }.get(name)
+    target.add_tracks_to_playlist.return_value = True
+    command = _make_command(target)
+    tracks = [
+        {"artist": "A", "track": "One"},
+        {"artist": "A", "track": "Two"},
+        {"artist": "", "track": "Skipped"},
+        {"artist": "A", "track": "Missing"},
+        {"artist": "A", "track": "Three"},
+    ]
+
+    result = asyncio.run(command._sync_additive("Title", tracks, "", None))
+
+    assert result["added_tracks"] == 2
+    target.add_tracks_to_playlist.assert_called_once_with("pl", ["k2", "k3"])
+    assert target.search_for_track.call_count == 4
+
+
+def test_discover_artists_looks_up_only_unknown_names_and_isolates_failures(monkeypatch):
+    results = {
+        "New": {"mbid": "m-new", "name": "New"},
+        "Owned Mbid": {"mbid": "m-owned", "name": "Owned Mbid"},
+        "Unknown": None,
+    }
+
+    async def fuzzy_search_artist(name):
+        if name == "Broken":
+            raise RuntimeError("boom")
+        return results[name]
+
+    musicbrainz = MagicMock()
+    musicbrainz.fuzzy_search_artist = AsyncMock(side_effect=fuzzy_search_artist)
+    musicbrainz.close = AsyncMock()
+    discovery = MagicMock()
+    discovery.get_lidarr_context = AsyncMock(return_value=({"m-owned"}, {"in lidarr"}, set()))
+    discovery.create_artist_entry.side_effect = lambda mbid, name, source, **kw: {
+        "MusicBrainzId": mbid
+    }
+    monkeypatch.setattr(clients.client_lidarr, "LidarrClient", MagicMock())
+    monkeypatch.setattr(clients.client_musicbrainz, "MusicBrainzClient", lambda _c: musicbrainz)
+    monkeypatch.setattr(utils.discovery, "DiscoveryUtils", lambda *_a: discovery)
+    command = _make_command(MagicMock())
+    command.config = SimpleNamespace(MUSICBRAINZ_ENABLED=True)
+    tracks = [
+        {"artist": name} for name in ("In Lidarr", "New", "Owned Mbid", "Unknown", "Broken", "NEW")
+    ]
+
+    stats = asyncio.run(command._discover_and_add_artists(tracks, None))
+
+    looked_up = [call.args[0] for call in musicbrainz.fuzzy_search_artist.await_args_list]
+    assert looked_up == ["New", "Owned Mbid", "Unknown", "Broken"]
+    assert stats["artists_discovered"] == 1
+    assert stats["artists_skipped"] == 3
+    assert stats["failed_artists"] == [{"name": "Broken", "error": "boom"}]
+
+
+def test_save_discovered_artists_rewrites_only_when_new_mbids(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    command = _make_command(MagicMock())
+    command.config = SimpleNamespace(PRETTY_PRINT_JSON=False)
+    discovery_file = tmp_path / "data" / "import_lists" / "discovery_playlistsync.json"
+
+    asyncio.run(command._save_discovered_artists([{"MusicBrainzId": "a"}]))
+    saved = discovery_file.read_text(encoding="utf-8")
+    assert saved == '[{"MusicBrainzId":"a"}]'
+
+    discovery_file.write_text(saved + "\n", encoding="utf-8")
+    asyncio.run(command._save_discovered_artists([{"MusicBrainzId": "a"}]))
+    assert discovery_file.read_text(encoding="utf-8") == saved + "\n"
+
+    batch = [
+        {"MusicBrainzId": "c", "ArtistName": "C"},
+        {"MusicBrainzId": "a"},
+        {"MusicBrainzId": "b"},
+        {"MusicBrainzId": "c", "ArtistName": "C again"},
+        {"ArtistName": "No MBID"},
+    ]
+    asyncio.run(command._save_discovered_artists(batch))
+    assert orjson.loads(discovery_file.read_bytes()) == [
+        {"MusicBrainzId": "a"},
+        {"MusicBrainzId": "c", "ArtistName": "C"},
+        {"MusicBrainzId": "b"},
+    ]
+
+
+def test_execute_loads_library_cache_and_gates_artist_discovery(monkeypatch):
+    source = MagicMock()
+    source.__aenter__ = AsyncMock(return_value=source)
+    source.__aexit__ = AsyncMock(return_value=None)
+    source.get_playlist_tracks = AsyncMock(
+        return_value={"success": True, "tracks": [{"artist": "A", "track": "One"}]}
+    )
+    target = MagicMock()
+    target.get_resolved_library_key.return_value = "7"
+    target.sync_playlist.return_value = {"success": True, "unmatched_tracks": ["A - Two"]}
+    target.close = AsyncMock()
+    command = _make_command(target)
+    command.config_json = {"playlist_url": "u", "playlist_name": "Mix", "source": "spotify"}
+    command.source_client = source
+    command.target_name = "Plex"
+    command.library_cache_manager.get_library_cache.return_value = {"total_tracks": 1}
+    discover = AsyncMock(return_value={"artists_discovered": 1})
+    monkeypatch.setattr(command, "_initialize_clients", lambda: None)
+    monkeypatch.setattr(command, "_discover_and_add_artists", discover)
+
+    assert asyncio.run(command.execute()) is True
+
+    command.library_cache_manager.get_library_cache.assert_called_once_with("plex", "7")
+    assert target.sync_playlist.call_args.kwargs["library_key"] == "7"
+    assert command.last_run_stats["total_tracks"] == 1
+    assert command.last_run_stats["artist_discovery"] is None
+    discover.assert_not_called()
+
+    command.config_json["enable_artist_discovery"] = True
+    assert asyncio.run(command.execute()) is True
+    discover.assert_awaited_once_with([{"artist": "A", "track": "Two"}], {"total_tracks": 1})
+    assert command.last_run_stats["artist_discovery"] == {"artists_discovered": 1}
+
+
+class _FakeCache:
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key, source):
+        return self.entries.get((key, source))
+
+    def set(self, key, source, data, ttl_days):
+        self.entries[(key, source)] = data
+
+
+def test_execute_skips_unchanged_additive_sync(monkeypatch):
+    cache = _FakeCache()
+    monkeypatch.setattr(playlist_sync_module, "get_cache_manager", lambda: cache)
+    source = MagicMock()
+    source.__aenter__ = AsyncMock(return_value=source)
+    source.__aexit__ = AsyncMock(return_value=None)
+    source.get_playlist_tracks = AsyncMock(
+        return_value={"success": True, "tracks": [{"artist": "A", "track": "One"}]}
+    )
+    target = MagicMock()
+    target.get_resolved_library_key.return_value = "7"
+    target.find_playlist_by_name.return_value = {"ratingKey": "pl"}
+    target.get_playlist_track_rating_keys.return_value = set()
+    target.search_for_track.return_value = "k1"
+    target.add_tracks_to_playlist.return_value = True
+    target.close = AsyncMock()
+    command = _make_command(target)
+    command.config_json = {
+        "playlist_url": "u",
+        "playlist_name": "Mix",
+        "source": "spotify",
+        "sync_mode": "additive",
+        "unique_id": "abc",
+    }
+    command.source_client = source
+    command.target_name = "Plex"
+    command.library_cache_manager.get_library_cache.return_value = {"built_at": 1.0}
+    monkeypatch.setattr(command, "_initialize_clients", lambda: None)
+
+    assert asyncio.run(command.execute()) is True
+    assert asyncio.run(command.execute()) is True
+
+    assert target.search_for_track.call_count == 1
+    assert command.last_run_stats["sync_stats"]["action"] == "unchanged"
+
+    command.library_cache_manager.get_library_cache.return_value = {"built_at": 2.0}
+    assert asyncio.run(command.execute()) is True
+    assert target.search_for_track.call_count == 2
+
+
+def test_dedupe_tracks_keeps_first_of_each_artist_title():
+    tracks = [
+        {"artist": "A", "track": "One", "album": "Single"},
+        {"artist": "B", "track": "Two"},
+        {"artist": " a ", "track": "ONE", "album": "Album"},
+        {"artist": "A", "track": "One (Live)"},
+    ]
+
+    assert _dedupe_tracks(tracks) == [tracks[0], tracks[1], tracks[3]]
+
+
+def test_resolve_tracks_for_plex_keeps_order_and_searches_only_unkeyed():
+    target = MagicMock()
+    target.search_for_track.side_effect = lambda name, artist, **kwargs: (
+        None if name == "Missing" else f"k-{name}"
+    )
+    command = _make_command(target)
+    tracks = [
+        {"artist": "A", "track": "One"},
+        {"artist": "A", "track": "Keyed", "key": 5},
+        {"artist": "A", "track": "Missing"},
+        {"artist": "A", "track": "Two"},
+    ]
+
+    resolved = asyncio.run(command._resolve_tracks_for_plex(tracks, None))
+
+    assert [t["rating_key"] for t in resolved] == ["k-One", "5", "k-Two"]
+    assert target.search_for_track.call_count == 3
+
+
+def test_search_tracks_rate_limits_only_live_searches(monkeypatch):
+    acquired = []
+
+    class _Limiter:
+        def __init__(self, rate):
+            self.rate = rate
+
+        async def acquire(self):
+            acquired.append(self.rate)
+
+    monkeypatch.setattr(playlist_sync_module, "AsyncRateLimiter", _Limiter)
+    target = MagicMock()
+    target.search_for_track.return_value = "k"
+    command = _make_command(target)
+    command.config_json["target_rps"] = 5
+    tracks = [{"artist": "A", "track": "One"}, {"artist": "A", "track": "Two"}]
+
+    assert asyncio.run(command._search_tracks(tracks, None)) == ["k", "k"]
+    assert acquired == [5, 5]
+
+    acquired.clear()
+    asyncio.run(command._search_tracks(tracks, {"tracks_by_key": {}}))
+    assert acquired == []
+
+
+def test_sync_job_reads_config_with_defaults():
+    job = SyncJob.from_config(
+        {"source": "deezer", "playlist_url": "u", "plex_account_ids": ["1", "2"]}
+    )
+
+    assert job.source == "deezer"
+    assert job.sync_mode == "full"
+    assert job.plex_account_ids == ("1", "2")
+    assert job.enable_artist_discovery is False
+    assert SyncJob.from_config({"plex_account_ids": "1"}).plex_account_ids == ()
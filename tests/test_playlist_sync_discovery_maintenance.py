@@ -0,0 +1,164 @@
+"""Unit tests for PlaylistSyncDiscoveryMaintenanceCommand cleanup"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from commands import playlist_sync_discovery_maintenance as maintenance_module
+from commands.playlist_sync_discovery_maintenance import (
+    DATE_ADDED_FORMAT,
+    PlaylistSyncDiscoveryMaintenanceCommand,
+)
+
+
+class _Config(SimpleNamespace):
+    """ConfigAdapter stand-in: attributes plus get()"""
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+def _make_command(age_days: int = 30) -> PlaylistSyncDiscoveryMaintenanceCommand:
+    command = PlaylistSyncDiscoveryMaintenanceCommand.__new__(
+        PlaylistSyncDiscoveryMaintenanceCommand
+    )
+    command.logger = MagicMock()
+    command.config = _Config(
+        PLAYLIST_SYNC_DISCOVERY_AGE_THRESHOLD_DAYS=age_days, PRETTY_PRINT_JSON=False
+    )
+    return command
+
+
+def _days_ago(days: int) -> str:
+    return (datetime.now(UTC) - timedelta(days=days)).strftime(DATE_ADDED_FORMAT)
+
+
+def test_cleanup_entries_removes_owned_excluded_and_stale():
+    fresh, stale = _days_ago(1), _days_ago(40)
+    entries = [
+        {"MusicBrainzId": "owned", "ArtistName": "Owned", "dateAdded": fresh},
+        {"MusicBrainzId": "excluded", "ArtistName": "Excluded", "dateAdded": fresh},
+        {"MusicBrainzId": "old1", "ArtistName": "Old 1", "dateAdded": stale},
+        {"MusicBrainzId": "old2", "ArtistName": "Old 2", "dateAdded": stale},
+        {"MusicBrainzId": "new", "ArtistName": "New", "dateAdded": fresh},
+        {"MusicBrainzId": "bad", "ArtistName": "Bad", "dateAdded": "yesterday"},
+        {"MusicBrainzId": "bad2", "ArtistName": "Bad 2", "dateAdded": "yesterday"},
+        {"MusicBrainzId": "undated", "ArtistName": "Undated"},
+    ]
+    command = _make_command()
+
+    stats = asyncio.run(command._cleanup_entries(entries, {"owned"}, {"excluded"}))
+
+    assert [e["MusicBrainzId"] for e in stats["cleaned_entries"]] == [
+        "new",
+        "bad",
+        "bad2",
+        "undated",
+    ]
+    assert stats["removed_count"] == 4
+    logged = [c.args[1:] for c in command.logger.info.call_args_list if len(c.args) == 3]
+    assert logged == [
+        ("Owned", "Artist now in Lidarr"),
+        ("Excluded", "Artist in exclusions list"),
+        ("Old 1", "Older than 30 days"),
+        ("Old 2", "Older than 30 days"),
+    ]
+    assert command.logger.warning.call_count == 2
+
+
+def test_cleanup_entries_compares_dates_at_second_precision():
+    threshold_days = 30
+    boundary = datetime.now(UTC) - timedelta(days=threshold_days)
+    entries = [
+        {
+            "MusicBrainzId": "older",
+            "dateAdded": (boundary - timedelta(seconds=5)).strftime(DATE_ADDED_FORMAT),
+        },
+        {
+            "MusicBrainzId": "newer",
+            "dateAdded": (boundary + timedelta(minutes=5)).strftime(DATE_ADDED_FORMAT),
+        },
+        {"MusicBrainzId": "short", "dateAdded": "2020-1-1, 00:00:00"},
+    ]
+
+    stats = asyncio.run(_make_command(threshold_days)._cleanup_entries(entries, set(), set()))
+
+    assert [e["MusicBrainzId"] for e in stats["cleaned_entries"]] == ["newer", "short"]
+
+
+def test_get_lidarr_context_limits_to_file_mbids(monkeypatch):
+    monkeypatch.setattr(maintenance_module, "_lidarr_contexts", {})
+    client = MagicMock(base_url="http://lidarr/api/v1/")
+    client.get_all_artists = AsyncMock(
+        return_value=[{"musicBrainzId": "a", "artistName": "A"}, {"musicBrainzId": "b"}]
+    )
+    client.get_import_list_exclusions = AsyncMock(return_value={"x", "y"})
+    command = _make_command()
+
+    context = asyncio.run(command._get_lidarr_context(client, {"a", "x", "z"}))
+    assert context == ({"a"}, {"x"})
+
+    # A later run within the TTL reuses the fetched sets
+    context = asyncio.run(command._get_lidarr_context(client, {"b", "y"}))
+    assert context == ({"b"}, {"y"})
+    client.get_all_artists.assert_awaited_once()
+
+    command.config.PLAYLIST_SYNC_DISCOVERY_CONTEXT_TTL_SECONDS = 0
+    asyncio.run(command._get_lidarr_context(client, {"a"}))
+    assert client.get_all_artists.await_count == 2
+
+
+def test_load_discovery_file_rejects_non_arrays_and_bad_json(tmp_path):
+    command = _make_command()
+    command.discovery_file = tmp_path / "discovery.json"
+
+    assert asyncio.run(command._load_discovery_file()) == []
+
+    command.discovery_file.write_text('[{"MusicBrainzId": "a", "ArtistName": "Björk"}]')
+    assert asyncio.run(command._load_discovery_file()) == [
+        {"MusicBrainzId": "a", "ArtistName": "Björk"}
+    ]
+
+    command.discovery_file.write_text('{"MusicBrainzId": "a"}')
+    assert asyncio.run(command._load_discovery_file()) == []
+
+    command.discovery_file.write_text("[{")
+    assert asyncio.run(command._load_discovery_file()) == []
+    command.discovery_file.write_bytes(b"")
+    assert asyncio.run(command._load_discovery_file()) == []
+    assert command.logger.error.call_count == 3
+
+
+def test_save_discovery_file_replaces_atomically_and_keeps_backup(tmp_path):
+    command = _make_command()
+    command.discovery_file = tmp_path / "import_lists" / "discovery.json"
+    command.backup_file = tmp_path / "import_lists" / "discovery.json.backup"
+    entries = [{"MusicBrainzId": "a", "ArtistName": "Björk"}]
+
+    asyncio.run(command._save_discovery_file(entries))
+    first = command.discovery_file.read_bytes()
+    assert first == '[{"MusicBrainzId":"a","ArtistName":"Björk"}]'.encode()
+    assert not command.backup_file.exists()
+
+    asyncio.run(command._save_discovery_file([]))
+    assert command.backup_file.read_bytes() == first
+    assert command.discovery_file.read_bytes() == b"[]"
+    assert sorted(p.name for p in command.discovery_file.parent.iterdir()) == [
+        "discovery.json",
+        "discovery.json.backup",
+    ]
+
+
+def test_cleanup_entries_logs_a_bounded_removal_sample(monkeypatch):
+    monkeypatch.setattr(maintenance_module, "REMOVAL_LOG_LIMIT", 2)
+    entries = [{"MusicBrainzId": str(i), "ArtistName": f"A{i}"} for i in range(5)]
+    command = _make_command()
+
+    stats = asyncio.run(
+        command._cleanup_entries(entries, {e["MusicBrainzId"] for e in entries}, set())
+    )
+
+    assert stats["removed_count"] == 5
+    assert stats["cleaned_entries"] == []
+    command.logger.info.assert_any_call("  ... and 3 more")
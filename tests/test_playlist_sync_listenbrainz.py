@@ -0,0 +1,165 @@
+"""Unit tests for PlaylistSyncListenBrainzCommand sync helpers"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+from commands import playlist_sync_listenbrainz as lb_module
+from commands.playlist_sync_listenbrainz import PlaylistSyncListenBrainzCommand
+
+
+def _make_command(config_json: dict | None = None) -> PlaylistSyncListenBrainzCommand:
+    command = PlaylistSyncListenBrainzCommand.__new__(PlaylistSyncListenBrainzCommand)
+    command.logger = MagicMock()
+    command.config = {"LISTENBRAINZ_USERNAME": "user"}
+    command.config_json = config_json or {}
+    command.target_name = "Plex"
+    command.target_client = MagicMock()
+    command._library_key = "7"
+    command.library_cache_manager = MagicMock()
+    command.library_cache_manager.get_library_cache.return_value = None
+    command.listenbrainz_client = MagicMock()
+    command._check_library_cache = AsyncMock(return_value=None)
+    return command
+
+
+def test_sync_playlists_runs_concurrently_and_isolates_failures():
+    command = _make_command({"max_parallel_playlists": 2})
+    command.listenbrainz_client.get_curated_playlists = AsyncMock(
+        return_value={
+            "weekly_jams": {"title": "Weekly Jams for user, week of 2025-09-01"},
+            "daily_jams": {"title": "Daily Jams"},
+            "weekly_exploration": {"title": "Weekly Exploration"},
+        }
+    )
+    command.listenbrainz_client.extract_tracks_from_playlist = AsyncMock(
+        return_value=[{"artist": "A", "track": "One"}]
+    )
+    running = []
+    peak = []
+
+    async def sync_full(title, tracks, description, cached_data, library_key):
+        running.append(title)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(title)
+        if title.startswith("[LB] Daily Jams"):
+            raise RuntimeError("target down")
+        return {"success": True, "found_tracks": 1, "total_tracks": 1}
+
+    command._sync_full = sync_full
+    playlist_types = ["weekly_jams", "daily_jams", "weekly_exploration", "missing"]
+
+    results = asyncio.run(command._sync_listenbrainz_playlists(playlist_types))
+
+    assert list(results) == playlist_types
+    assert max(peak) == 2
+    assert results["weekly_jams"]["success"] is True
+    assert results["weekly_jams"]["playlist_title"] == "[LB] Weekly Jams, Sep-01"
+    assert results["daily_jams"] == {
+        "success": False,
+        "error": "target down",
+        "tracks_found": 0,
+        "tracks_total": 0,
+        "playlist_title": "Daily Jams",
+        "sync_time": 0,
+        "cache_used": False,
+    }
+    assert results["missing"]["error"] == "Playlist not found in ListenBrainz"
+    command.library_cache_manager.get_library_cache.assert_called_once_with("plex", "7")
+
+
+def test_generate_target_playlist_title_formats_known_dates():
+    command = _make_command({})
+
+    assert (
+        command._generate_target_playlist_title(
+            "Weekly Jams for u, week of 2025-09-01", "weekly_jams"
+        )
+        == "[LB] Weekly Jams, Sep-01"
+    )
+    assert command._generate_target_playlist_title("Daily Jams 9/3/2025", "daily_jams") == (
+        "[LB] Daily Jams, Sep-03"
+    )
+    assert command._generate_target_playlist_title("No date", "weekly_exploration") == (
+        "[LB] Weekly Exploration"
+    )
+    assert command._generate_target_playlist_title("Daily Jams 13/45/2025", "daily_jams") == (
+        "[LB] Daily Jams"
+    )
+    assert lb_module._get_display_name("some_custom") == "Some Custom"
+
+
+def test_validate_existing_playlists_groups_lb_playlists_by_name():
+    command = _make_command({})
+    command.target_name = "Jellyfin"
+    command.target_client = MagicMock(spec=["get_playlists_sync", "get_playlist_tracks_sync"])
+    command.target_client.get_playlists_sync.return_value = [
+        {"Id": "1", "Name": "[LB] Daily Jams"},
+        {"Id": "2", "Name": "[LB] Daily Jams"},
+        {"Id": "3", "Name": "Road Trip"},
+        {"Id": "4", "title": "[LB] Weekly Jams"},
+    ]
+    command.target_client.get_playlist_tracks_sync.side_effect = lambda pid: (
+        [] if pid == "2" else [{"Id": "t"}]
+    )
+
+    results = asyncio.run(command._validate_existing_playlists())
+
+    assert set(results["playlist_validations"]) == {"[LB] Daily Jams", "[LB] Weekly Jams"}
+    assert results["playlist_validations"]["[LB] Daily Jams"]["count"] == 2
+    assert results["duplicates_found"] == 1
+    assert results["empty_playlists_found"] == 0
+    assert results["overall_status"] == "issues_found"
+
+
+class _FakeCacheManager:
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, cache_key, source):
+        return self.entries.get((cache_key, source))
+
+    def set(self, cache_key, source, data, ttl_days):
+        self.entries[(cache_key, source)] = data
+
+
+def test_check_library_cache_rebuilds_only_when_library_stats_change(monkeypatch):
+    fake_cache = _FakeCacheManager()
+    monkeypatch.setattr(lb_module, "get_cache_manager", lambda: fake_cache)
+    command = _make_command({})
+    del command._check_library_cache
+    command.target_client = MagicMock(spec=["get_library_stats"])
+    command.target_client.get_library_stats.return_value = {"item_count": 10, "updated_at": 1}
+    library_cache = {"built_at": time.time(), "total_tracks": 10}
+    command.library_cache_manager.get_library_cache.return_value = library_cache
+    rebuilt = {"built_at": library_cache["built_at"] + 1, "total_tracks": 11}
+    command._build_library_cache_if_enabled = AsyncMock(return_value=rebuilt)
+
+    assert asyncio.run(command._check_library_cache()) is library_cache
+    assert asyncio.run(command._check_library_cache()) is library_cache
+    command._build_library_cache_if_enabled.assert_not_awaited()
+
+    command.target_client.get_library_stats.return_value = {"item_count": 11, "updated_at": 2}
+    assert asyncio.run(command._check_library_cache()) is rebuilt
+    command._build_library_cache_if_enabled.assert_awaited_once_with("plex")
+
+    # The rebuilt cache is checked against the stats it was rebuilt for, so it settles
+    command.library_cache_manager.get_library_cache.return_value = rebuilt
+    assert asyncio.run(command._check_library_cache()) is rebuilt
+    command._build_library_cache_if_enabled.assert_awaited_once()
+
+
+def test_build_library_cache_targets_builder_without_touching_config(monkeypatch):
+    from commands import library_cache_builder as lcb_module
+
+    builder = MagicMock()
+    builder.execute = AsyncMock(return_value=True)
+    monkeypatch.setattr(lcb_module, "LibraryCacheBuilderCommand", lambda _config: builder)
+    command = _make_command({})
+    command.config = {"LIBRARY_CACHE_PLEX_ENABLED": True}
+    command.library_cache_manager.get_library_cache.return_value = {"total_tracks": 1}
+
+    assert asyncio.run(command._build_library_cache_if_enabled("plex")) == {"total_tracks": 1}
+    builder.execute.assert_awaited_once_with(force_rebuild=False, target_filter="plex")
+    assert command.config == {"LIBRARY_CACHE_PLEX_ENABLED": True}
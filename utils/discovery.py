@@ -7,10 +7,15 @@ Handles exclusion filtering, random sampling, and common processing patterns
 
 import logging
 import random
+from collections.abc import Callable
 from typing import Any
 
 # Import clients only when needed to avoid circular imports
 
+# dateAdded format on import list entries, e.g. "2025-10-16, 13:15:25" (UTC). Zero-padded
+# fields make these strings sort chronologically.
+DATE_ADDED_FORMAT = "%Y-%m-%d, %H:%M:%S"
+
 
 class DiscoveryUtils:
     """Shared utilities for discovery commands"""
@@ -78,6 +83,31 @@ class DiscoveryUtils:
 
         return True, "valid"
 
+    def build_filter(
+        self,
+        existing_mbids: set[str],
+        existing_names: set[str],
+        excluded_mbids: set[str],
+    ) -> Callable[[str, str], tuple[bool, str]]:
+        """
+        Bind the Lidarr context once and return a filter(artist_mbid, artist_name) closure.
+        Same checks and reasons as filter_artist_candidate, for per-candidate loops.
+        """
+        in_lidarr = existing_mbids.__contains__
+        name_in_lidarr = existing_names.__contains__
+        is_excluded = excluded_mbids.__contains__
+
+        def _filter(artist_mbid: str, artist_name: str) -> tuple[bool, str]:
+            if artist_mbid and in_lidarr(artist_mbid):
+                return False, "already_in_lidarr_mbid"
+            if name_in_lidarr(artist_name.lower()):
+                return False, "already_in_lidarr_name"
+            if artist_mbid and is_excluded(artist_mbid):
+                return False, "in_exclusions"
+            return True, "valid"
+
+        return _filter
+
     def apply_random_sampling(
         self, candidates: list[dict[str, Any]], limit: int, command_name: str
     ) -> tuple[list[dict[str, Any]], int, bool]:
@@ -146,6 +176,8 @@ class DiscoveryUtils:
             f"Processing {len(unique_artists)} unique artist names through MusicBrainz..."
         )
 
+        candidate_filter = self.build_filter(existing_mbids, existing_names, excluded_mbids)
+
         for artist_name, artist_data in unique_artists.items():
             try:
                 # Fuzzy search in MusicBrainz
@@ -158,9 +190,7 @@ class DiscoveryUtils:
                     mb_name = mb_result["name"]
 
                     # Apply the same filtering logic
-                    should_include, reason = self.filter_artist_candidate(
-                        mbid, mb_name, existing_mbids, existing_names, excluded_mbids
-                    )
+                    should_include, reason = candidate_filter(mbid, mb_name)
 
                     if not should_include:
                         if reason == "in_exclusions":
@@ -4,18 +4,71 @@ Library Cache Manager
 Centralized music library caching for dramatic playlist sync performance improvements
 """
 
-import json
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any
 
+import orjson
 import psutil
-from sqlalchemy import func
+from sqlalchemy import func, insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from database.cache_models import LibraryCache
+from database.cache_models import LibraryCache, LibraryCacheTrack
 from database.database import get_database_manager
 
 from .logger import get_logger
 
+# Clients whose caches store tracks as a dict keyed by track key ("tracks_by_key"),
+# mapped to the track fields that hold that key in the legacy list format
+KEYED_TRACK_FIELDS = {"plex": ("key", "ratingKey")}
+
+
+def migrate_track_list(
+    client_type: str, cache_data: dict[str, Any] | None
+) -> dict[str, Any] | None:
+    """Convert a legacy list-format cache ("tracks") to the keyed layout, in place"""
+    key_fields = KEYED_TRACK_FIELDS.get(client_type)
+    if not key_fields or not isinstance(cache_data, dict) or "tracks_by_key" in cache_data:
+        return cache_data
+
+    tracks_by_key = {}
+    for track in cache_data.pop("tracks", None) or []:
+        track_key = next((track[f] for f in key_fields if track.get(f)), None)
+        if track_key:
+            tracks_by_key[track_key] = track
+    cache_data["tracks_by_key"] = tracks_by_key
+    return cache_data
+
+
+class LibraryCacheBulkUpdate:
+    """
+    Staged writes for one library cache, flushed once when LibraryCacheManager.bulk_update exits.
+    Either replace() the whole cache, or upsert_many() tracks plus set_meta() the cache metadata.
+    """
+
+    def __init__(self, client_type: str):
+        self.client_type = client_type
+        self.tracks: dict[str, dict[str, Any]] = {}
+        self.meta: dict[str, Any] | None = None
+        self.full_cache: dict[str, Any] | None = None
+
+    def upsert_many(self, tracks: Iterable[dict[str, Any]]) -> None:
+        """Stage new or changed tracks (last write per track key wins)"""
+        key_fields = KEYED_TRACK_FIELDS.get(self.client_type, ("key",))
+        for track in tracks:
+            track_key = next((track[f] for f in key_fields if track.get(f)), None)
+            if track_key:
+                self.tracks[track_key] = track
+
+    def set_meta(self, cache_data: dict[str, Any]) -> None:
+        """Stage the cache metadata written alongside the staged tracks"""
+        self.meta = cache_data
+
+    def replace(self, cache_data: dict[str, Any]) -> None:
+        """Stage a full cache replacement (e.g. after a full rebuild)"""
+        self.full_cache = cache_data
+
 
 class LibraryCacheManager:
     """
@@ -41,6 +94,11 @@ class LibraryCacheManager:
         self.memory_cache = {}
         self.cache_active = False
 
+        # Processed caches from earlier SQLite loads during a batch, keyed by
+        # cache_key -> (expires_at, data). Every store moves expires_at, so a matching
+        # stamp means the rows are unchanged. Released with the memory cache.
+        self._loaded_caches: dict[str, tuple[datetime, dict[str, Any]]] = {}
+
         # Global performance tracking (for overall system monitoring)
         self.global_stats = {
             "total_cache_hits": 0,
@@ -133,8 +191,6 @@ class LibraryCacheManager:
             self.global_stats["total_cache_hits"] += 1
             self.logger.debug(f"SQLite cache hit: {cache_key}")
 
-            # Load into memory cache if active
-            self._load_to_memory_cache(cache_key, cached_data)
             return cached_data
 
         # Build new cache
@@ -149,7 +205,8 @@ class LibraryCacheManager:
         Uses resolved library (PLEX_LIBRARY_NAME / Music / first) when client is registered.
 
         Returns:
-            Dictionary with cache data or None if not found
+            Dictionary with cache data or None if not found. The dictionary is freshly loaded
+            and owned by the caller, so it may be updated in place.
         """
         try:
             cache_key_filter = None
@@ -171,7 +228,7 @@ class LibraryCacheManager:
                 cache_entry = query.order_by(LibraryCache.created_at.desc()).first()
 
                 if cache_entry:
-                    return cache_entry.cache_data
+                    return self._load_tracks(session, client_type, cache_entry)
 
                 return None
 
@@ -192,7 +249,10 @@ class LibraryCacheManager:
                     text("""
                         SELECT track_count, created_at,
                                json_extract(cache_data, '$.built_at') as built_at,
-                               length(cache_data) as data_bytes
+                               length(cache_data) + COALESCE((
+                                   SELECT SUM(length(t.data)) FROM library_cache_track t
+                                   WHERE t.cache_key = library_cache.cache_key
+                               ), 0) as data_bytes
                         FROM library_cache
                         WHERE client_type = :client_type AND expires_at > datetime('now')
                         ORDER BY created_at DESC LIMIT 1
@@ -217,19 +277,38 @@ class LibraryCacheManager:
         """Retrieve cache data from SQLite if not expired"""
         try:
             with self.db_manager.get_cache_session_context() as session:
-                cache_entry = (
-                    session.query(LibraryCache)
+                # Cheap stamp check first; the JSON meta and track rows load only when it moved
+                stamp = (
+                    session.query(LibraryCache.expires_at)
                     .filter(
                         LibraryCache.cache_key == cache_key,
                         LibraryCache.expires_at > datetime.utcnow(),
                     )
-                    .first()
+                    .scalar()
+                )
+                if stamp is None:
+                    self._loaded_caches.pop(cache_key, None)
+                    return None
+
+                loaded = self._loaded_caches.get(cache_key)
+                if loaded and loaded[0] == stamp:
+                    self.logger.debug(f"Reusing loaded library cache: {cache_key}")
+                    return loaded[1]
+
+                cache_entry = (
+                    session.query(LibraryCache).filter(LibraryCache.cache_key == cache_key).first()
                 )
 
                 if cache_entry:
                     # Process through client for any client-specific transformations
                     client = self.registered_clients[client_type]
-                    processed_data = client.process_cached_library(cache_entry.cache_data)
+                    processed_data = client.process_cached_library(
+                        self._load_tracks(session, client_type, cache_entry)
+                    )
+                    # Load into memory cache if active
+                    self._load_to_memory_cache(
+                        cache_key, processed_data, expires_at=cache_entry.expires_at
+                    )
 
                     self.logger.debug(
                         f"Retrieved {cache_entry.track_count:,} tracks from SQLite cache (created: {cache_entry.created_at})"
@@ -242,6 +321,20 @@ class LibraryCacheManager:
             self.logger.warning(f"Library cache retrieval error: {e}")
             return None
 
+    def _load_tracks(self, session, client_type: str, cache_entry: LibraryCache) -> dict[str, Any]:
+        """Attach per-row tracks to a keyed cache entry (legacy list caches are migrated)"""
+        cache_data = cache_entry.cache_data
+        if client_type not in KEYED_TRACK_FIELDS or "tracks_by_key" in cache_data:
+            return migrate_track_list(client_type, cache_data)
+
+        rows = session.query(LibraryCacheTrack.track_key, LibraryCacheTrack.data).filter(
+            LibraryCacheTrack.cache_key == cache_entry.cache_key
+        )
+        tracks_by_key = dict(rows.all())
+        if not tracks_by_key and "tracks" in cache_data:
+            return migrate_track_list(client_type, cache_data)
+        return {**cache_data, "tracks_by_key": tracks_by_key}
+
     def _build_and_store_cache(
         self, client, client_type: str, library_key: str, cache_key: str
     ) -> dict[str, Any] | None:
@@ -256,7 +349,7 @@ class LibraryCacheManager:
                 return None
 
             # Count tracks
-            track_count = len(cache_data.get("tracks", {}))
+            track_count = len(cache_data.get("tracks_by_key") or cache_data.get("tracks", []))
             ttl_days = client.get_cache_ttl()
 
             # Store in SQLite
@@ -291,6 +384,14 @@ class LibraryCacheManager:
             expires_at = datetime.utcnow() + timedelta(days=ttl_days)
             schema_version = cache_data.get("schema_version", "unknown")
 
+            # Keyed caches keep their tracks in library_cache_track rows, not in the JSON blob
+            tracks_by_key = None
+            if client_type in KEYED_TRACK_FIELDS and "tracks_by_key" in cache_data:
+                tracks_by_key = cache_data["tracks_by_key"]
+                cache_data = {k: v for k, v in cache_data.items() if k != "tracks_by_key"}
+
+            self._loaded_caches.pop(cache_key, None)
+
             # Handle None library_key - use a default value
             stored_library_key = library_key if library_key is not None else "default"
 
@@ -321,14 +422,30 @@ class LibraryCacheManager:
                     )
                     session.add(cache_entry)
 
+                if tracks_by_key is not None:
+                    session.flush()
+                    session.query(LibraryCacheTrack).filter(
+                        LibraryCacheTrack.cache_key == cache_key
+                    ).delete()
+                    if tracks_by_key:
+                        session.execute(
+                            insert(LibraryCacheTrack),
+                            [
+                                {"cache_key": cache_key, "track_key": key, "data": track}
+                                for key, track in tracks_by_key.items()
+                            ],
+                        )
+
                 session.commit()
                 self.logger.debug(f"Stored library cache: {cache_key} ({track_count:,} tracks)")
 
         except Exception as e:
             self.logger.warning(f"Library cache storage error: {e}")
 
-    def _load_to_memory_cache(self, cache_key: str, cache_data: dict[str, Any]) -> None:
-        """Load cache data into memory if within limits"""
+    def _load_to_memory_cache(
+        self, cache_key: str, cache_data: dict[str, Any], expires_at: datetime | None = None
+    ) -> None:
+        """Load cache data into memory if within limits, remembering its SQLite stamp if given"""
         if not self.cache_active:
             return
 
@@ -342,6 +459,8 @@ class LibraryCacheManager:
             return
 
         self.memory_cache[cache_key] = cache_data
+        if expires_at is not None:
+            self._loaded_caches[cache_key] = (expires_at, cache_data)
         self.global_stats["memory_usage_mb"] = current_memory + estimated_size
         self.logger.debug(f"Loaded to memory cache: {cache_key} (~{estimated_size:.1f}MB)")
 
@@ -349,7 +468,7 @@ class LibraryCacheManager:
         """Estimate memory usage of cache data in MB"""
         try:
             # Rough estimation: JSON size * 1.5 for Python object overhead
-            json_size = len(json.dumps(cache_data))
+            json_size = len(orjson.dumps(cache_data, option=orjson.OPT_NON_STR_KEYS))
             return (json_size * 1.5) / 1024 / 1024
         except Exception:
             return 10.0  # Conservative estimate
@@ -365,6 +484,7 @@ class LibraryCacheManager:
 
     def clear_memory_cache(self) -> None:
         """Clear memory cache and disable batch mode"""
+        self._loaded_caches.clear()
         if not self.cache_active:
             return
 
@@ -435,6 +555,7 @@ class LibraryCacheManager:
 
             # Remove from SQLite
             self._invalidate_sqlite_cache(cache_key)
+            self._loaded_caches.pop(cache_key, None)
 
             # Remove from memory cache if present
             if cache_key in self.memory_cache:
@@ -542,6 +663,107 @@ class LibraryCacheManager:
             self.logger.error(f"Failed to store library cache for {client_type}: {e}")
             raise
 
+    def upsert_library_tracks(
+        self,
+        client_type: str,
+        cache_data: dict[str, Any],
+        changed_tracks: dict[str, dict[str, Any]],
+        library_key: str = None,
+    ) -> None:
+        """
+        Store an incremental update for a keyed cache: only changed track rows are written,
+        plus the cache metadata. Falls back to a full store when no rows exist yet.
+        """
+        if client_type not in KEYED_TRACK_FIELDS:
+            self.set_library_cache(client_type, cache_data, library_key)
+            return
+
+        try:
+            if client_type not in self.registered_clients:
+                self.logger.warning(f"Cannot store cache for unregistered client: {client_type}")
+                return
+
+            client = self.registered_clients[client_type]
+            cache_key = client.get_cache_key(library_key)
+            track_count = cache_data.get("total_tracks", 0)
+
+            with self.db_manager.get_cache_session_context() as session:
+                cache_entry = (
+                    session.query(LibraryCache).filter(LibraryCache.cache_key == cache_key).first()
+                )
+                has_rows = (
+                    session.query(LibraryCacheTrack.track_key)
+                    .filter(LibraryCacheTrack.cache_key == cache_key)
+                    .first()
+                    is not None
+                )
+                stored = cache_entry is not None and has_rows
+                if stored:
+                    self._apply_incremental_rows(
+                        session, client, cache_entry, cache_data, changed_tracks
+                    )
+
+            if not stored:
+                self.set_library_cache(client_type, cache_data, library_key)
+                return
+
+            self._load_to_memory_cache(cache_key, cache_data)
+            self.logger.info(
+                f"Stored library cache for {client_type}: {track_count:,} tracks "
+                f"({len(changed_tracks):,} rows written)"
+            )
+
+        except Exception as e:
+            self.logger.error(f"Failed to store library cache for {client_type}: {e}")
+            raise
+
+    @contextmanager
+    def bulk_update(
+        self, client_type: str, library_key: str = None
+    ) -> Iterator[LibraryCacheBulkUpdate]:
+        """
+        Stage library cache writes and flush them in one store on exit.
+        Nothing is written if the block raises, so a failed build never leaves partial state.
+        """
+        update = LibraryCacheBulkUpdate(client_type)
+        yield update
+
+        if update.full_cache is not None:
+            self.set_library_cache(client_type, update.full_cache, library_key)
+        elif update.meta is not None:
+            self.upsert_library_tracks(client_type, update.meta, update.tracks, library_key)
+
+    def _apply_incremental_rows(
+        self,
+        session,
+        client,
+        cache_entry: LibraryCache,
+        cache_data: dict[str, Any],
+        changed_tracks: dict[str, dict[str, Any]],
+    ) -> None:
+        """Update cache metadata and upsert changed track rows in one transaction"""
+        cache_key = cache_entry.cache_key
+        self._loaded_caches.pop(cache_key, None)
+        cache_entry.cache_data = {k: v for k, v in cache_data.items() if k != "tracks_by_key"}
+        cache_entry.track_count = cache_data.get("total_tracks", 0)
+        cache_entry.expires_at = datetime.utcnow() + timedelta(days=client.get_cache_ttl())
+
+        if changed_tracks:
+            stmt = sqlite_insert(LibraryCacheTrack)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["cache_key", "track_key"],
+                set_={"data": stmt.excluded.data},
+            )
+            session.execute(
+                stmt,
+                [
+                    {"cache_key": cache_key, "track_key": key, "data": track}
+                    for key, track in changed_tracks.items()
+                ],
+            )
+
+        session.commit()
+
     def clear_all_cache(self, client_type: str = None) -> int:
         """Clear all cache entries, optionally filtered by client type"""
         try: